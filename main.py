@@ -15,58 +15,25 @@ Usage:
     python main.py --config                 # Show current config
     python main.py --config-set key=value   # Update a config value
 """
-import argparse
 import sys
 
-from rich.panel import Panel
-
 from scout import __version__
-from scout.benchmark import benchmark_pulled_models
-from scout.config import (
-    DEFAULT_CONFIG,
-    create_profile,
-    delete_profile,
-    get_active_profile,
-    get_profile_overrides,
-    list_profiles,
-    load_config,
-    print_config,
-    save_config,
-    set_profile_value,
-    switch_profile,
-)
-from scout.display import (
-    console,
-    print_banner,
-    print_benchmark,
-    print_error,
-    print_footer,
-    print_hardware_summary,
-    print_info,
-    print_legend,
-    print_model_comparison,
-    print_model_detail,
-    print_ollama_not_installed,
-    print_recommendations_flat,
-    print_recommendations_grouped,
-    print_success,
-    prompt_export,
-    prompt_pull,
-    spinner,
-)
-from scout.exporter import export_markdown
-from scout.hardware import detect_hardware
-from scout.ollama_api import (
-    check_ollama_installed,
-    fetch_ollama_models,
-    get_fallback_models,
-    get_pulled_models,
-    pull_model,
-)
-from scout.recommender import _score_variant, get_recommendations, group_by_use_case
-
-
-def parse_args():
+
+
+def _bootstrap_profile(argv=None):
+    """Pick out --profile without parsing anything else, so config can load first."""
+    import argparse
+
+    bootstrap = argparse.ArgumentParser(add_help=False)
+    bootstrap.add_argument("--profile", type=str, default=None)
+    known, _ = bootstrap.parse_known_args(argv)
+    return known.profile
+
+
+def build_parser(cfg):
+    """Build the full CLI parser with defaults taken from the merged config."""
+    import argparse
+
     parser = argparse.ArgumentParser(
         prog="ollama-scout",
         description="Scan your hardware and find compatible Ollama LLMs.",
@@ -89,8 +56,8 @@ def parse_args():
     parser.add_argument(
         "--use-case",
         choices=["all", "coding", "chat", "reasoning"],
-        default=None,
-        help="Filter recommendations by use case (default: all)",
+        default=cfg.get("default_use_case", "all"),
+        help="Filter recommendations by use case (default: %(default)s)",
     )
     parser.add_argument(
         "--flat",
@@ -99,8 +66,8 @@ def parse_args():
     )
     parser.add_argument(
         "--export",
-        action="store_true",
-        default=None,
+        action=argparse.BooleanOptionalAction,
+        default=cfg.get("auto_export", False),
         help="Automatically export results to Markdown without prompting",
     )
     parser.add_argument(
@@ -119,9 +86,9 @@ def parse_args():
     parser.add_argument(
         "--top",
         type=int,
-        default=None,
+        default=cfg.get("default_top_n", 15),
         metavar="N",
-        help="Number of top recommendations to show (default: 15)",
+        help="Number of top recommendations to show (default: %(default)s)",
     )
     parser.add_argument(
         "--no-pull-prompt",
@@ -130,14 +97,14 @@ def parse_args():
     )
     parser.add_argument(
         "--offline",
-        action="store_true",
-        default=None,
+        action=argparse.BooleanOptionalAction,
+        default=cfg.get("offline_mode", False),
         help="Skip live API fetch and use built-in fallback model list",
     )
     parser.add_argument(
         "--benchmark",
-        action="store_true",
-        default=None,
+        action=argparse.BooleanOptionalAction,
+        default=cfg.get("show_benchmark", False),
         help="Show estimated inference speed for top models",
     )
     parser.add_argument(
@@ -152,6 +119,11 @@ def parse_args():
         action="store_true",
         help="Force-refresh the model list from Ollama API and update local cache",
     )
+    parser.add_argument(
+        "--refresh-hw",
+        action="store_true",
+        help="Re-detect hardware instead of using the cached profile",
+    )
     parser.add_argument(
         "--compare",
         nargs=2,
@@ -203,203 +175,225 @@ def parse_args():
         metavar="NAME",
         help="Switch the active config profile",
     )
-    return parser.parse_args()
-
-
-def _apply_config(args):
-    """Merge config file defaults with CLI args (CLI wins)."""
-    cfg = load_config(profile=getattr(args, "profile", None))
-
-    if args.use_case is None:
-        args.use_case = cfg.get("default_use_case", "all")
-    if args.top is None:
-        args.top = cfg.get("default_top_n", 15)
-    if args.export is None:
-        args.export = cfg.get("auto_export", False)
-    if args.offline is None:
-        args.offline = cfg.get("offline_mode", False)
-    if args.benchmark is None:
-        args.benchmark = cfg.get("show_benchmark", False)
-
-    return cfg
-
-
-def main():
-    args = parse_args()
-
-    # --- Interactive mode (no arguments or -i/--interactive) ---
-    if len(sys.argv) == 1 or args.interactive:
-        from scout.interactive import InteractiveSession
-        InteractiveSession().run()
-        return
-
-    # --- Doctor command ---
-    if args.doctor:
-        from scout.doctor import run_doctor
-        run_doctor()
-        return
-
-    # --- Config commands ---
-    if args.config:
-        print_config()
-        return
-
-    if args.config_set:
-        if "=" not in args.config_set:
-            print_error("Format: --config-set key=value")
-            sys.exit(1)
-        key, value = args.config_set.split("=", 1)
-        key = key.strip()
-        if key not in DEFAULT_CONFIG:
-            valid = ", ".join(DEFAULT_CONFIG.keys())
-            print_error(f"Unknown config key: {key}. Valid keys: {valid}")
+    return parser
+
+
+def parse_args(argv=None):
+    """Parse CLI args. Returns (args, cfg); CLI flags win over config values."""
+    from scout.config import load_config
+
+    cfg = load_config(profile=_bootstrap_profile(argv))
+    return build_parser(cfg).parse_args(argv), cfg
+
+
+def _cmd_interactive(args, cfg):
+    from scout.interactive import InteractiveSession
+    InteractiveSession(
+        refresh_hw=args.refresh_hw,
+        hw_cache_ttl_hours=cfg.get("hw_cache_ttl_hours", 24),
+        models_cache_ttl_hours=cfg.get("models_cache_ttl_hours", 24),
+        offline=args.offline,
+    ).run()
+
+
+def _cmd_doctor(args, cfg):
+    from scout.doctor import run_doctor
+    run_doctor()
+
+
+def _cmd_config(args, cfg):
+    from scout.config import print_config
+    print_config()
+
+
+def _cmd_config_set(args, cfg):
+    from scout.config import DEFAULT_CONFIG, set_config_value, set_profile_value
+    from scout.display import print_error, print_success
+    if "=" not in args.config_set:
+        print_error("Format: --config-set key=value")
+        sys.exit(1)
+    key, value = args.config_set.split("=", 1)
+    key = key.strip()
+    if key not in DEFAULT_CONFIG:
+        valid = ", ".join(DEFAULT_CONFIG.keys())
+        print_error(f"Unknown config key: {key}. Valid keys: {valid}")
+        sys.exit(1)
+    # Type coerce
+    expected = type(DEFAULT_CONFIG[key])
+    if expected is bool:
+        value = value.strip().lower() in ("true", "1", "yes")
+    elif expected is int:
+        value = int(value.strip())
+    else:
+        value = value.strip()
+    if args.profile:
+        # Set value in a specific profile
+        if not set_profile_value(args.profile, key, value):
+            print_error(f"Profile '{args.profile}' not found.")
             sys.exit(1)
-        # Type coerce
-        expected = type(DEFAULT_CONFIG[key])
-        if expected is bool:
-            value = value.strip().lower() in ("true", "1", "yes")
-        elif expected is int:
-            value = int(value.strip())
-        else:
-            value = value.strip()
-        if args.profile:
-            # Set value in a specific profile
-            if not set_profile_value(args.profile, key, value):
-                print_error(f"Profile '{args.profile}' not found.")
-                sys.exit(1)
-            print_success(f"Profile [{args.profile}] updated: {key} = {value!r}")
-        else:
-            cfg = load_config()
-            cfg[key] = value
-            save_config(cfg)
-            print_success(f"Config updated: {key} = {value!r}")
-        return
+        print_success(f"Profile [{args.profile}] updated: {key} = {value!r}")
+    else:
+        set_config_value(key, value)
+        print_success(f"Config updated: {key} = {value!r}")
+
+
+def _cmd_profile_list(args, cfg):
+    from scout.config import get_all_profiles
+    from scout.display import print_profile_list
+    active, overrides = get_all_profiles()
+    print_profile_list(list(overrides), active, overrides)
+
+
+def _cmd_profile_create(args, cfg):
+    from scout.config import create_profile
+    from scout.display import print_error, print_success
+    name = args.profile_create.strip()
+    if not name or not name.replace("-", "").replace("_", "").isalnum():
+        print_error("Profile name must be alphanumeric (hyphens/underscores allowed).")
+        sys.exit(1)
+    if create_profile(name):
+        print_success(f"Profile '{name}' created.")
+    else:
+        print_error(f"Profile '{name}' already exists.")
+        sys.exit(1)
+
+
+def _cmd_profile_delete(args, cfg):
+    from scout.config import delete_profile
+    from scout.display import print_error, print_success
+    name = args.profile_delete.strip()
+    if delete_profile(name):
+        print_success(f"Profile '{name}' deleted.")
+    elif name == "default":
+        print_error("Cannot delete the 'default' profile.")
+        sys.exit(1)
+    else:
+        print_error(f"Profile '{name}' not found.")
+        sys.exit(1)
 
-    # --- Profile commands ---
-    if args.profile_list:
-        from rich import box
-        from rich.console import Console as _C
-        from rich.table import Table
-        _con = _C()
-        active = get_active_profile()
-        profiles = list_profiles()
-        table = Table(
-            title="[bold cyan]Config Profiles[/bold cyan]",
-            box=box.ROUNDED, border_style="cyan",
+
+def _cmd_profile_switch(args, cfg):
+    from scout.config import switch_profile
+    from scout.display import print_error, print_success
+    name = args.profile_switch.strip()
+    if switch_profile(name):
+        print_success(f"Active profile switched to '{name}'.")
+    else:
+        print_error(
+            f"Profile '{name}' not found. "
+            "Use --profile-list to see available profiles."
         )
-        table.add_column("Profile", style="bold white")
-        table.add_column("Active", justify="center")
-        table.add_column("Overrides", style="dim")
-        for name in profiles:
-            active_marker = "[bold green]✓[/bold green]" if name == active else ""
-            overrides = get_profile_overrides(name)
-            if overrides:
-                overrides_str = ", ".join(f"{k}={v!r}" for k, v in overrides.items())
-            else:
-                overrides_str = "[dim](none)[/dim]"
-            table.add_row(name, active_marker, overrides_str)
-        _con.print(table)
-        return
+        sys.exit(1)
 
-    if args.profile_create:
-        name = args.profile_create.strip()
-        if not name or not name.replace("-", "").replace("_", "").isalnum():
-            print_error("Profile name must be alphanumeric (hyphens/underscores allowed).")
-            sys.exit(1)
-        if create_profile(name):
-            print_success(f"Profile '{name}' created.")
-        else:
-            print_error(f"Profile '{name}' already exists.")
-            sys.exit(1)
-        return
 
-    if args.profile_delete:
-        name = args.profile_delete.strip()
-        if delete_profile(name):
-            print_success(f"Profile '{name}' deleted.")
-        elif name == "default":
-            print_error("Cannot delete the 'default' profile.")
-            sys.exit(1)
-        else:
-            print_error(f"Profile '{name}' not found.")
-            sys.exit(1)
-        return
+def _cmd_update_models(args, cfg):
+    from scout.display import print_banner, print_error, print_success, spinner
+    from scout.ollama_api import fetch_ollama_models
 
-    if args.profile_switch:
-        name = args.profile_switch.strip()
-        if switch_profile(name):
-            print_success(f"Active profile switched to '{name}'.")
-        else:
-            print_error(
-                f"Profile '{name}' not found. "
-                "Use --profile-list to see available profiles."
-            )
+    print_banner()
+    with spinner("Fetching latest models from Ollama API...") as p:
+        p.add_task("")
+        p.start()
+        try:
+            models = fetch_ollama_models(limit=100, force_refresh=True)
+        except ConnectionError as e:
+            p.stop()
+            print_error(str(e))
             sys.exit(1)
-        return
+        p.stop()
+    print_success(f"Model list updated. {len(models)} models cached.")
 
-    # --- Update models cache ---
-    if args.update_models:
-        print_banner()
-        with spinner("Fetching latest models from Ollama API...") as p:
-            p.add_task("")
-            p.start()
-            try:
-                models = fetch_ollama_models(limit=100, force_refresh=True)
-            except ConnectionError as e:
-                p.stop()
-                print_error(str(e))
-                sys.exit(1)
-            p.stop()
-        print_success(f"Model list updated. {len(models)} models cached.")
-        return
 
-    cfg = _apply_config(args)
+def _cmd_pull(args, cfg):
+    # pull_model reports a missing ollama binary itself, so no separate install check.
+    from scout.display import print_banner, print_error, print_info, print_success
+    from scout.ollama_api import pull_model
 
     print_banner()
+    print_info(f"Pulling model: [bold]{args.pull}[/bold]")
+    try:
+        pull_model(args.pull)
+        print_success(f"Successfully pulled {args.pull}")
+    except FileNotFoundError as e:
+        print_error(str(e))
+        sys.exit(1)
+    except Exception as e:
+        print_error(f"Pull failed: {e}")
+        sys.exit(1)
+
+
+def _scan(args, cfg):
+    """Print the banner, then check Ollama, detect hardware, and load models.
+
+    The four probes run concurrently, under one spinner if they are not done
+    almost at once (warm caches skip it). Returns
+    (ollama_installed, hw, models, pulled).
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    from scout.display import (
+        batched_status,
+        print_banner,
+        print_error,
+        print_hardware_summary,
+        print_info,
+        print_ollama_not_installed,
+        wait_with_spinner,
+    )
+    from scout.hardware import cached_detect_hardware
+    from scout.ollama_api import (
+        check_ollama_installed,
+        fetch_ollama_models,
+        get_fallback_models,
+        get_pulled_models,
+    )
 
-    # --- Ollama installation check ---
-    ollama_installed, ollama_version = check_ollama_installed()
-    if ollama_installed:
-        print_info(f"Ollama detected: [dim]{ollama_version}[/dim]")
-    else:
-        print_ollama_not_installed()
+    print_banner()
 
-    # --- Direct pull mode ---
-    if args.pull:
-        print_info(f"Pulling model: [bold]{args.pull}[/bold]")
-        try:
-            pull_model(args.pull)
-            print_success(f"Successfully pulled {args.pull}")
-        except FileNotFoundError as e:
-            print_error(str(e))
-            sys.exit(1)
-        except Exception as e:
-            print_error(f"Pull failed: {e}")
-            sys.exit(1)
-        return
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        ollama_future = pool.submit(check_ollama_installed)
+        hw_future = pool.submit(
+            cached_detect_hardware,
+            force=args.refresh_hw,
+            max_age_hours=cfg.get("hw_cache_ttl_hours", 24),
+        )
+        models_future = None
+        if not args.offline:
+            models_future = pool.submit(
+                fetch_ollama_models,
+                limit=100,
+                max_age_hours=cfg.get("models_cache_ttl_hours", 24),
+            )
+        pulled_future = pool.submit(get_pulled_models)
+        futures = [ollama_future, hw_future, pulled_future]
+        if models_future is not None:
+            futures.append(models_future)
+        wait_with_spinner("Scanning system and fetching models...", futures)
+
+    with batched_status():
+        # --- Ollama installation check ---
+        ollama_installed, ollama_version = ollama_future.result()
+        if ollama_installed:
+            print_info(f"Ollama detected: [dim]{ollama_version}[/dim]")
+        else:
+            print_ollama_not_installed()
 
-    # --- Hardware scan ---
-    with spinner("Detecting GPU, CPU, and RAM configuration...") as p:
-        p.add_task("")
-        p.start()
+        # --- Hardware scan ---
         try:
-            hw = detect_hardware()
+            hw = hw_future.result()
         except Exception as e:
             print_error(f"Hardware detection failed: {e}")
             sys.exit(1)
-        p.stop()
 
-    print_hardware_summary(hw)
+        print_hardware_summary(hw)
 
-    # --- Fetch models ---
-    if args.offline:
-        print_info("Offline mode — using built-in fallback model list.")
-        models = get_fallback_models()
-    else:
-        with spinner("Fetching latest models from Ollama library API...") as p:
-            p.start()
+        # --- Fetch models ---
+        if models_future is None:
+            print_info("Offline mode — using built-in fallback model list.")
+            models = get_fallback_models()
+        else:
             try:
-                models = fetch_ollama_models(limit=100)
+                models = models_future.result()
             except ConnectionError as e:
                 print_error(str(e))
                 print_info("Falling back to built-in model list.")
@@ -408,90 +402,127 @@ def main():
                 print_error(f"Unexpected error fetching models: {e}")
                 print_info("Falling back to built-in model list.")
                 models = get_fallback_models()
-            p.stop()
 
-    print_info(f"Loaded [bold]{len(models)}[/bold] models for analysis.")
+        print_info(f"Loaded [bold]{len(models)}[/bold] models for analysis.")
 
-    # --- Get pulled models ---
-    pulled = get_pulled_models()
-    if pulled:
-        names = ", ".join(pulled[:5])
-        suffix = "..." if len(pulled) > 5 else ""
-        print_info(
-            f"Detected [green]{len(pulled)}[/green] "
-            f"already-pulled model(s): {names}{suffix}"
-        )
+        # --- Get pulled models ---
+        pulled = pulled_future.result()
+        if pulled:
+            names = ", ".join(pulled[:5])
+            suffix = "..." if len(pulled) > 5 else ""
+            print_info(
+                f"Detected [green]{len(pulled)}[/green] "
+                f"already-pulled model(s): {names}{suffix}"
+            )
 
-    # --- Single model detail view ---
-    if args.model:
-        target = args.model.lower()
-        matched = [m for m in models if m.name.lower() == target]
-        if not matched:
-            # Try prefix match
-            matched = [m for m in models if m.name.lower().startswith(target)]
-        if not matched:
-            print_error(f"Model '{args.model}' not found in loaded models.")
-            print_info("Available models: " + ", ".join(sorted(set(m.name for m in models))))
-            sys.exit(1)
+    return ollama_installed, hw, models, pulled
 
-        model = matched[0]
-        variants_with_scores = []
-        for variant in model.tags:
-            score, fit_label, run_mode, note = _score_variant(variant, hw)
-            variants_with_scores.append((variant, score, fit_label, run_mode, note))
 
-        console.print()
-        print_model_detail(model, variants_with_scores, pulled, hw)
-        print_footer()
-        return
+def _cmd_model(args, cfg):
+    from scout.display import console, print_error, print_footer, print_info, print_model_detail
+    from scout.recommender import find_model, index_models, score_variants
 
-    # --- Comparison mode ---
-    if args.compare:
-        def _find_model(name):
-            target = name.lower()
-            matched = [m for m in models if m.name.lower() == target]
-            if not matched:
-                matched = [m for m in models if m.name.lower().startswith(target)]
-            return matched[0] if matched else None
-
-        def _model_detail(name):
-            model = _find_model(name)
-            if model is None:
-                return None
-            best_score, best_variant, best_fit, best_mode = -1, None, None, None
-            for variant in model.tags:
-                score, fit_label, run_mode, note = _score_variant(variant, hw)
-                if score > best_score:
-                    best_score = score
-                    best_variant = variant
-                    best_fit = fit_label
-                    best_mode = run_mode
-            return {
-                "name": model.name,
-                "description": model.description,
-                "tag": best_variant.tag if best_variant else None,
-                "size_gb": best_variant.size_gb if best_variant else None,
-                "param_size": best_variant.param_size if best_variant else None,
-                "quantization": best_variant.quantization if best_variant else None,
-                "fit_label": best_fit,
-                "run_mode": best_mode,
-                "score": best_score,
-                "est_tps": None,
-                "pulled": model.name in pulled,
-            }
-
-        d1 = _model_detail(args.compare[0])
-        d2 = _model_detail(args.compare[1])
-        if d1 is None:
-            print_error(f"Model '{args.compare[0]}' not found.")
-        if d2 is None:
-            print_error(f"Model '{args.compare[1]}' not found.")
-        console.print()
-        print_model_comparison(d1, d2)
-        print_footer()
-        return
+    _, hw, models, pulled = _scan(args, cfg)
+    name_index, sorted_names = index_models(models)
+
+    model = find_model(name_index, sorted_names, args.model)
+    if model is None:
+        print_error(f"Model '{args.model}' not found in loaded models.")
+        print_info("Available models: " + ", ".join(sorted({m.name for m in models})))
+        sys.exit(1)
+
+    variants_with_scores = [
+        (variant, *scored)
+        for variant, scored in zip(model.tags, score_variants(model.tags, hw))
+    ]
+
+    console.print()
+    print_model_detail(model, variants_with_scores, set(pulled), hw)
+    print_footer()
+
+
+def _cmd_compare(args, cfg):
+    from scout.display import (
+        console,
+        print_error,
+        print_footer,
+        print_info,
+        print_model_comparison,
+    )
+    from scout.recommender import best_variant, find_model, index_models
+
+    _, hw, models, pulled = _scan(args, cfg)
+    name_index, sorted_names = index_models(models)
+    pulled_set = set(pulled)
+
+    def _model_detail(name):
+        model = find_model(name_index, sorted_names, name)
+        if model is None:
+            return None
+        best_score, variant, best_fit, best_mode = best_variant(model.tags, hw)
+        return {
+            "name": model.name,
+            "description": model.description,
+            "tag": variant.tag if variant else None,
+            "size_gb": variant.size_gb if variant else None,
+            "param_size": variant.param_size if variant else None,
+            "quantization": variant.quantization if variant else None,
+            "fit_label": best_fit,
+            "run_mode": best_mode,
+            "score": best_score,
+            "est_tps": None,
+            "pulled": model.name in pulled_set,
+        }
+
+    d1 = _model_detail(args.compare[0])
+    d2 = _model_detail(args.compare[1])
+    if d1 is None:
+        print_error(f"Model '{args.compare[0]}' not found.")
+    if d2 is None:
+        print_error(f"Model '{args.compare[1]}' not found.")
+    if d1 is None or d2 is None:
+        print_info("Available models: " + ", ".join(sorted({m.name for m in models})))
+    console.print()
+    print_model_comparison(d1, d2)
+    print_footer()
+
+
+def _export_path(args, cfg):
+    """Where to write the report: --output, else a new file in export_dir, else None."""
+    if args.output:
+        return args.output
+    export_dir = cfg.get("export_dir", "")
+    if not export_dir:
+        return None
+    from pathlib import Path
+
+    from scout.exporter import default_filename
+
+    report_dir = Path(export_dir).expanduser()
+    if not report_dir.is_dir():  # one stat instead of mkdir + EEXIST on the usual path
+        report_dir.mkdir(parents=True, exist_ok=True)
+    return report_dir / default_filename()
+
+
+def _cmd_recommend(args, cfg):
+    from scout.display import (
+        console,
+        print_error,
+        print_footer,
+        print_info,
+        print_legend,
+        print_recommendations_flat,
+        print_recommendations_grouped,
+        print_success,
+        prompt_export,
+        prompt_pull,
+        spinner,
+    )
+    from scout.ollama_api import pull_model
+    from scout.recommender import get_recommendations, group_by_use_case
+
+    ollama_installed, hw, models, pulled = _scan(args, cfg)
 
-    # --- Recommend ---
     recs = get_recommendations(
         models=models,
         hw=hw,
@@ -507,6 +538,7 @@ def main():
     console.print()
 
     # --- Display ---
+    grouped = None
     if args.flat or args.use_case != "all":
         print_recommendations_flat(recs)
     else:
@@ -517,6 +549,11 @@ def main():
 
     # --- Benchmark ---
     if args.benchmark:
+        from rich.panel import Panel
+
+        from scout.benchmark import benchmark_pulled_models
+        from scout.display import print_benchmark
+
         if not pulled or not ollama_installed:
             console.print(Panel(
                 "No models are currently pulled.\n"
@@ -530,7 +567,7 @@ def main():
             with spinner("Running real benchmarks on pulled models...") as p:
                 p.add_task("")
                 p.start()
-                estimates = benchmark_pulled_models(pulled, hw)
+                estimates = benchmark_pulled_models(pulled, hw, pulled_base=frozenset(pulled))
                 p.stop()
             if estimates:
                 print_benchmark(estimates)
@@ -538,23 +575,18 @@ def main():
                 print_info("No benchmark results available.")
 
     # --- Export ---
-    export_dir = cfg.get("export_dir", "")
-    grouped_for_export = group_by_use_case(recs)
     should_export = args.export or args.output
 
     if not should_export:
         should_export = prompt_export()
 
     if should_export:
-        output_path = args.output
-        if not output_path and export_dir:
-            import os
-            export_dir = os.path.expanduser(export_dir)
-            os.makedirs(export_dir, exist_ok=True)
-            output_path = None  # let exporter generate filename
-            # We'll pass the dir to exporter if set
+        from scout.exporter import export_markdown
+
+        if grouped is None:
+            grouped = group_by_use_case(recs)
         try:
-            path = export_markdown(hw, grouped_for_export, output_path=output_path)
+            path = export_markdown(hw, grouped, output_path=_export_path(args, cfg))
             print_success(f"Report saved to: [bold]{path}[/bold]")
         except Exception as e:
             print_error(f"Export failed: {e}")
@@ -575,5 +607,45 @@ def main():
     print_footer()
 
 
+# Keyed by the argparse dest of the flag that selects each command; the first
+# set flag in this order wins. Anything else falls through to "recommend".
+_COMMANDS = {
+    "interactive": _cmd_interactive,
+    "doctor": _cmd_doctor,
+    "config": _cmd_config,
+    "config_set": _cmd_config_set,
+    "profile_list": _cmd_profile_list,
+    "profile_create": _cmd_profile_create,
+    "profile_delete": _cmd_profile_delete,
+    "profile_switch": _cmd_profile_switch,
+    "update_models": _cmd_update_models,
+    "pull": _cmd_pull,
+    "model": _cmd_model,
+    "compare": _cmd_compare,
+    "recommend": _cmd_recommend,
+}
+
+
+def _command_name(args, argv=None):
+    """Pick the command to run from the parsed flags."""
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv:
+        return "interactive"
+    return next((name for name in _COMMANDS if getattr(args, name, None)), "recommend")
+
+
+def main():
+    # Answer a bare --version or --config before argparse is built; print_config
+    # reads the config itself, so parse_args' load_config would be wasted.
+    if sys.argv[1:] == ["--version"]:
+        print(f"ollama-scout {__version__}")
+        return
+    if sys.argv[1:] == ["--config"]:
+        _cmd_config(None, None)
+        return
+    args, cfg = parse_args()
+    _COMMANDS[_command_name(args)](args, cfg)
+
+
 if __name__ == "__main__":
     main()
@@ -1,12 +1,31 @@
 """
-benchmark.py - Real benchmark timing via `ollama run`.
+benchmark.py - Real benchmark timing via the local Ollama server (or `ollama run`).
 """
+import json
+import re
 import shutil
 import subprocess
+import threading
 import time
+from bisect import bisect_right
 from dataclasses import dataclass
+from functools import lru_cache
 
 from .hardware import HardwareProfile
+from .ollama_api import get_pulled_models
+
+OLLAMA_GENERATE_URL = "http://localhost:11434/api/generate"
+BENCHMARK_NUM_PREDICT = 64
+# Greedy decoding with a fixed seed so repeated runs generate the same tokens
+BENCHMARK_OPTIONS = {"num_predict": BENCHMARK_NUM_PREDICT, "temperature": 0.0, "seed": 42}
+BENCHMARK_TIMEOUT = 60
+
+# Rating bands by tokens/sec: below 25 is Slow, 25 up to 60 Moderate, 60+ Fast
+_RATING_THRESHOLDS = (25.0, 60.0)
+_RATINGS = ("Slow", "Moderate", "Fast")
+
+# `ollama run --verbose` stats line for decode speed, e.g. "eval rate:  45.12 tokens/s"
+_EVAL_RATE_RE = re.compile(r"^eval rate:\s+([\d.]+)\s+tokens/s", re.MULTILINE)
 
 
 @dataclass
@@ -15,84 +34,214 @@ class BenchmarkEstimate:
     run_mode: str
     tokens_per_sec: float
     rating: str
+    ttft_s: float | None = None  # seconds to first token (includes model load)
+
 
+@lru_cache(maxsize=1)
+def _ollama_bin() -> str | None:
+    """Full path of the ollama binary, looked up on PATH once per process."""
+    return shutil.which("ollama")
 
-def benchmark_model(model_name: str, prompt: str = "Hello, how are you?") -> float | None:
-    """Run a real benchmark by invoking `ollama run` and measuring wall-clock time.
 
-    Returns estimated tokens_per_sec, or None if ollama is unavailable,
-    the model isn't pulled, or the run fails/times out.
+def _list_pulled_base_names() -> frozenset[str] | None:
+    """Base names (tag stripped) of the locally pulled models.
+
+    Goes through ollama_api.get_pulled_models(), so the server / `ollama list`
+    lookup and its short-lived cache (dropped after every pull) are shared
+    with the rest of the CLI. Returns None if ollama is missing.
     """
-    if not shutil.which("ollama"):
+    if _ollama_bin() is None:
         return None
+    return frozenset(get_pulled_models())
 
-    # Check if model is pulled
+
+def _benchmark_via_api(model_name: str, prompt: str) -> tuple[float, float | None] | None:
+    """Time a generation through the local Ollama HTTP API.
+
+    Uses the server-reported ``eval_count`` / ``eval_duration`` from the final
+    streamed chunk, so no token estimate is needed. Returns
+    (tokens_per_sec, seconds_to_first_token). Raises ConnectionError if the
+    server is not reachable; returns None for any other failure.
+    """
+    import requests
+
+    payload = {
+        "model": model_name,
+        "prompt": prompt,
+        "stream": True,
+        "keep_alive": "5m",
+        "options": BENCHMARK_OPTIONS,
+    }
     try:
-        result = subprocess.run(
-            ["ollama", "list"],
-            capture_output=True, text=True, timeout=10,
-        )
-        if result.returncode != 0:
-            return None
-        pulled_names = []
-        for line in result.stdout.strip().splitlines()[1:]:  # skip header
-            parts = line.split()
-            if parts:
-                pulled_names.append(parts[0])
-        base_name = model_name.split(":")[0]
-        if not any(base_name == p.split(":")[0] for p in pulled_names):
-            return None
-    except (subprocess.TimeoutExpired, OSError):
+        start = time.monotonic()
+        first_at = None
+        with requests.post(
+            OLLAMA_GENERATE_URL, json=payload, stream=True, timeout=BENCHMARK_TIMEOUT,
+        ) as response:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                chunk = json.loads(line)
+                if first_at is None and chunk.get("response"):
+                    first_at = time.monotonic()
+                if chunk.get("done"):
+                    count = chunk.get("eval_count")
+                    duration_ns = chunk.get("eval_duration")
+                    if not count or not duration_ns:
+                        return None
+                    ttft = round(first_at - start, 2) if first_at is not None else None
+                    return round(count / (duration_ns / 1e9), 1), ttft
+    except requests.ConnectionError as e:
+        raise ConnectionError(f"Ollama server not reachable: {e}") from e
+    except (requests.RequestException, ValueError):
         return None
+    return None
+
 
-    # Run the model and measure time
+def _benchmark_via_cli(
+    ollama: str, model_name: str, prompt: str,
+) -> tuple[float, float | None] | None:
+    """Time `ollama run --verbose`, streaming stdout to find the first token.
+
+    Returns (tokens_per_sec, seconds_to_first_token), or None if the run fails
+    or exceeds BENCHMARK_TIMEOUT. The decode rate comes from the verbose
+    'eval rate:' stats when present; otherwise it is estimated from the words
+    that arrived after the first line, so model load is kept out of it.
+    """
+    start = time.monotonic()
     try:
-        start = time.monotonic()
-        result = subprocess.run(
-            ["ollama", "run", model_name, prompt],
-            capture_output=True, text=True, timeout=60,
+        proc = subprocess.Popen(
+            [ollama, "run", "--verbose", model_name, prompt],
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, bufsize=1,
         )
-        elapsed = time.monotonic() - start
+    except OSError:
+        return None
 
-        if result.returncode != 0 or not result.stdout.strip():
-            return None
+    # Drain stderr alongside stdout: if it filled its pipe while unread (spinner
+    # output, warnings), ollama would block and stdout would never reach EOF
+    stderr_parts = []
+    drain = threading.Thread(
+        target=lambda: stderr_parts.append(proc.stderr.read()), daemon=True,
+    )
+    drain.start()
+    watchdog = threading.Timer(BENCHMARK_TIMEOUT, proc.kill)
+    watchdog.start()
+    try:
+        first_at = None
+        total_words = 0
+        later_words = 0
+        for line in proc.stdout:
+            words = len(line.split())
+            if not words:
+                continue
+            if first_at is None:
+                first_at = time.monotonic()
+            else:
+                later_words += words
+            total_words += words
+        returncode = proc.wait()
+        end = time.monotonic()
+        drain.join()
+        stats = "".join(part for part in stderr_parts if part)
+    except OSError:
+        return None
+    finally:
+        watchdog.cancel()
+
+    if returncode != 0 or first_at is None:
+        return None
+    ttft = round(first_at - start, 2)
+
+    # --verbose reports the decode rate with model load time excluded
+    match = _EVAL_RATE_RE.search(stats)
+    if match:
+        return round(float(match.group(1)), 1), ttft
+
+    # Estimate tokens: ~0.75 tokens per word is a rough average
+    if later_words:
+        words, elapsed = later_words, end - first_at
+    else:
+        words, elapsed = total_words, end - start
+    estimated_tokens = max(int(words * 0.75), 1)
+    return round(estimated_tokens / max(elapsed, 0.1), 1), ttft
+
+
+def _run_benchmark(
+    model_name: str,
+    prompt: str = "Hello, how are you?",
+    pulled_base: frozenset[str] | None = None,
+) -> tuple[float, float | None] | None:
+    """Benchmark one pulled model; returns (tokens_per_sec, seconds_to_first_token).
+
+    Prefers the Ollama HTTP API, which reports exact token counts; if the
+    server is not reachable, falls back to `ollama run`. ``pulled_base`` is the
+    set of pulled base names; it is looked up (once per process) when not
+    given. Returns None if ollama is unavailable, the model isn't pulled, or
+    the run fails/times out.
+    """
+    ollama = _ollama_bin()
+    if ollama is None:
+        return None
 
-        # Estimate tokens: ~0.75 tokens per word is a rough average
-        words = len(result.stdout.split())
-        estimated_tokens = max(int(words * 0.75), 1)
-        tps = round(estimated_tokens / max(elapsed, 0.1), 1)
-        return tps
-    except (subprocess.TimeoutExpired, OSError):
+    # Check if model is pulled
+    if pulled_base is None:
+        pulled_base = _list_pulled_base_names()
+    if pulled_base is None or model_name.split(":")[0] not in pulled_base:
         return None
 
+    try:
+        return _benchmark_via_api(model_name, prompt)
+    except ConnectionError:
+        return _benchmark_via_cli(ollama, model_name, prompt)
+
+
+def benchmark_model(
+    model_name: str,
+    prompt: str = "Hello, how are you?",
+    pulled_base: frozenset[str] | None = None,
+) -> float | None:
+    """Run a real benchmark and return tokens_per_sec (see _run_benchmark)."""
+    result = _run_benchmark(model_name, prompt, pulled_base)
+    return result[0] if result else None
+
+
+def _rate(tps: float) -> str:
+    """Map tokens/sec to a Fast / Moderate / Slow rating."""
+    return _RATINGS[bisect_right(_RATING_THRESHOLDS, tps)]
+
 
 def benchmark_pulled_models(
     pulled_models: list[str],
     hw: HardwareProfile,
+    pulled_base: frozenset[str] | None = None,
 ) -> list[BenchmarkEstimate]:
     """Run real benchmarks on already-pulled models.
 
-    Returns a BenchmarkEstimate list.
+    Models are benchmarked one at a time: concurrent runs would share the
+    same GPU or CPU cores and each report only a fraction of its real speed.
+    Callers that already ran `ollama list` pass its base names as
+    ``pulled_base`` to skip another listing. Returns a BenchmarkEstimate list
+    in the order of ``pulled_models``.
     """
+    if not pulled_models or _ollama_bin() is None:
+        return []
+    if pulled_base is None:
+        pulled_base = _list_pulled_base_names()
+    results = [_run_benchmark(name, pulled_base=pulled_base) for name in pulled_models]
+
+    run_mode = "GPU" if hw.best_vram_gb > 0 else "CPU"
     estimates = []
-    for model_name in pulled_models:
-        tps = benchmark_model(model_name)
-        if tps is None:
+    for model_name, result in zip(pulled_models, results):
+        if result is None:
             continue
 
-        if tps >= 60:
-            rating = "Fast"
-        elif tps >= 25:
-            rating = "Moderate"
-        else:
-            rating = "Slow"
-
-        run_mode = "GPU" if hw.best_vram_gb > 0 else "CPU"
-
+        tps, ttft = result
         estimates.append(BenchmarkEstimate(
             model_name=model_name,
             run_mode=run_mode,
             tokens_per_sec=tps,
-            rating=rating,
+            rating=_rate(tps),
+            ttft_s=ttft,
         ))
     return estimates
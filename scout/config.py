@@ -1,20 +1,24 @@
 """
 config.py - Persistent configuration with platform-aware config paths.
 """
+import copy
+import errno
 import json
 import os
-import platform
 import shutil
+import sys
+import tempfile
+from contextlib import contextmanager
 
 LEGACY_CONFIG_PATH = os.path.expanduser("~/.ollama-scout.json")
 
 
 def _get_config_path() -> str:
-    system = platform.system()
-    if system == "Windows":
+    # sys.platform is a constant; platform.system() would import platform and call uname
+    if sys.platform == "win32":
         base = os.environ.get("APPDATA", os.path.expanduser("~"))
         return os.path.join(base, "ollama-scout", "config.json")
-    elif system == "Darwin":
+    elif sys.platform == "darwin":
         return os.path.expanduser(
             "~/Library/Application Support/ollama-scout/config.json"
         )
@@ -34,9 +38,94 @@ DEFAULT_CONFIG: dict = {
     "export_dir": "",
     "offline_mode": False,
     "show_benchmark": False,
+    "hw_cache_ttl_hours": 24,
+    "models_cache_ttl_hours": 24,
 }
 
 
+# path -> ((st_mtime_ns, st_size), parsed JSON) for the last read of each file
+_JSON_CACHE: dict[str, tuple[tuple[int, int], object]] = {}
+
+
+def _read_json(path: str):
+    """Parse a JSON file, reusing the previous parse while the file is unchanged.
+
+    Returns a private copy so callers may mutate it. Raises OSError or
+    json.JSONDecodeError like a plain read.
+    """
+    st = os.stat(path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _JSON_CACHE.get(path)
+    if cached is None or cached[0] != stamp:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        cached = (stamp, data)
+        _JSON_CACHE[path] = cached
+    return copy.deepcopy(cached[1])
+
+
+@contextmanager
+def _write_lock(path: str):
+    """Hold an exclusive advisory lock on ``<path>.lock`` so writers take turns.
+
+    Creates the parent directory on first use; once it exists no extra
+    makedirs call is made.
+    """
+    try:
+        lock_file = open(path + ".lock", "a+")
+    except FileNotFoundError:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        lock_file = open(path + ".lock", "a+")
+    with lock_file:
+        try:
+            import fcntl
+        except ImportError:  # Windows
+            import msvcrt
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def _write_json(path: str, data) -> None:
+    """Atomically replace a JSON file and drop any cached parse of it.
+
+    The data goes to a temp file in the same directory that is then renamed
+    over ``path``, so a concurrent reader sees either the old or the new file,
+    never a truncated one.
+    """
+    _JSON_CACHE.pop(path, None)
+    payload = json.dumps(data, indent=2) + "\n"  # one write() instead of one per token
+    with _write_lock(path):
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".config-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, path)
+        except BaseException:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            raise
+
+
+def _unchanged(old, new) -> bool:
+    """True if writing ``new`` over ``old`` would not change the saved JSON."""
+    return type(old) is type(new) and old == new
+
+
 def _get_profiles_path() -> str:
     return os.path.join(os.path.dirname(CONFIG_PATH), "profiles.json")
 
@@ -48,24 +137,19 @@ _DEFAULT_PROFILES: dict = {"active": "default", "profiles": {"default": {}}}
 
 def _load_profiles() -> dict:
     """Load profiles data from disk."""
-    if os.path.exists(PROFILES_PATH):
-        try:
-            with open(PROFILES_PATH, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            if isinstance(data, dict) and "profiles" in data:
-                return data
-        except (json.JSONDecodeError, OSError):
-            pass
+    try:
+        data = _read_json(PROFILES_PATH)
+        if isinstance(data, dict) and "profiles" in data:
+            return data
+    except (json.JSONDecodeError, OSError):  # includes FileNotFoundError
+        pass
     return {"active": "default", "profiles": {"default": {}}}
 
 
 def _save_profiles(data: dict) -> None:
     """Save profiles data to disk."""
     try:
-        os.makedirs(os.path.dirname(PROFILES_PATH), exist_ok=True)
-        with open(PROFILES_PATH, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
-            f.write("\n")
+        _write_json(PROFILES_PATH, data)
     except OSError:
         pass
 
@@ -85,8 +169,9 @@ def switch_profile(name: str) -> bool:
     data = _load_profiles()
     if name not in data.get("profiles", {}):
         return False
-    data["active"] = name
-    _save_profiles(data)
+    if data.get("active") != name:
+        data["active"] = name
+        _save_profiles(data)
     return True
 
 
@@ -124,6 +209,12 @@ def get_profile_overrides(name: str) -> dict:
     return dict(data.get("profiles", {}).get(name, {}))
 
 
+def get_all_profiles() -> tuple[str, dict[str, dict]]:
+    """Return (active profile name, overrides per profile) from a single read."""
+    data = _load_profiles()
+    return data.get("active", "default"), dict(data.get("profiles", {}))
+
+
 def set_profile_value(profile_name: str, key: str, value) -> bool:
     """Set a single config key in a named profile. Returns False if not found."""
     if key not in DEFAULT_CONFIG:
@@ -131,8 +222,10 @@ def set_profile_value(profile_name: str, key: str, value) -> bool:
     data = _load_profiles()
     if profile_name not in data.get("profiles", {}):
         return False
-    data["profiles"][profile_name][key] = value
-    _save_profiles(data)
+    overrides = data["profiles"][profile_name]
+    if key not in overrides or not _unchanged(overrides[key], value):
+        overrides[key] = value
+        _save_profiles(data)
     return True
 
 
@@ -147,59 +240,87 @@ def _migrate_legacy_config() -> bool:
         return False
     try:
         os.makedirs(os.path.dirname(CONFIG_PATH), exist_ok=True)
-        shutil.copy2(LEGACY_CONFIG_PATH, CONFIG_PATH)
-        os.remove(LEGACY_CONFIG_PATH)
+        try:
+            os.replace(LEGACY_CONFIG_PATH, CONFIG_PATH)  # one rename, no copy
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            # Home and config dir on different filesystems: copy, then remove
+            shutil.copy2(LEGACY_CONFIG_PATH, CONFIG_PATH)
+            os.remove(LEGACY_CONFIG_PATH)
         return True
     except OSError:
         return False
 
 
-def load_config(profile: str | None = None) -> dict:
-    """Load config from disk, merging with defaults and active profile overrides.
+def _load_base_config() -> dict:
+    """Load the base config file merged with defaults (no profile overrides)."""
+    cfg = dict(DEFAULT_CONFIG)
+    try:
+        user_cfg = _read_json(CONFIG_PATH)
+    except FileNotFoundError:
+        save_config(cfg)
+        return cfg
+    except (json.JSONDecodeError, OSError):
+        return cfg  # corrupted or unreadable, use defaults
+    if isinstance(user_cfg, dict):
+        for key in DEFAULT_CONFIG:
+            if key in user_cfg:
+                cfg[key] = user_cfg[key]
+    return cfg
 
-    Args:
-        profile: Profile name to apply overrides from. Defaults to active profile.
-    """
+
+def _load_config_and_profiles(profile: str | None = None) -> tuple[dict, dict]:
+    """Return (merged config, profiles data), reading profiles.json once."""
     migrated = _migrate_legacy_config()
     if migrated:
         from .display import print_info
         print_info(f"Config migrated to [bold]{CONFIG_PATH}[/bold]")
 
-    cfg = dict(DEFAULT_CONFIG)
-    if os.path.exists(CONFIG_PATH):
-        try:
-            with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-                user_cfg = json.load(f)
-            if isinstance(user_cfg, dict):
-                for key in DEFAULT_CONFIG:
-                    if key in user_cfg:
-                        cfg[key] = user_cfg[key]
-        except (json.JSONDecodeError, OSError):
-            pass  # corrupted or unreadable, use defaults
-    else:
-        save_config(cfg)
+    cfg = _load_base_config()
 
     # Apply profile overrides on top of base config
-    active = profile if profile is not None else get_active_profile()
-    overrides = get_profile_overrides(active)
+    data = _load_profiles()
+    active = profile if profile is not None else data.get("active", "default")
+    overrides = data.get("profiles", {}).get(active, {})
     for key in DEFAULT_CONFIG:
         if key in overrides:
             cfg[key] = overrides[key]
 
-    return cfg
+    return cfg, data
+
+
+def load_config(profile: str | None = None) -> dict:
+    """Load config from disk, merging with defaults and active profile overrides.
+
+    Args:
+        profile: Profile name to apply overrides from. Defaults to active profile.
+    """
+    return _load_config_and_profiles(profile)[0]
 
 
 def save_config(cfg: dict) -> None:
     """Write base config to disk."""
     try:
-        os.makedirs(os.path.dirname(CONFIG_PATH), exist_ok=True)
-        with open(CONFIG_PATH, "w", encoding="utf-8") as f:
-            json.dump(cfg, f, indent=2)
-            f.write("\n")
+        _write_json(CONFIG_PATH, cfg)
     except OSError:
         pass  # can't write, silently skip
 
 
+def set_config_value(key: str, value) -> bool:
+    """Set a single key in the base config. Returns False if the key is unknown.
+
+    Profile overrides are not merged in, so they never leak into config.json.
+    """
+    if key not in DEFAULT_CONFIG:
+        return False
+    cfg = _load_base_config()
+    if not _unchanged(cfg[key], value):
+        cfg[key] = value
+        save_config(cfg)
+    return True
+
+
 def print_config() -> None:
     """Print current config to stdout."""
     from rich import box
@@ -207,10 +328,10 @@ def print_config() -> None:
     from rich.table import Table
 
     console = Console()
-    active = get_active_profile()
-    profiles = list_profiles()
+    cfg, data = _load_config_and_profiles()
+    active = data.get("active", "default")
+    profiles = list(data.get("profiles", {}))
 
-    cfg = load_config()
     title = f"[bold cyan]Config[/bold cyan]  [dim]({CONFIG_PATH})[/dim]"
     if active != "default":
         title += f"  [yellow]profile: {active}[/yellow]"
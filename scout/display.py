@@ -1,19 +1,31 @@
 """
 display.py - Rich terminal UI for ollama-scout.
 """
-from rich import box
+from __future__ import annotations
+
+from collections.abc import Iterable
+from concurrent.futures import Future, wait
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
 from rich.console import Console
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.table import Table
 from rich.text import Text
 
-from .benchmark import BenchmarkEstimate
-from .hardware import HardwareProfile
-from .recommender import Recommendation
+if TYPE_CHECKING:
+    from rich.progress import Progress
+
+    # Annotation-only: importing these at runtime would pull in requests via ollama_api.
+    from .benchmark import BenchmarkEstimate
+    from .hardware import HardwareProfile
+    from .recommender import Recommendation
 
 console = Console()
 
+# Work that finishes within this many seconds (e.g. a warm cache) gets no spinner
+SPINNER_DELAY_SECONDS = 0.1
+
 FIT_COLORS = {
     "Excellent": "bold green",
     "Good": "bold yellow",
@@ -36,6 +48,31 @@ USE_CASE_ICONS = {
 }
 
 
+# Table cells are built as Text with a style instead of markup strings, so
+# rows skip Rich's markup parser and model names containing "[" print as-is.
+def _fit_text(fit_label: str) -> Text:
+    return Text(fit_label, style=FIT_COLORS.get(fit_label, "white"))
+
+
+def _mode_text(run_mode: str) -> Text:
+    return Text(run_mode, style=RUN_MODE_COLORS.get(run_mode, "white"))
+
+
+# (text, style) for the Status column, indexed by ``model.pulled``
+_STATUS = (("Available", "dim"), ("✔ Pulled", "green"))
+
+
+def _status_text(pulled: bool) -> Text:
+    text, style = _STATUS[bool(pulled)]
+    return Text(text, style=style)
+
+
+@lru_cache(maxsize=256)
+def _use_case_icons(use_cases: tuple[str, ...]) -> str:
+    """Icons for a model's use cases, e.g. "💻 💬" (few distinct combinations)."""
+    return " ".join(USE_CASE_ICONS.get(uc, uc) for uc in use_cases)
+
+
 def print_banner():
     from scout import __version__
     banner = Text()
@@ -47,6 +84,9 @@ def print_banner():
 
 
 def print_hardware_summary(hw: HardwareProfile):
+    from rich import box
+    from rich.table import Table
+
     table = Table(
         title="[bold cyan]System Hardware[/bold cyan]",
         box=box.ROUNDED,
@@ -68,11 +108,13 @@ def print_hardware_summary(hw: HardwareProfile):
     if hw.gpus:
         for i, gpu in enumerate(hw.gpus):
             label = "GPU" if i == 0 else f"GPU {i+1}"
-            table.add_row(label, f"{gpu.name}  [cyan]({gpu.vram_gb} GB VRAM)[/cyan]")
+            kind = "shared" if gpu.shared_memory else "VRAM"
+            table.add_row(label, f"{gpu.name}  [cyan]({gpu.vram_gb} GB {kind})[/cyan]")
         if hw.multi_gpu:
+            gpu_count = len(hw.dedicated_gpus)
             table.add_row(
                 "Combined VRAM",
-                f"[bold cyan]{hw.combined_vram_gb} GB across {len(hw.gpus)} GPUs[/bold cyan]",
+                f"[bold cyan]{hw.combined_vram_gb} GB across {gpu_count} GPUs[/bold cyan]",
             )
     else:
         table.add_row("GPU", "[dim]None detected — CPU inference only[/dim]")
@@ -85,6 +127,9 @@ def print_recommendations_grouped(
     grouped: dict[str, list[Recommendation]],
     pulled_models: list[str],
 ):
+    from rich import box
+    from rich.table import Table
+
     for use_case, recs in grouped.items():
         if not recs:
             continue
@@ -109,21 +154,19 @@ def print_recommendations_grouped(
         table.add_column("Note", style="dim", min_width=20, overflow="fold")
         table.add_column("Status", justify="center")
 
+        add_row = table.add_row
         for rec in recs:
-            fit_style = FIT_COLORS.get(rec.fit_label, "white")
-            mode_style = RUN_MODE_COLORS.get(rec.run_mode, "white")
-            status = "[green]✔ Pulled[/green]" if rec.model.pulled else "[dim]Available[/dim]"
-
-            table.add_row(
-                rec.model.name,
-                rec.variant.tag,
-                f"[cyan]{rec.variant.quantization}[/cyan]",
-                f"[white]{rec.variant.size_gb}GB[/white]",
-                f"[dim]{rec.variant.param_size}[/dim]",
-                f"[{fit_style}]{rec.fit_label}[/{fit_style}]",
-                f"[{mode_style}]{rec.run_mode}[/{mode_style}]",
-                rec.note,
-                status,
+            model, variant = rec.model, rec.variant
+            add_row(
+                Text(model.name),
+                Text(variant.tag),
+                Text(variant.quantization, style="cyan"),
+                Text(f"{variant.size_gb}GB", style="white"),
+                Text(variant.param_size, style="dim"),
+                _fit_text(rec.fit_label),
+                _mode_text(rec.run_mode),
+                Text(rec.note),
+                _status_text(model.pulled),
             )
 
         console.print(table)
@@ -131,6 +174,9 @@ def print_recommendations_grouped(
 
 
 def print_recommendations_flat(recs: list[Recommendation]):
+    from rich import box
+    from rich.table import Table
+
     table = Table(
         title="[bold cyan]Recommended Models[/bold cyan]",
         box=box.SIMPLE_HEAVY,
@@ -149,23 +195,19 @@ def print_recommendations_flat(recs: list[Recommendation]):
     table.add_column("Mode", justify="center", min_width=8)
     table.add_column("Status", justify="center")
 
+    add_row = table.add_row
     for i, rec in enumerate(recs, 1):
-        fit_style = FIT_COLORS.get(rec.fit_label, "white")
-        mode_style = RUN_MODE_COLORS.get(rec.run_mode, "white")
-        status = "[green]✔ Pulled[/green]" if rec.model.pulled else "[dim]Available[/dim]"
-        use_cases = " ".join(
-            USE_CASE_ICONS.get(uc, uc) for uc in rec.model.use_cases
-        )
-        table.add_row(
-            str(i),
-            rec.model.name,
-            rec.variant.tag,
-            f"[cyan]{rec.variant.quantization}[/cyan]",
-            f"{rec.variant.size_gb}GB",
-            use_cases,
-            f"[{fit_style}]{rec.fit_label}[/{fit_style}]",
-            f"[{mode_style}]{rec.run_mode}[/{mode_style}]",
-            status,
+        model, variant = rec.model, rec.variant
+        add_row(
+            Text(str(i)),
+            Text(model.name),
+            Text(variant.tag),
+            Text(variant.quantization, style="cyan"),
+            Text(f"{variant.size_gb}GB"),
+            Text(_use_case_icons(tuple(model.use_cases))),
+            _fit_text(rec.fit_label),
+            _mode_text(rec.run_mode),
+            _status_text(model.pulled),
         )
 
     console.print(table)
@@ -173,6 +215,9 @@ def print_recommendations_flat(recs: list[Recommendation]):
 
 def print_benchmark(estimates: list[BenchmarkEstimate]):
     """Print real benchmark results for pulled models."""
+    from rich import box
+    from rich.table import Table
+
     RATING_STYLES = {
         "Fast": ("bold green", "Fast ⚡"),
         "Moderate": ("bold yellow", "Moderate 🔄"),
@@ -190,21 +235,26 @@ def print_benchmark(estimates: list[BenchmarkEstimate]):
     table.add_column("Model", style="bold white", min_width=25)
     table.add_column("Mode", justify="center")
     table.add_column("Speed", justify="right")
+    table.add_column("First token", justify="right")
     table.add_column("Rating", justify="center")
 
     for est in estimates:
-        mode_style = RUN_MODE_COLORS.get(est.run_mode, "white")
         style, label = RATING_STYLES.get(est.rating, ("white", est.rating))
+        ttft = (
+            Text(f"{est.ttft_s:.1f}s") if est.ttft_s is not None else Text("-", style="dim")
+        )
         table.add_row(
-            est.model_name,
-            f"[{mode_style}]{est.run_mode}[/{mode_style}]",
-            f"{est.tokens_per_sec} t/s",
-            f"[{style}]{label}[/{style}]",
+            Text(est.model_name),
+            _mode_text(est.run_mode),
+            Text(f"{est.tokens_per_sec} t/s"),
+            ttft,
+            Text(label, style=style),
         )
 
     console.print(table)
     console.print(
-        "[dim]Timings measured on your hardware. Actual performance varies "
+        "[dim]Timings measured on your hardware. Speed is steady-state generation; "
+        "first token includes model load. Actual performance varies "
         "with context length and system load.[/dim]"
     )
     console.print()
@@ -212,16 +262,18 @@ def print_benchmark(estimates: list[BenchmarkEstimate]):
 
 def print_model_detail(model, variants_with_scores, pulled_models, hw):
     """Print a detailed view of a single model."""
+    from rich import box
+    from rich.table import Table
 
     is_pulled = model.name in pulled_models
-    uc_badges = " ".join(USE_CASE_ICONS.get(uc, uc) for uc in model.use_cases)
+    uc_badges = _use_case_icons(tuple(model.use_cases))
 
     # Header
     header = Text()
     header.append(f"{model.name}", style="bold cyan")
     header.append(f"  {uc_badges}")
     if is_pulled:
-        header.append("  [green]✔ Pulled[/green]")
+        header.append("  ✔ Pulled", style="green")
 
     console.print(Panel(header, border_style="cyan", padding=(0, 2)))
     console.print(f"  [dim]{model.description}[/dim]")
@@ -248,16 +300,14 @@ def print_model_detail(model, variants_with_scores, pulled_models, hw):
     best_score = -1
 
     for variant, score, fit_label, run_mode, note in variants_with_scores:
-        fit_style = FIT_COLORS.get(fit_label, "white")
-        mode_style = RUN_MODE_COLORS.get(run_mode, "white")
         table.add_row(
-            variant.tag,
-            f"{variant.size_gb}GB",
-            variant.param_size,
-            f"[cyan]{variant.quantization}[/cyan]",
-            f"[{fit_style}]{fit_label}[/{fit_style}]",
-            f"[{mode_style}]{run_mode}[/{mode_style}]",
-            note,
+            Text(variant.tag),
+            Text(f"{variant.size_gb}GB"),
+            Text(variant.param_size),
+            Text(variant.quantization, style="cyan"),
+            _fit_text(fit_label),
+            _mode_text(run_mode),
+            Text(note),
         )
         if score > best_score:
             best_score = score
@@ -291,6 +341,9 @@ def print_model_comparison(detail1, detail2):
         fit_label, run_mode, score, est_tps, pulled
     Pass None for a detail if the model was not found.
     """
+    from rich import box
+    from rich.table import Table
+
     FIT_RANK = {"Excellent": 3, "Good": 2, "Possible": 1, "Too Large": 0, None: -1}
     MODE_RANK = {"GPU": 3, "CPU+GPU": 2, "CPU": 1, "N/A": 0, None: -1}
 
@@ -471,6 +524,23 @@ def print_legend():
     ))
 
 
+def print_profile_list(profiles: list[str], active: str, overrides: dict[str, dict]):
+    """Print config profiles as aligned rows, marking the active one."""
+    width = max((len(name) for name in profiles), default=0)
+    text = Text()
+    text.append("Config Profiles\n", style="bold cyan")
+    for name in profiles:
+        text.append("  ✓ " if name == active else "    ", style="bold green")
+        text.append(f"{name:<{width}}  ", style="bold white")
+        profile_overrides = overrides.get(name)
+        if profile_overrides:
+            text.append(", ".join(f"{k}={v!r}" for k, v in profile_overrides.items()))
+        else:
+            text.append("(no overrides)", style="dim")
+        text.append("\n")
+    console.print(text, end="")
+
+
 def print_ollama_not_installed():
     """Print a warning panel when Ollama is not installed."""
     console.print(Panel(
@@ -536,11 +606,87 @@ def prompt_pull(recs: list[Recommendation]) -> str | None:
         return None
 
 
-def spinner(message: str) -> Progress:
+class _NullProgress:
+    """Stand-in for Progress on non-terminal output: no live render thread."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def add_task(self, *args, **kwargs) -> int:
+        return 0
+
+    def update(self, *args, **kwargs):
+        pass
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+
+@contextmanager
+def batched_status():
+    """Buffer everything printed inside the block and write it in one flush.
+
+    Rich otherwise writes and flushes the terminal once per print call.
+    """
+    with console:
+        yield
+
+
+def spinner(message: str) -> Progress | _NullProgress:
+    if not console.is_terminal:
+        return _NullProgress()
+    # Loaded here: only the scan and benchmark paths ever show a spinner.
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
     p = Progress(SpinnerColumn(), TextColumn(f"[cyan]{message}[/cyan]"), transient=True)
     return p
 
 
+def wait_with_spinner(
+    message: str, futures: Iterable[Future], delay: float = SPINNER_DELAY_SECONDS,
+) -> None:
+    """Wait for ``futures``, showing a spinner only once ``delay`` seconds have passed.
+
+    Starting a live spinner costs a render thread and a frame even for work
+    that is already done, so fast paths finish without one.
+    """
+    pending = wait(futures, timeout=delay).not_done
+    if not pending:
+        return
+    with spinner(message) as p:
+        p.add_task("")
+        p.start()
+        wait(pending)
+        p.stop()
+
+
+def download_progress() -> Progress | _NullProgress:
+    """Progress bar with byte counts and transfer speed, for model pulls."""
+    if not console.is_terminal:
+        return _NullProgress()
+    from rich.progress import (
+        BarColumn,
+        DownloadColumn,
+        Progress,
+        TextColumn,
+        TransferSpeedColumn,
+    )
+
+    return Progress(
+        TextColumn("[cyan]{task.description}[/cyan]"),
+        BarColumn(),
+        DownloadColumn(),
+        TransferSpeedColumn(),
+        transient=True,
+    )
+
+
 def print_error(msg: str):
     console.print(f"[bold red]Error:[/bold red] {msg}")
 
@@ -2,16 +2,12 @@
 doctor.py - System health check for ollama-scout.
 """
 import os
-import platform
 import subprocess
 import sys
 from datetime import datetime, timezone
+from functools import lru_cache
 
-from rich import box
-from rich.console import Console
-from rich.table import Table
-
-console = Console()
+from .display import console
 
 
 def _check_python() -> tuple[bool, str]:
@@ -22,11 +18,13 @@ def _check_python() -> tuple[bool, str]:
 
 def _check_ollama() -> tuple[bool, str]:
     import shutil
-    if not shutil.which("ollama"):
+    ollama = shutil.which("ollama")
+    if not ollama:
         return False, "not found in PATH"
     try:
         result = subprocess.run(
-            ["ollama", "--version"], capture_output=True, text=True, timeout=5,
+            [ollama, "--version"],
+            capture_output=True, text=True, timeout=3, stdin=subprocess.DEVNULL,
         )
         if result.returncode == 0:
             return True, result.stdout.strip()
@@ -35,16 +33,23 @@ def _check_ollama() -> tuple[bool, str]:
         return False, str(e)
 
 
+@lru_cache(maxsize=1)
+def _hardware():
+    """Detect hardware once per doctor run; shared by the GPU and RAM checks."""
+    from .hardware import refresh_hardware
+    return refresh_hardware()
+
+
 def _check_gpu() -> tuple[bool, str]:
     try:
-        from .hardware import detect_hardware
-        hw = detect_hardware()
+        hw = _hardware()
         if hw.is_unified_memory:
             return True, f"Apple Silicon — {hw.ram_gb:.0f} GB unified memory"
         elif hw.gpus:
             names = ", ".join(g.name for g in hw.gpus)
-            total_vram = sum(g.vram_mb for g in hw.gpus) / 1024
-            return True, f"{names} ({total_vram:.1f} GB VRAM)"
+            if hw.shared_memory_only:
+                return True, f"{names} (uses system RAM)"
+            return True, f"{names} ({hw.total_vram_gb:.1f} GB VRAM)"
         else:
             return False, "no GPU detected (CPU-only mode)"
     except Exception as e:
@@ -52,33 +57,23 @@ def _check_gpu() -> tuple[bool, str]:
 
 
 def _check_ram() -> tuple[bool, str]:
-    ram_gb: float | None = None
     try:
-        import psutil
-        ram_gb = psutil.virtual_memory().total / (1024 ** 3)
-    except ImportError:
-        system = platform.system()
-        if system == "Linux":
-            try:
-                with open("/proc/meminfo") as f:
-                    for line in f:
-                        if line.startswith("MemTotal:"):
-                            ram_gb = int(line.split()[1]) / (1024 ** 2)
-                            break
-            except OSError:
-                pass
-        if ram_gb is None:
-            return False, "psutil not available"
-    ok = (ram_gb or 0.0) >= 4.0
-    return ok, f"{ram_gb:.1f} GB"
+        ram_gb = _hardware().ram_gb
+    except Exception as e:
+        return False, f"detection error: {e}"
+    if not ram_gb:
+        return False, "could not detect RAM"
+    return ram_gb >= 4.0, f"{ram_gb:.1f} GB"
 
 
 def _check_internet() -> tuple[bool, str]:
+    from .config import load_config
+    if load_config().get("offline_mode"):
+        return True, "skipped (offline_mode)"
+    import socket
     try:
-        import socket
-        socket.setdefaulttimeout(3)
-        socket.socket(socket.AF_INET, socket.SOCK_STREAM).connect(("8.8.8.8", 53))
-        return True, "reachable"
+        with socket.create_connection(("8.8.8.8", 53), timeout=1.0):
+            return True, "reachable"
     except OSError:
         return False, "no internet connection"
 
@@ -145,6 +140,10 @@ _CHECKS = [
 
 def run_doctor() -> None:
     """Run all health checks and print a summary table."""
+    _hardware.cache_clear()  # re-detect on every run
+    from rich import box
+    from rich.table import Table
+
     table = Table(
         title="[bold cyan]ollama-scout Doctor[/bold cyan]",
         box=box.ROUNDED,
@@ -1,11 +1,17 @@
 """
 exporter.py - Export scan results to a Markdown file.
 """
+from __future__ import annotations
+
 import os
 from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING
 
-from .hardware import HardwareProfile
-from .recommender import Recommendation
+if TYPE_CHECKING:
+    # Annotation-only: importing these at runtime would pull in requests via ollama_api.
+    from .hardware import HardwareProfile
+    from .recommender import Recommendation
 
 USE_CASE_ICONS = {
     "coding": "💻",
@@ -14,14 +20,18 @@ USE_CASE_ICONS = {
 }
 
 
+def default_filename() -> str:
+    """Timestamped report filename used when no output path is given."""
+    return f"ollama_scout_{datetime.now().strftime('%Y%m%d_%H%M%S')}.md"
+
+
 def export_markdown(
     hw: HardwareProfile,
     grouped: dict[str, list[Recommendation]],
-    output_path: str = None,
+    output_path: str | Path | None = None,
 ) -> str:
     if output_path is None:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_path = f"ollama_scout_{timestamp}.md"
+        output_path = default_filename()
 
     lines = []
     now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
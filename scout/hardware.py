@@ -2,16 +2,57 @@
 hardware.py - Cross-platform hardware detection (GPU VRAM, CPU, RAM)
 Supports: Windows, macOS (including Apple Silicon), Linux
 """
+import json
+import os
 import platform
 import shutil
 import subprocess
-from dataclasses import dataclass, field
+import threading
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from functools import lru_cache
+
+# Probe command lines, built once rather than on every call
+_NVIDIA_SMI_ARGV = (
+    "nvidia-smi", "--query-gpu=name,memory.total", "--format=csv,noheader,nounits",
+)
+_ROCM_SMI_ARGV = ("rocm-smi", "--showmeminfo", "vram", "--csv")
+_SYSTEM_PROFILER_ARGV = ("system_profiler", "-json", "SPDisplaysDataType")
+_WMIC_GPU_ARGV = (
+    "wmic", "path", "win32_VideoController", "get", "Name,AdapterRAM", "/format:csv",
+)
+_WMIC_CPU_ARGV = (
+    "wmic", "cpu", "get", "Name,NumberOfCores,NumberOfLogicalProcessors", "/format:csv",
+)
+_WMIC_RAM_ARGV = ("wmic", "computersystem", "get", "TotalPhysicalMemory", "/format:csv")
+
+
+@lru_cache(maxsize=16)
+def _which(cmd: str) -> str | None:
+    """shutil.which(), memoized so repeated detect_hardware() calls skip the PATH walk."""
+    return shutil.which(cmd)
+
+
+def _run_probe(argv: tuple[str, ...], timeout: float) -> subprocess.CompletedProcess:
+    """Run a probe command and capture its text output.
+
+    Given an absolute executable path and close_fds=False, CPython on Linux
+    and macOS starts the child with posix_spawn rather than fork_exec. Not
+    closing descriptors is safe: Python creates them non-inheritable (PEP 446).
+    """
+    exe = _which(argv[0]) or argv[0]
+    return subprocess.run(
+        (exe, *argv[1:]),
+        capture_output=True, text=True, timeout=timeout, close_fds=os.name != "posix",
+    )
 
 
 @dataclass
 class GPUInfo:
     name: str
     vram_mb: int
+    # Memory is system RAM mapped for the GPU (an APU's GTT), not dedicated VRAM
+    shared_memory: bool = False
 
     @property
     def vram_gb(self) -> float:
@@ -28,19 +69,30 @@ class HardwareProfile:
     gpus: list[GPUInfo] = field(default_factory=list)
     is_unified_memory: bool = False
 
+    @property
+    def dedicated_gpus(self) -> list[GPUInfo]:
+        """GPUs with their own VRAM; shared-memory GPUs draw on ram_gb instead."""
+        return [g for g in self.gpus if not g.shared_memory]
+
+    @property
+    def shared_memory_only(self) -> bool:
+        """True when every GPU found uses system RAM (e.g. an AMD APU)."""
+        return bool(self.gpus) and not self.dedicated_gpus
+
     @property
     def total_vram_gb(self) -> float:
         if self.is_unified_memory:
             return self.ram_gb
-        return round(sum(g.vram_mb for g in self.gpus) / 1024, 1)
+        return round(sum(g.vram_mb for g in self.dedicated_gpus) / 1024, 1)
 
     @property
     def best_vram_gb(self) -> float:
         if self.is_unified_memory:
             return self.ram_gb
-        if not self.gpus:
+        dedicated = self.dedicated_gpus
+        if not dedicated:
             return 0.0
-        return round(max(g.vram_mb for g in self.gpus) / 1024, 1)
+        return round(max(g.vram_mb for g in dedicated) / 1024, 1)
 
     @property
     def combined_vram_gb(self) -> float:
@@ -49,57 +101,197 @@ class HardwareProfile:
 
     @property
     def multi_gpu(self) -> bool:
-        return len(self.gpus) > 1
+        return len(self.dedicated_gpus) > 1
+
+
+_DARWIN_SYSCTL_KEYS = (
+    "machdep.cpu.brand_string",
+    "hw.physicalcpu",
+    "hw.logicalcpu",
+    "hw.memsize",
+    "hw.optional.arm64",
+)
+_darwin_sysctl_lock = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def _read_darwin_sysctl() -> dict[str, str]:
+    try:
+        # Without -n each line is "key: value", so a key missing on this Mac
+        # (hw.optional.arm64 on older Intel models) cannot shift the others.
+        result = _run_probe(("sysctl", *_DARWIN_SYSCTL_KEYS), timeout=5)
+    except Exception:
+        return {}
+    values = {}
+    for line in result.stdout.splitlines():
+        key, sep, value = line.partition(":")
+        if sep:
+            values[key.strip()] = value.strip()
+    return values
+
+
+def _darwin_sysctl() -> dict[str, str]:
+    """The macOS CPU, memory and arm64 sysctl values, read with one `sysctl` run.
+
+    Locked because the CPU and Apple Silicon probes run in parallel threads.
+    """
+    with _darwin_sysctl_lock:
+        return _read_darwin_sysctl()
 
 
 def _is_apple_silicon() -> bool:
     """Detect if running on Apple Silicon (M1/M2/M3/M4)."""
     if platform.system() != "Darwin":
         return False
-    # Check processor string
-    proc = platform.processor()
-    if proc == "arm" or "apple" in proc.lower():
+    # uname() is read in-process; platform.processor() would spawn `uname -p`
+    if platform.machine() == "arm64":
         return True
-    # Fallback: check sysctl
+    # An x86_64 Python under Rosetta still sees hw.optional.arm64 (and the CPU
+    # probe fetches it in the same sysctl run)
+    return _darwin_sysctl().get("hw.optional.arm64") == "1"
+
+
+_PCI_VENDOR_NVIDIA = "0x10de"
+_PCI_VENDOR_AMD = "0x1002"
+
+
+@lru_cache(maxsize=1)
+def _pci_vendors() -> frozenset[str] | None:
+    """PCI vendor IDs on a Linux host, read from sysfs.
+
+    Returns None when the bus cannot be enumerated (other OSes, WSL2 where
+    GPUs are exposed through /dev/dxg, restricted containers); callers must
+    then probe as usual.
+    """
+    if platform.system() != "Linux" or os.path.exists("/dev/dxg"):
+        return None
     try:
-        result = subprocess.run(
-            ["sysctl", "-n", "hw.optional.arm64"],
-            capture_output=True, text=True, timeout=5,
-        )
-        return result.stdout.strip() == "1"
+        devices = os.listdir("/sys/bus/pci/devices")
+    except OSError:
+        return None
+    vendors = set()
+    for device in devices:
+        try:
+            with open(f"/sys/bus/pci/devices/{device}/vendor") as f:
+                vendors.add(f.read(6).lower())
+        except OSError:
+            continue
+    return frozenset(vendors) or None
+
+
+def _pci_vendor_absent(vendor: str) -> bool:
+    """True only when the PCI bus was read and has no device from ``vendor``."""
+    vendors = _pci_vendors()
+    return vendors is not None and vendor not in vendors
+
+
+def _detect_gpus_nvml() -> list[GPUInfo] | None:
+    """Query NVIDIA GPUs in-process through NVML (the optional nvidia-ml-py package).
+
+    Returns None when pynvml or the driver library is unavailable, so the
+    caller can fall back to nvidia-smi.
+    """
+    try:
+        import pynvml
+    except ImportError:
+        return None
+    try:
+        pynvml.nvmlInit()
     except Exception:
-        return False
+        return None
+    try:
+        gpus = []
+        for i in range(pynvml.nvmlDeviceGetCount()):
+            handle = pynvml.nvmlDeviceGetHandleByIndex(i)
+            name = pynvml.nvmlDeviceGetName(handle)
+            if isinstance(name, bytes):  # older bindings return bytes
+                name = name.decode()
+            total = pynvml.nvmlDeviceGetMemoryInfo(handle).total
+            gpus.append(GPUInfo(name=name, vram_mb=int(total // (1024 * 1024))))
+        return gpus
+    except Exception:
+        return None
+    finally:
+        try:
+            pynvml.nvmlShutdown()
+        except Exception:
+            pass
 
 
 def _detect_gpus_nvidia() -> list[GPUInfo]:
-    if not shutil.which("nvidia-smi"):
+    if _pci_vendor_absent(_PCI_VENDOR_NVIDIA):
+        return []  # nvidia-smi may be installed, but there is no NVIDIA card
+    gpus = _detect_gpus_nvml()
+    if gpus is not None:
+        return gpus
+    if not _which("nvidia-smi"):
         return []
     try:
-        result = subprocess.run(
-            ["nvidia-smi", "--query-gpu=name,memory.total", "--format=csv,noheader,nounits"],
-            capture_output=True, text=True, timeout=10
-        )
+        result = _run_probe(_NVIDIA_SMI_ARGV, timeout=10)
         gpus = []
-        for line in result.stdout.strip().splitlines():
-            parts = line.split(",")
-            if len(parts) == 2:
-                name = parts[0].strip()
-                vram_mb = int(parts[1].strip())
-                gpus.append(GPUInfo(name=name, vram_mb=vram_mb))
+        for line in result.stdout.splitlines():
+            # "name, memory.total"; memory is last, so commas in the name are kept
+            name, _, vram = line.rpartition(",")
+            vram = vram.strip()
+            if name and vram.isdigit():
+                gpus.append(GPUInfo(name=name.strip(), vram_mb=int(vram)))
         return gpus
     except Exception:
         return []
 
 
-def _detect_gpus_amd_linux() -> list[GPUInfo]:
-    """Use rocm-smi or parse /sys for AMD GPUs on Linux."""
+_DRM_ROOT = "/sys/class/drm"
+# Below this much dedicated VRAM an amdgpu device is an APU with a BIOS
+# carve-out; it runs models from GTT (system memory mapped for the GPU).
+_AMD_APU_CARVEOUT_MB = 1024
+
+
+def _read_sysfs(path: str) -> str:
+    with open(path) as f:
+        return f.read().strip()
+
+
+def _detect_gpus_amd_sysfs() -> list[GPUInfo]:
+    """AMD GPUs from the amdgpu driver's sysfs memory counters (no rocm-smi)."""
+    import glob
+
     gpus = []
-    if shutil.which("rocm-smi"):
+    seen = set()
+    pattern = os.path.join(_DRM_ROOT, "card[0-9]*", "device", "mem_info_vram_total")
+    for vram_path in sorted(glob.glob(pattern)):
+        device = os.path.dirname(vram_path)
         try:
-            result = subprocess.run(
-                ["rocm-smi", "--showmeminfo", "vram", "--csv"],
-                capture_output=True, text=True, timeout=10
-            )
+            real = os.path.realpath(device)
+            if real in seen or _read_sysfs(os.path.join(device, "vendor")) != _PCI_VENDOR_AMD:
+                continue
+            seen.add(real)
+            vram_mb = int(_read_sysfs(vram_path)) // (1024 * 1024)
+            shared = vram_mb < _AMD_APU_CARVEOUT_MB
+            if shared:
+                gtt = _read_sysfs(os.path.join(device, "mem_info_gtt_total"))
+                vram_mb = int(gtt) // (1024 * 1024)
+        except (OSError, ValueError):
+            continue
+        try:
+            name = _read_sysfs(os.path.join(device, "product_name")) or "AMD GPU"
+        except OSError:
+            name = "AMD GPU"
+        if shared:
+            name += " (shared memory)"
+        gpus.append(GPUInfo(name=name, vram_mb=vram_mb, shared_memory=shared))
+    return gpus
+
+
+def _detect_gpus_amd_linux() -> list[GPUInfo]:
+    """Read AMD GPUs from sysfs, falling back to rocm-smi."""
+    if _pci_vendor_absent(_PCI_VENDOR_AMD):
+        return []
+    gpus = _detect_gpus_amd_sysfs()
+    if gpus:
+        return gpus
+    if _which("rocm-smi"):
+        try:
+            result = _run_probe(_ROCM_SMI_ARGV, timeout=10)
             for line in result.stdout.strip().splitlines():
                 if "GPU" in line and "Total" in line:
                     parts = line.split(",")
@@ -114,34 +306,31 @@ def _detect_gpus_amd_linux() -> list[GPUInfo]:
     return gpus
 
 
+def _parse_vram_mb(text: str) -> int | None:
+    """Convert a system_profiler VRAM string such as "8 GB" or "1536 MB" to MB."""
+    value, _, unit = text.strip().lower().partition(" ")
+    try:
+        amount = float(value)
+    except ValueError:
+        return None
+    if unit.startswith("gb"):
+        return int(amount * 1024)
+    if unit.startswith("mb"):
+        return int(amount)
+    return None
+
+
 def _detect_gpus_macos() -> list[GPUInfo]:
     """Use system_profiler on macOS to detect GPU VRAM."""
     gpus = []
     try:
-        result = subprocess.run(
-            ["system_profiler", "SPDisplaysDataType"],
-            capture_output=True, text=True, timeout=15
-        )
-        current_gpu = None
-        for line in result.stdout.splitlines():
-            line = line.strip()
-            if "Chipset Model:" in line:
-                current_gpu = line.split(":", 1)[1].strip()
-            elif "VRAM" in line and current_gpu:
-                parts = line.split(":")
-                if len(parts) == 2:
-                    vram_str = parts[1].strip().lower()
-                    try:
-                        if "gb" in vram_str:
-                            vram_mb = int(float(vram_str.replace("gb", "").strip()) * 1024)
-                        elif "mb" in vram_str:
-                            vram_mb = int(float(vram_str.replace("mb", "").strip()))
-                        else:
-                            continue
-                        gpus.append(GPUInfo(name=current_gpu, vram_mb=vram_mb))
-                        current_gpu = None
-                    except ValueError:
-                        pass
+        result = _run_probe(_SYSTEM_PROFILER_ARGV, timeout=15)
+        for entry in json.loads(result.stdout).get("SPDisplaysDataType", []):
+            vram = entry.get("spdisplays_vram") or entry.get("spdisplays_vram_shared")
+            vram_mb = _parse_vram_mb(vram) if vram else None
+            if vram_mb:
+                name = entry.get("sppci_model") or entry.get("_name", "Unknown GPU")
+                gpus.append(GPUInfo(name=name, vram_mb=vram_mb))
     except Exception:
         pass
     return gpus
@@ -152,43 +341,62 @@ def _detect_gpus_windows_wmi() -> list[GPUInfo]:
     gpus = []
     try:
         result = subprocess.run(
-            ["wmic", "path", "win32_VideoController", "get", "Name,AdapterRAM", "/format:csv"],
+            _WMIC_GPU_ARGV,
             capture_output=True, text=True, timeout=10, shell=False
         )
-        for line in result.stdout.strip().splitlines():
-            parts = line.split(",")
-            if len(parts) >= 3 and parts[1].strip() and parts[1].strip() != "AdapterRAM":
-                try:
-                    vram_bytes = int(parts[1].strip())
-                    name = parts[2].strip()
-                    if vram_bytes > 0:
-                        gpus.append(GPUInfo(name=name, vram_mb=vram_bytes // (1024 * 1024)))
-                except ValueError:
-                    pass
+        for line in result.stdout.splitlines():
+            # "Node,AdapterRAM,Name"; the header and blank lines fail the digit check
+            fields = line.split(",", 2)
+            if len(fields) != 3:
+                continue
+            _, vram, name = fields
+            vram = vram.strip()
+            if vram.isdigit() and int(vram) > 0:
+                gpus.append(GPUInfo(name=name.strip(), vram_mb=int(vram) // (1024 * 1024)))
     except Exception:
         pass
     return gpus
 
 
+_CIM_SNAPSHOT_SCRIPT = (
+    "@{"
+    "cpu = @(Get-CimInstance Win32_Processor"
+    " | Select-Object Name, NumberOfCores, NumberOfLogicalProcessors); "
+    "gpu = @(Get-CimInstance Win32_VideoController | Select-Object Name, AdapterRAM); "
+    "ram = @(Get-CimInstance Win32_ComputerSystem | Select-Object TotalPhysicalMemory)"
+    "} | ConvertTo-Json -Depth 3"
+)
+
+
+@lru_cache(maxsize=1)
+def _windows_cim_snapshot() -> dict:
+    """Processor, video controller and memory info from a single PowerShell run.
+
+    PowerShell takes hundreds of ms to start, so the CPU, GPU and RAM
+    fallbacks share one process. Returns {} if the query fails.
+    """
+    try:
+        result = subprocess.run(
+            ["powershell", "-NoProfile", "-Command", _CIM_SNAPSHOT_SCRIPT],
+            capture_output=True, text=True, timeout=20, shell=False,
+        )
+        data = json.loads(result.stdout.strip())
+        return data if isinstance(data, dict) else {}
+    except Exception:
+        return {}
+
+
+def _cim_items(key: str) -> list[dict]:
+    """Entries for ``key`` in the CIM snapshot; a lone object is wrapped in a list."""
+    data = _windows_cim_snapshot().get(key) or []
+    return [data] if isinstance(data, dict) else data
+
+
 def _detect_gpus_windows_ps() -> list[GPUInfo]:
     """Use PowerShell on Windows 11+ to detect GPU VRAM (fallback when wmic is absent)."""
-    import json as _json
     gpus = []
     try:
-        result = subprocess.run(
-            [
-                "powershell", "-Command",
-                "Get-CimInstance Win32_VideoController"
-                " | Select-Object Name, AdapterRAM"
-                " | ConvertTo-Json",
-            ],
-            capture_output=True, text=True, timeout=15, shell=False,
-        )
-        data = _json.loads(result.stdout.strip())
-        # PowerShell returns a single object if only one GPU, or a list
-        if isinstance(data, dict):
-            data = [data]
-        for item in data:
+        for item in _cim_items("gpu"):
             name = item.get("Name", "Unknown GPU")
             vram_bytes = item.get("AdapterRAM", 0) or 0
             if vram_bytes > 0:
@@ -198,49 +406,124 @@ def _detect_gpus_windows_ps() -> list[GPUInfo]:
     return gpus
 
 
+_CPUINFO_HEAD_BYTES = 16384
+
+
+def _cpuinfo_field(data: bytes, key: bytes) -> str | None:
+    """Value of the first ``key : value`` line in /proc/cpuinfo data."""
+    _, found, rest = data.partition(b"\n" + key)
+    if not found and data.startswith(key):
+        rest = data[len(key):]
+    elif not found:
+        return None
+    line = rest.split(b"\n", 1)[0]
+    _, colon, value = line.partition(b":")
+    return value.strip().decode(errors="replace") if colon else None
+
+
+def _usable_cpu_count() -> int:
+    """Logical CPUs this process may run on.
+
+    On Linux the affinity mask reflects cpusets (Docker --cpuset-cpus,
+    Kubernetes, SLURM), which os.cpu_count() ignores.
+    """
+    try:
+        return len(os.sched_getaffinity(0)) or 1
+    except (AttributeError, OSError):
+        return os.cpu_count() or 1
+
+
 def _detect_cpu_linux() -> tuple[str, int, int]:
-    name, cores, threads = "Unknown CPU", 1, 1
+    name, cores, threads = "Unknown CPU", 0, _usable_cpu_count()
+    try:
+        import psutil
+        cores = psutil.cpu_count(logical=False) or 0
+    except ImportError:
+        pass
     try:
-        import multiprocessing
-        threads = multiprocessing.cpu_count()
-        with open("/proc/cpuinfo") as f:
-            for line in f:
-                if line.startswith("model name"):
-                    name = line.split(":", 1)[1].strip()
-                if line.startswith("cpu cores"):
-                    cores = int(line.split(":", 1)[1].strip())
+        # /proc/cpuinfo repeats every field per logical CPU (it can be ~1 MB on
+        # large servers); the first CPU's block fits in one bounded read.
+        with open("/proc/cpuinfo", "rb") as f:
+            head = f.read(_CPUINFO_HEAD_BYTES)
+        name = _cpuinfo_field(head, b"model name") or name
+        if not cores:
+            cores = int(_cpuinfo_field(head, b"cpu cores") or 0)
     except Exception:
         pass
-    return name, cores, threads
+    # A cpuset smaller than the machine still reports every physical core
+    return name, min(cores, threads) or 1, threads
 
 
 def _detect_cpu_macos() -> tuple[str, int, int]:
-    import multiprocessing
-    name, cores, threads = "Unknown CPU", 1, multiprocessing.cpu_count()
+    name, cores, threads = "Unknown CPU", 1, _usable_cpu_count()
     try:
-        result = subprocess.run(["sysctl", "-n", "machdep.cpu.brand_string"],
-                                capture_output=True, text=True, timeout=5)
-        name = result.stdout.strip() or name
-        result2 = subprocess.run(["sysctl", "-n", "hw.physicalcpu"],
-                                 capture_output=True, text=True, timeout=5)
-        cores = int(result2.stdout.strip()) if result2.stdout.strip() else threads
+        sysctl = _darwin_sysctl()
+        name = sysctl.get("machdep.cpu.brand_string") or name
+        physical = sysctl.get("hw.physicalcpu")
+        cores = int(physical) if physical else threads
     except Exception:
         pass
     return name, cores, threads
 
 
+def _windows_cpu_name_registry() -> str | None:
+    """CPU name from the registry, which Windows fills in at boot; None if unavailable."""
+    try:
+        import winreg
+        with winreg.OpenKey(
+            winreg.HKEY_LOCAL_MACHINE, r"HARDWARE\DESCRIPTION\System\CentralProcessor\0",
+        ) as key:
+            name, _ = winreg.QueryValueEx(key, "ProcessorNameString")
+        return name.strip() or None
+    except Exception:
+        return None
+
+
+def _windows_ram_ctypes() -> float:
+    """Total RAM in GB from kernel32's GlobalMemoryStatusEx, or 0.0 if unavailable."""
+    try:
+        import ctypes
+
+        class MEMORYSTATUSEX(ctypes.Structure):
+            _fields_ = [
+                ("dwLength", ctypes.c_ulong),
+                ("dwMemoryLoad", ctypes.c_ulong),
+                ("ullTotalPhys", ctypes.c_ulonglong),
+                ("ullAvailPhys", ctypes.c_ulonglong),
+                ("ullTotalPageFile", ctypes.c_ulonglong),
+                ("ullAvailPageFile", ctypes.c_ulonglong),
+                ("ullTotalVirtual", ctypes.c_ulonglong),
+                ("ullAvailVirtual", ctypes.c_ulonglong),
+                ("ullAvailExtendedVirtual", ctypes.c_ulonglong),
+            ]
+
+        status = MEMORYSTATUSEX()
+        status.dwLength = ctypes.sizeof(MEMORYSTATUSEX)
+        if ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(status)):
+            return round(status.ullTotalPhys / (1024 ** 3), 1)
+    except Exception:
+        pass
+    return 0.0
+
+
 def _detect_cpu_windows() -> tuple[str, int, int]:
-    import multiprocessing
-    name, cores, threads = "Unknown CPU", 1, multiprocessing.cpu_count()
+    name, cores, threads = "Unknown CPU", 1, _usable_cpu_count()
 
-    if shutil.which("wmic"):
+    # Registry name plus psutil counts: no wmic or PowerShell process needed
+    registry_name = _windows_cpu_name_registry()
+    if registry_name:
+        try:
+            import psutil
+            physical = psutil.cpu_count(logical=False)
+            if physical:
+                return registry_name, physical, psutil.cpu_count(logical=True) or threads
+        except ImportError:
+            pass
+
+    if _which("wmic"):
         try:
             result = subprocess.run(
-                [
-                    "wmic", "cpu", "get",
-                    "Name,NumberOfCores,NumberOfLogicalProcessors",
-                    "/format:csv",
-                ],
+                _WMIC_CPU_ARGV,
                 capture_output=True, text=True, timeout=10, shell=False
             )
             for line in result.stdout.strip().splitlines():
@@ -263,24 +546,9 @@ def _detect_cpu_windows() -> tuple[str, int, int]:
 
 def _detect_cpu_windows_ps() -> tuple[str, int, int]:
     """Use PowerShell to detect CPU (fallback when wmic is absent)."""
-    import json as _json
-    import multiprocessing
-    name, cores, threads = "Unknown CPU", 1, multiprocessing.cpu_count()
+    name, cores, threads = "Unknown CPU", 1, _usable_cpu_count()
     try:
-        result = subprocess.run(
-            [
-                "powershell", "-Command",
-                "Get-CimInstance Win32_Processor"
-                " | Select-Object Name, NumberOfCores,"
-                " NumberOfLogicalProcessors"
-                " | ConvertTo-Json",
-            ],
-            capture_output=True, text=True, timeout=15, shell=False,
-        )
-        data = _json.loads(result.stdout.strip())
-        if isinstance(data, dict):
-            data = [data]
-        item = data[0]
+        item = _cim_items("cpu")[0]
         name = item.get("Name", name)
         cores = item.get("NumberOfCores", cores) or cores
         threads = item.get("NumberOfLogicalProcessors", threads) or threads
@@ -298,19 +566,21 @@ def _detect_ram_gb() -> float:
     os_name = platform.system()
     try:
         if os_name == "Linux":
-            with open("/proc/meminfo") as f:
-                for line in f:
-                    if line.startswith("MemTotal"):
-                        kb = int(line.split()[1])
-                        return round(kb / (1024 ** 2), 1)
+            # One read of the whole (small) file; MemTotal is normally the first line
+            with open("/proc/meminfo", "rb") as f:
+                _, found, rest = f.read().partition(b"MemTotal:")
+            if found:
+                kb = int(rest.split(None, 1)[0])
+                return round(kb / (1024 ** 2), 1)
         elif os_name == "Darwin":
-            result = subprocess.run(["sysctl", "-n", "hw.memsize"],
-                                    capture_output=True, text=True, timeout=5)
-            return round(int(result.stdout.strip()) / (1024 ** 3), 1)
+            return round(int(_darwin_sysctl()["hw.memsize"]) / (1024 ** 3), 1)
         elif os_name == "Windows":
-            if shutil.which("wmic"):
+            ram_gb = _windows_ram_ctypes()
+            if ram_gb:
+                return ram_gb
+            if _which("wmic"):
                 result = subprocess.run(
-                    ["wmic", "computersystem", "get", "TotalPhysicalMemory", "/format:csv"],
+                    _WMIC_RAM_ARGV,
                     capture_output=True, text=True, timeout=10, shell=False
                 )
                 for line in result.stdout.strip().splitlines():
@@ -326,46 +596,43 @@ def _detect_ram_gb() -> float:
 
 def _detect_ram_windows_ps() -> float:
     """Use PowerShell to detect RAM (fallback when wmic is absent)."""
-    import json as _json
     try:
-        result = subprocess.run(
-            [
-                "powershell", "-Command",
-                "Get-CimInstance Win32_ComputerSystem"
-                " | Select-Object TotalPhysicalMemory"
-                " | ConvertTo-Json",
-            ],
-            capture_output=True, text=True, timeout=15, shell=False,
-        )
-        data = _json.loads(result.stdout.strip())
-        if isinstance(data, dict):
-            total = data.get("TotalPhysicalMemory", 0)
-            if total:
-                return round(int(total) / (1024 ** 3), 1)
+        items = _cim_items("ram")
+        total = items[0].get("TotalPhysicalMemory", 0) if items else 0
+        if total:
+            return round(int(total) / (1024 ** 3), 1)
     except Exception:
         pass
     return 0.0
 
 
+@lru_cache(maxsize=1)
 def detect_hardware() -> HardwareProfile:
+    """Probe CPU, RAM and GPUs; memoized for the process (see refresh_hardware)."""
+    from concurrent.futures import ThreadPoolExecutor
+
     os_name = platform.system()
 
-    # CPU
     if os_name == "Linux":
-        cpu_name, cpu_cores, cpu_threads = _detect_cpu_linux()
+        detect_cpu = _detect_cpu_linux
     elif os_name == "Darwin":
-        cpu_name, cpu_cores, cpu_threads = _detect_cpu_macos()
+        detect_cpu = _detect_cpu_macos
     else:
-        cpu_name, cpu_cores, cpu_threads = _detect_cpu_windows()
-
-    # RAM
-    ram_gb = _detect_ram_gb()
-
-    # Apple Silicon unified memory detection
-    unified = _is_apple_silicon()
-
-    # GPUs
-    gpus = _detect_gpus_nvidia()
+        detect_cpu = _detect_cpu_windows
+
+    # The probes are independent and mostly wait on subprocesses, so run them
+    # side by side: wall time is the slowest probe rather than the sum.
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        cpu_future = pool.submit(detect_cpu)
+        ram_future = pool.submit(_detect_ram_gb)
+        unified_future = pool.submit(_is_apple_silicon)
+        nvidia_future = pool.submit(_detect_gpus_nvidia)
+        cpu_name, cpu_cores, cpu_threads = cpu_future.result()
+        ram_gb = ram_future.result()
+        unified = unified_future.result()
+        gpus = nvidia_future.result()
+
+    # Fallback GPU probes depend on the results above
     if not gpus:
         if os_name == "Darwin":
             if unified:
@@ -377,7 +644,7 @@ def detect_hardware() -> HardwareProfile:
         elif os_name == "Linux":
             gpus = _detect_gpus_amd_linux()
         elif os_name == "Windows":
-            if shutil.which("wmic"):
+            if _which("wmic"):
                 gpus = _detect_gpus_windows_wmi()
             else:
                 gpus = _detect_gpus_windows_ps()
@@ -391,3 +658,88 @@ def detect_hardware() -> HardwareProfile:
         gpus=gpus,
         is_unified_memory=unified,
     )
+
+
+HW_CACHE_MAX_AGE_HOURS = 24
+
+
+def _get_hw_cache_path() -> str:
+    from .config import CONFIG_PATH
+    return os.path.join(os.path.dirname(CONFIG_PATH), "hardware_cache.json")
+
+
+def _hw_fingerprint() -> dict:
+    """Identify the machine so a cache is never reused on another host.
+
+    CPU count and PCI vendor IDs are included so swapping a CPU or adding a
+    GPU card also invalidates the cache.
+    """
+    return {
+        "node": platform.node(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "pci_vendors": sorted(_pci_vendors() or ()),
+    }
+
+
+def _load_hw_cache(max_age_hours: float = HW_CACHE_MAX_AGE_HOURS) -> HardwareProfile | None:
+    """Load a cached HardwareProfile if fresh and from this machine, else None."""
+    path = _get_hw_cache_path()
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+        detected_at = datetime.fromisoformat(cache["detected_at"])
+        age_hours = (datetime.now(timezone.utc) - detected_at).total_seconds() / 3600
+        if age_hours > max_age_hours:
+            return None
+        if cache.get("fingerprint") != _hw_fingerprint():
+            return None
+        data = dict(cache["hardware"])
+        data["gpus"] = [GPUInfo(**g) for g in data.get("gpus", [])]
+        return HardwareProfile(**data)
+    except (json.JSONDecodeError, KeyError, OSError, TypeError, ValueError):
+        return None
+
+
+def _save_hw_cache(hw: HardwareProfile) -> None:
+    """Write the detected profile to the cache file atomically."""
+    path = _get_hw_cache_path()
+    tmp = path + ".tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({
+                "detected_at": datetime.now(timezone.utc).isoformat(),
+                "fingerprint": _hw_fingerprint(),
+                "hardware": asdict(hw),
+            }, f)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def refresh_hardware() -> HardwareProfile:
+    """Drop the in-process detect_hardware() result and probe again."""
+    detect_hardware.cache_clear()
+    return detect_hardware()
+
+
+def cached_detect_hardware(
+    force: bool = False,
+    max_age_hours: float = HW_CACHE_MAX_AGE_HOURS,
+) -> HardwareProfile:
+    """Return the cached hardware profile, running detect_hardware() on a miss.
+
+    Set force=True to bypass both the disk and in-process caches and re-probe.
+    """
+    if force:
+        hw = refresh_hardware()
+    else:
+        hw = _load_hw_cache(max_age_hours)
+        if hw is not None:
+            return hw
+        hw = detect_hardware()
+    _save_hw_cache(hw)
+    return hw
@@ -3,13 +3,15 @@ interactive.py - Interactive guided session for ollama-scout.
 """
 import os
 import sys
+import threading
+from concurrent.futures import Future
 
 from rich.panel import Panel
 from rich.text import Text
 
-from .benchmark import benchmark_pulled_models
 from .display import (
     console,
+    download_progress,
     print_benchmark,
     print_error,
     print_footer,
@@ -20,19 +22,66 @@ from .display import (
     print_recommendations_flat,
     print_recommendations_grouped,
     print_success,
-    spinner,
+    wait_with_spinner,
 )
 from .exporter import export_markdown
-from .hardware import detect_hardware
+from .hardware import HW_CACHE_MAX_AGE_HOURS, cached_detect_hardware
 from .ollama_api import (
+    CACHE_MAX_AGE_HOURS,
     check_ollama_installed,
     fetch_ollama_models,
     get_fallback_models,
     get_pulled_models,
+    load_cached_models,
     pull_model,
+    pull_model_stream,
 )
 from .recommender import get_recommendations, group_by_use_case
 
+
+def _pull_with_progress(model_name: str) -> None:
+    """Pull through the Ollama server with a progress bar; `ollama pull` if it is down."""
+    try:
+        with download_progress() as progress:
+            task = progress.add_task("Connecting...", total=None)
+            for event in pull_model_stream(model_name):
+                progress.update(
+                    task, description=event.status,
+                    completed=event.completed, total=event.total,
+                )
+    except ConnectionError:
+        pull_model(model_name)
+
+
+def _completed(result) -> Future:
+    future = Future()
+    future.set_result(result)
+    return future
+
+
+class _BackgroundTasks:
+    """Runs each submitted call on its own daemon thread.
+
+    Unlike ThreadPoolExecutor, whose workers are joined at interpreter exit,
+    an abandoned call (e.g. the library fetch when the user hits Ctrl+C at a
+    prompt) never holds up the exit.
+    """
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        future = Future()
+
+        def run():
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except BaseException as e:
+                future.set_exception(e)
+
+        threading.Thread(target=run, daemon=True).start()
+        return future
+
+
 USE_CASE_MENU = {
     "1": ("all", "All categories", "Show all compatible models across every use case"),
     "2": ("coding", "💻 Coding", "Code generation, completion, and debugging"),
@@ -56,6 +105,18 @@ def _sep():
 class InteractiveSession:
     """Guided interactive session for non-developer users."""
 
+    def __init__(
+        self,
+        refresh_hw: bool = False,
+        hw_cache_ttl_hours: float = HW_CACHE_MAX_AGE_HOURS,
+        models_cache_ttl_hours: float = CACHE_MAX_AGE_HOURS,
+        offline: bool = False,
+    ):
+        self.refresh_hw = refresh_hw
+        self.hw_cache_ttl_hours = hw_cache_ttl_hours
+        self.models_cache_ttl_hours = models_cache_ttl_hours
+        self.offline = offline
+
     def run(self):
         try:
             self._run_steps()
@@ -71,15 +132,20 @@ class InteractiveSession:
         self._step_welcome(ollama_installed, ollama_version)
         _sep()
 
+        # `ollama list` runs in the background while hardware is probed and
+        # the user answers the prompts; so does the model fetch once accepted.
+        pool = _BackgroundTasks()
+        pulled_future = pool.submit(get_pulled_models)
+
         # Step 2 — Hardware scan
         hw = self._step_hardware_scan()
         _sep()
 
         # Step 3 — Connection check
-        models = self._step_fetch_models()
+        models_future = self._step_fetch_models(pool)
 
         # Detect pulled models
-        pulled = get_pulled_models()
+        pulled = pulled_future.result()
         if pulled:
             names = ", ".join(pulled[:5])
             suffix = "..." if len(pulled) > 5 else ""
@@ -96,6 +162,8 @@ class InteractiveSession:
         # Step 5 — Results count
         top_n = self._step_results_count()
 
+        models = self._collect_models(models_future)
+
         # Step 6 — Show recommendations
         recs = get_recommendations(
             models=models, hw=hw,
@@ -170,23 +238,23 @@ class InteractiveSession:
         )
         banner.append("(Interactive Mode)", style="dim cyan italic")
         console.print(Panel(banner, border_style="cyan", padding=(0, 2)))
-        console.print()
-        console.print(
-            "[bold]Welcome![/bold] Let's find the best LLMs for your hardware."
-        )
-        console.print(
-            "[dim]We'll scan your system, filter compatible models, "
-            "and guide you through the rest.[/dim]"
-        )
-        console.print()
         if ollama_installed:
-            console.print(f"[dim]Ollama detected: {ollama_version}[/dim]")
+            ollama_line = f"[dim]Ollama detected: {ollama_version}[/dim]"
         else:
-            console.print(
+            ollama_line = (
                 "[yellow]Ollama not found.[/yellow] "
                 "Recommendations will still work, but pulling models requires Ollama."
             )
-        console.print()
+        # One print for the whole block rather than one per line
+        console.print("\n".join([
+            "",
+            "[bold]Welcome![/bold] Let's find the best LLMs for your hardware.",
+            "[dim]We'll scan your system, filter compatible models, "
+            "and guide you through the rest.[/dim]",
+            "",
+            ollama_line,
+            "",
+        ]))
         console.input(
             "[dim]Press Enter to scan your system, "
             "or Ctrl+C to exit.[/dim] "
@@ -194,16 +262,16 @@ class InteractiveSession:
         console.print()
 
     def _step_hardware_scan(self):
-        with spinner("Detecting GPU, CPU, and RAM configuration...") as p:
-            p.add_task("")
-            p.start()
-            try:
-                hw = detect_hardware()
-            except Exception as e:
-                p.stop()
-                print_error(f"Hardware detection failed: {e}")
-                sys.exit(1)
-            p.stop()
+        hw_future = _BackgroundTasks().submit(
+            cached_detect_hardware,
+            force=self.refresh_hw, max_age_hours=self.hw_cache_ttl_hours,
+        )
+        wait_with_spinner("Detecting GPU, CPU, and RAM configuration...", [hw_future])
+        try:
+            hw = hw_future.result()
+        except Exception as e:
+            print_error(f"Hardware detection failed: {e}")
+            sys.exit(1)
 
         print_hardware_summary(hw)
 
@@ -229,29 +297,41 @@ class InteractiveSession:
 
         return hw
 
-    def _step_fetch_models(self):
+    def _step_fetch_models(self, pool: _BackgroundTasks) -> Future:
+        """Ask where models come from; returns a Future for the model list.
+
+        An accepted fetch runs on ``pool`` so it overlaps the next prompts.
+        """
+        if self.offline:
+            cached = load_cached_models(limit=100)
+            if cached:
+                print_info("Offline mode: using the cached model list.")
+                return _completed(cached)
+            print_info("Offline mode: using built-in fallback model list.")
+            return _completed(get_fallback_models())
         answer = console.input(
             "[bold yellow]Fetch latest models from Ollama library? "
             "(requires internet) \\[Y/n]:[/bold yellow] "
         ).strip().lower()
-
         if answer in ("n", "no"):
             print_info("Using built-in fallback model list.")
+            return _completed(get_fallback_models())
+        return pool.submit(
+            fetch_ollama_models, limit=100, max_age_hours=self.models_cache_ttl_hours,
+        )
+
+    @staticmethod
+    def _collect_models(models_future: Future) -> list:
+        """Wait for the model list from _step_fetch_models (with a spinner if needed)."""
+        wait_with_spinner("Fetching latest models...", [models_future])
+        try:
+            models = models_future.result()
+        except Exception:
+            print_info(
+                "Could not reach Ollama API. "
+                "Using built-in fallback list."
+            )
             models = get_fallback_models()
-        else:
-            with spinner("Fetching latest models...") as p:
-                p.start()
-                try:
-                    models = fetch_ollama_models(limit=100)
-                except Exception:
-                    p.stop()
-                    print_info(
-                        "Could not reach Ollama API. "
-                        "Using built-in fallback list."
-                    )
-                    models = get_fallback_models()
-                else:
-                    p.stop()
 
         print_info(f"Loaded [bold]{len(models)}[/bold] models for analysis.")
         console.print()
@@ -320,24 +400,15 @@ class InteractiveSession:
             print_error("Both model names are required.")
             return
 
-        from .recommender import _score_variant
+        from .recommender import best_variant, find_model, index_models
+
+        name_index, sorted_names = index_models(models)
 
         def _build_detail(name):
-            target = name.lower()
-            matched = [m for m in models if m.name.lower() == target]
-            if not matched:
-                matched = [
-                    m for m in models
-                    if m.name.lower().startswith(target)
-                ]
-            if not matched:
+            model = find_model(name_index, sorted_names, name)
+            if model is None:
                 return None
-            model = matched[0]
-            best_score, best_v, best_fit, best_mode = -1, None, None, None
-            for v in model.tags:
-                sc, fl, rm, _ = _score_variant(v, hw)
-                if sc > best_score:
-                    best_score, best_v, best_fit, best_mode = sc, v, fl, rm
+            best_score, best_v, best_fit, best_mode = best_variant(model.tags, hw)
             return {
                 "name": model.name,
                 "description": model.description,
@@ -376,7 +447,9 @@ class InteractiveSession:
             )
             return
         print_info("Running real benchmarks on pulled models...")
-        estimates = benchmark_pulled_models(pulled, hw)
+        from .benchmark import benchmark_pulled_models
+
+        estimates = benchmark_pulled_models(pulled, hw, pulled_base=frozenset(pulled))
         if estimates:
             print_benchmark(estimates)
         else:
@@ -409,24 +482,23 @@ class InteractiveSession:
     @staticmethod
     def _step_pull(recs) -> str | None:
         """Show pull menu and pull selected model. Returns pulled model name or None."""
-        console.print()
-        console.print("[bold yellow]Pull a recommended model?[/bold yellow]")
-        console.print(
+        lines = [
+            "",
+            "[bold yellow]Pull a recommended model?[/bold yellow]",
             "[dim]You can run any pulled model with "
-            "[bold]ollama run MODEL[/bold][/dim]"
-        )
-        console.print()
+            "[bold]ollama run MODEL[/bold][/dim]",
+            "",
+        ]
         for i, rec in enumerate(recs[:10], 1):
             pulled_tag = (
                 " [green](already pulled)[/green]"
                 if rec.model.pulled else ""
             )
             label = f"{rec.model.name}:{rec.variant.tag}"
-            console.print(
-                f"  [dim]{i}.[/dim] [white]{label}[/white]{pulled_tag}"
-            )
-        console.print(f"  [dim]{0}.[/dim] Skip")
-        console.print()
+            lines.append(f"  [dim]{i}.[/dim] [white]{label}[/white]{pulled_tag}")
+        lines.append("  [dim]0.[/dim] Skip")
+        lines.append("")
+        console.print("\n".join(lines))
 
         choice = console.input("[bold]Enter number:[/bold] ").strip()
         if choice == "0" or not choice:
@@ -438,7 +510,7 @@ class InteractiveSession:
                 model_name = f"{recs[idx].model.name}:{recs[idx].variant.tag}"
                 print_info(f"Pulling [bold]{model_name}[/bold]...")
                 try:
-                    pull_model(model_name)
+                    _pull_with_progress(model_name)
                     print_success(f"Successfully pulled {model_name}")
                     console.print(
                         f"[dim]Run it now: [bold]ollama run {model_name}[/bold][/dim]"
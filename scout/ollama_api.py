@@ -6,17 +6,53 @@ import os
 import re
 import shutil
 import subprocess
-from dataclasses import dataclass, field
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
-import requests
+if TYPE_CHECKING:
+    import requests
 
 OLLAMA_API_URL = "https://ollama.com/api/tags"
+OLLAMA_PULL_URL = "http://localhost:11434/api/pull"
+OLLAMA_LOCAL_TAGS_URL = "http://localhost:11434/api/tags"
 
 REQUEST_TIMEOUT = 15
+# Connect quickly; allow a long wait between progress events while layers verify
+PULL_TIMEOUT = (3, 300)
+# The local server answers at once when it is up; don't wait long when it isn't
+LOCAL_TAGS_TIMEOUT = 2
 
 
-@dataclass
+@lru_cache(maxsize=1)
+def _session() -> "requests.Session":
+    """Shared session, so repeated fetches in one process reuse the TLS connection.
+
+    Built on first use: importing requests is the slowest part of loading this
+    module, and cached or offline runs never need it.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    session.headers.update({"Accept": "application/json"})
+    # One quick retry when the library answers with a transient server error
+    session.mount("https://", HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=1,
+        max_retries=Retry(
+            total=1, backoff_factor=0.3,
+            status_forcelist=(500, 502, 503, 504), raise_on_status=False,
+        ),
+    ))
+    return session
+
+
+@dataclass(slots=True)
 class ModelVariant:
     tag: str           # e.g. "7b-q4_0"
     size_gb: float
@@ -24,7 +60,7 @@ class ModelVariant:
     param_size: str    # e.g. "7B", "13B"
 
 
-@dataclass
+@dataclass(slots=True)
 class OllamaModel:
     name: str
     description: str
@@ -33,6 +69,13 @@ class OllamaModel:
     pulled: bool = False
 
 
+@dataclass
+class PullProgress:
+    status: str                # e.g. "pulling manifest", "pulling 6a0746a1ec1a", "success"
+    completed: int = 0         # bytes of the current layer downloaded so far
+    total: int | None = None   # layer size in bytes; None for steps without a download
+
+
 # Static use-case mapping since Ollama API doesn't categorize by use case
 USE_CASE_MAP: dict[str, list[str]] = {
     "coding": [
@@ -178,23 +221,28 @@ FALLBACK_MODELS: list[dict] = [
 ]
 
 
+# One alternation per use case, so each lookup is a single C-level scan
+# instead of a Python loop over every pattern
+_USE_CASE_PATTERNS = tuple(
+    (use_case, re.compile("|".join(map(re.escape, patterns))))
+    for use_case, patterns in USE_CASE_MAP.items()
+)
+
+
 def _infer_use_cases(model_name: str) -> list[str]:
     name_lower = model_name.lower()
-    cases = []
-    for use_case, patterns in USE_CASE_MAP.items():
-        if any(p in name_lower for p in patterns):
-            cases.append(use_case)
+    cases = [use_case for use_case, pattern in _USE_CASE_PATTERNS if pattern.search(name_lower)]
     return cases if cases else ["chat"]
 
 
 def _generate_description(model_name: str, use_cases: list[str]) -> str:
     """Generate a description from known model families or use cases."""
-    # Try exact match first, then prefix match
+    # Longest known family that prefixes the name, so "llama3.2-vision" finds
+    # "llama3.2" rather than "llama"; an exact match is simply the longest prefix
     name_lower = model_name.lower()
-    if name_lower in _MODEL_DESCRIPTIONS:
-        return _MODEL_DESCRIPTIONS[name_lower]
-    for key, desc in _MODEL_DESCRIPTIONS.items():
-        if name_lower.startswith(key):
+    for end in range(len(name_lower), 0, -1):
+        desc = _MODEL_DESCRIPTIONS.get(name_lower[:end])
+        if desc:
             return desc
 
     # Fall back to use-case description
@@ -207,12 +255,23 @@ def _generate_description(model_name: str, use_cases: list[str]) -> str:
     return f"{model_name} model from Ollama library"
 
 
+_QUANTIZATIONS = (
+    "q2_k", "q3_k", "q4_0", "q4_k_m", "q4_k_s", "q5_0", "q5_k_m",
+    "q6_k", "q8_0", "f16", "fp16", "f32",
+)
+# Longest alternatives first so "q4_k_m" is never cut short by a shorter prefix
+_QUANT_RE = re.compile(
+    "|".join(sorted(_QUANTIZATIONS, key=len, reverse=True)), re.IGNORECASE
+)
+# Parameter count in a tag or name, e.g. the "7" in "7b-q4_0" or "1.5" in "1.5B"
+_PARAM_SIZE_RE = re.compile(r"(\d+\.?\d*)[bB]")
+
+
 def _parse_quantization(tag: str) -> str:
+    match = _QUANT_RE.search(tag)
+    if match:
+        return match.group(0).upper()
     tag_lower = tag.lower()
-    for q in ["q2_k", "q3_k", "q4_0", "q4_k_m", "q4_k_s", "q5_0", "q5_k_m",
-              "q6_k", "q8_0", "f16", "fp16", "f32"]:
-        if q in tag_lower:
-            return q.upper()
     if "instruct" in tag_lower or "chat" in tag_lower:
         return "Q4_K_M"
     return "Q4_0"
@@ -220,7 +279,7 @@ def _parse_quantization(tag: str) -> str:
 
 def _parse_param_size(text: str) -> str:
     """Extract parameter size from a tag or name string like 'llama3.2:7b' -> '7B'."""
-    match = re.search(r"(\d+\.?\d*)[bB]", text)
+    match = _PARAM_SIZE_RE.search(text)
     if match:
         return f"{match.group(1)}B"
     return "?"
@@ -239,7 +298,7 @@ def _parse_param_size_from_name_and_tag(name: str, tag: str) -> str:
 
 def _estimate_size(tag: str) -> float:
     """Rough size estimate based on tag string."""
-    match = re.search(r"(\d+\.?\d*)[bB]", tag)
+    match = _PARAM_SIZE_RE.search(tag)
     if match:
         params = float(match.group(1))
         # Q4 ≈ params * 0.55 GB roughly
@@ -294,8 +353,8 @@ def _get_cache_path() -> str:
     return os.path.join(os.path.dirname(CONFIG_PATH), "models_cache.json")
 
 
-def _load_cache() -> list[dict] | None:
-    """Load cached API data if fresh (< 24h old). Returns raw items or None."""
+def _load_cache(max_age_hours: float = CACHE_MAX_AGE_HOURS) -> list[dict] | None:
+    """Load cached API data if younger than max_age_hours. Returns raw items or None."""
     path = _get_cache_path()
     if not os.path.exists(path):
         return None
@@ -304,7 +363,7 @@ def _load_cache() -> list[dict] | None:
             cache = json.load(f)
         fetched_at = datetime.fromisoformat(cache["fetched_at"])
         age_hours = (datetime.now(timezone.utc) - fetched_at).total_seconds() / 3600
-        if age_hours > CACHE_MAX_AGE_HOURS:
+        if age_hours > max_age_hours:
             return None
         return cache.get("models", [])
     except (json.JSONDecodeError, KeyError, OSError, ValueError):
@@ -312,26 +371,30 @@ def _load_cache() -> list[dict] | None:
 
 
 def _save_cache(raw_items: list[dict]) -> None:
-    """Save raw API data to cache."""
+    """Save raw API data to cache atomically."""
     path = _get_cache_path()
+    tmp = path + ".tmp"
+    payload = json.dumps({
+        "fetched_at": datetime.now(timezone.utc).isoformat(),
+        "models": raw_items,
+    })
     try:
         os.makedirs(os.path.dirname(path), exist_ok=True)
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump({
-                "fetched_at": datetime.now(timezone.utc).isoformat(),
-                "models": raw_items,
-            }, f)
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(payload)
+        os.replace(tmp, path)
     except OSError:
         pass
 
 
-def is_cache_stale() -> bool:
-    """Check if the model cache is missing or older than 24 hours."""
-    return _load_cache() is None
+def is_cache_stale(max_age_hours: float = CACHE_MAX_AGE_HOURS) -> bool:
+    """Check if the model cache is missing or older than max_age_hours."""
+    return _load_cache(max_age_hours) is None
 
 
-def get_fallback_models() -> list[OllamaModel]:
-    """Return hardcoded fallback models for offline mode."""
+@lru_cache(maxsize=1)
+def _build_fallback_models() -> tuple[OllamaModel, ...]:
+    """Build the grouped fallback models once per process."""
     models = []
     for entry in FALLBACK_MODELS:
         tag = entry["param_size"].lower().rstrip("b") + "b"
@@ -347,53 +410,27 @@ def get_fallback_models() -> list[OllamaModel]:
             tags=[variant],
             use_cases=_infer_use_cases(entry["name"]),
         ))
-    return _group_models(models)
+    return tuple(_group_models(models))
 
 
-def fetch_ollama_models(limit: int = 50, force_refresh: bool = False) -> list[OllamaModel]:
-    """Fetch models from the Ollama library API with robust gap-filling.
+def get_fallback_models() -> list[OllamaModel]:
+    """Return hardcoded fallback models for offline mode.
 
-    Uses a local cache (24h TTL). Set force_refresh=True to bypass cache.
-    Falls back to cache on connection error, then to FALLBACK_MODELS.
+    Each call gets its own OllamaModel objects (callers set ``pulled``); the
+    parsing and grouping behind them is done only once.
     """
-    # Try cache first (unless forcing refresh)
-    cached_items = None if force_refresh else _load_cache()
+    return [
+        replace(m, tags=list(m.tags), use_cases=list(m.use_cases))
+        for m in _build_fallback_models()
+    ]
 
-    if cached_items is not None:
-        items = cached_items
-    else:
-        try:
-            response = requests.get(
-                OLLAMA_API_URL,
-                timeout=REQUEST_TIMEOUT,
-                headers={"Accept": "application/json"},
-            )
-            response.raise_for_status()
-            data = response.json()
-        except requests.RequestException as e:
-            # Fall back to stale cache if available
-            stale = _load_cache() if force_refresh else None
-            if stale is not None:
-                items = stale
-            else:
-                raise ConnectionError(
-                    f"Failed to fetch Ollama model list: {e}\n"
-                    "  Hint: use --offline to skip the live fetch "
-                    "and use built-in fallback models."
-                )
-        else:
-            # The /api/tags endpoint returns {"models": [...]}
-            items = data.get("models", []) if isinstance(data, dict) else data
-            if items:
-                _save_cache(items)
 
+def _models_from_items(items: list[dict], limit: int) -> list[OllamaModel]:
+    """Build grouped OllamaModels from raw /api/tags items, keeping at most `limit`."""
     models = []
-
-    if not items:
-        raise ConnectionError(
-            "Ollama API returned an empty model list. "
-            "Use --offline to use built-in fallback models."
-        )
+    # Base names kept so far; once there are `limit` of them, items for new
+    # names would only be cut off after grouping, so they are skipped unparsed
+    kept_names: set[str] = set()
 
     for item in items:
         name_raw = item.get("name", "")
@@ -406,6 +443,11 @@ def fetch_ollama_models(limit: int = 50, force_refresh: bool = False) -> list[Ol
         else:
             base_name, tag_str = name_raw, "latest"
 
+        if base_name not in kept_names:
+            if len(kept_names) >= limit:
+                continue
+            kept_names.add(base_name)
+
         use_cases = _infer_use_cases(base_name)
 
         # Description: API returns none, so generate from known families
@@ -439,7 +481,71 @@ def fetch_ollama_models(limit: int = 50, force_refresh: bool = False) -> list[Ol
             use_cases=use_cases,
         ))
 
-    return _group_models(models)[:limit]
+    return _group_models(models)
+
+
+def load_cached_models(limit: int = 50) -> list[OllamaModel] | None:
+    """The cached library model list, however old, or None if there is no cache.
+
+    Never touches the network, so offline mode can still offer the full
+    catalogue from the last successful fetch.
+    """
+    items = _load_cache(max_age_hours=float("inf"))
+    if not items:
+        return None
+    return _models_from_items(items, limit)
+
+
+def fetch_ollama_models(
+    limit: int = 50,
+    force_refresh: bool = False,
+    max_age_hours: float = CACHE_MAX_AGE_HOURS,
+) -> list[OllamaModel]:
+    """Fetch models from the Ollama library API with robust gap-filling.
+
+    Uses a local cache (max_age_hours TTL, 24h by default). Set force_refresh=True
+    to bypass cache. On a connection error any cached list is used, however old
+    (an out-of-date catalogue beats the short built-in list); with no cache at
+    all, or when force_refresh asked for a fresh list, ConnectionError is
+    raised so callers can report it or use get_fallback_models().
+    """
+    # Try cache first (unless forcing refresh)
+    cached_items = None if force_refresh else _load_cache(max_age_hours)
+
+    if cached_items is not None:
+        items = cached_items
+    else:
+        import requests
+
+        try:
+            response = _session().get(OLLAMA_API_URL, timeout=REQUEST_TIMEOUT)
+            response.raise_for_status()
+            data = response.json()
+        except requests.RequestException as e:
+            # Fall back to the cache regardless of its age, unless the caller
+            # asked for a refresh and must not be told the list was updated
+            stale = None if force_refresh else _load_cache(max_age_hours=float("inf"))
+            if stale is not None:
+                items = stale
+            else:
+                raise ConnectionError(
+                    f"Failed to fetch Ollama model list: {e}\n"
+                    "  Hint: use --offline to skip the live fetch "
+                    "and use built-in fallback models."
+                )
+        else:
+            # The /api/tags endpoint returns {"models": [...]}
+            items = data.get("models", []) if isinstance(data, dict) else data
+            if items:
+                _save_cache(items)
+
+    if not items:
+        raise ConnectionError(
+            "Ollama API returned an empty model list. "
+            "Use --offline to use built-in fallback models."
+        )
+
+    return _models_from_items(items, limit)
 
 
 def check_ollama_installed() -> tuple[bool, str]:
@@ -449,12 +555,13 @@ def check_ollama_installed() -> tuple[bool, str]:
         (True, version_string) if ollama is found and responsive
         (False, '') if ollama is not installed or not responding
     """
-    if not shutil.which("ollama"):
+    ollama = shutil.which("ollama")
+    if not ollama:
         return False, ""
     try:
         result = subprocess.run(
-            ["ollama", "--version"],
-            capture_output=True, text=True, timeout=5,
+            [ollama, "--version"],
+            capture_output=True, text=True, timeout=3, stdin=subprocess.DEVNULL,
         )
         if result.returncode == 0:
             return True, result.stdout.strip()
@@ -463,29 +570,141 @@ def check_ollama_installed() -> tuple[bool, str]:
         return False, ""
 
 
-def get_pulled_models() -> list[str]:
-    """Return list of already-pulled model names via `ollama list`."""
-    if not shutil.which("ollama"):
-        return []
+PULLED_CACHE_MAX_AGE_SECONDS = 60
+
+
+def _get_pulled_cache_path() -> str:
+    from .config import CONFIG_PATH
+    return os.path.join(os.path.dirname(CONFIG_PATH), "pulled_cache.json")
+
+
+def _load_pulled_cache() -> list[str] | None:
+    """Pulled model names saved by get_pulled_models in the last minute, or None."""
+    path = _get_pulled_cache_path()
+    try:
+        if time.time() - os.path.getmtime(path) >= PULLED_CACHE_MAX_AGE_SECONDS:
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            names = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return names if isinstance(names, list) else None
+
+
+def _save_pulled_cache(names: list[str]) -> None:
+    path = _get_pulled_cache_path()
+    tmp = path + ".tmp"
+    payload = json.dumps(names)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(payload)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def _invalidate_pulled_cache() -> None:
+    """Forget the saved `ollama list` result; called after a pull."""
+    try:
+        os.remove(_get_pulled_cache_path())
+    except OSError:
+        pass
+
+
+def _pulled_models_from_server() -> list[str] | None:
+    """Base names of the models the local Ollama server has, from its /api/tags.
+
+    Returns None if the server is not running or gives an unexpected reply.
+    """
+    import requests
+
+    try:
+        response = requests.get(OLLAMA_LOCAL_TAGS_URL, timeout=LOCAL_TAGS_TIMEOUT)
+        response.raise_for_status()
+        models = response.json().get("models", [])
+        return [m["name"].split(":")[0] for m in models]
+    except (requests.RequestException, ValueError, KeyError, TypeError, AttributeError):
+        return None
+
+
+def _pulled_models_from_cli() -> list[str] | None:
+    """Base names of the pulled models parsed from `ollama list`, or None on failure."""
     try:
         result = subprocess.run(
             ["ollama", "list"],
             capture_output=True, text=True, timeout=10
         )
-        pulled = []
-        for line in result.stdout.strip().splitlines()[1:]:  # skip header
-            parts = line.split()
-            if parts:
-                model_tag = parts[0]
-                name = model_tag.split(":")[0]
-                pulled.append(name)
-        return list(set(pulled))
     except Exception:
+        return None
+    if result.returncode != 0:
+        return None
+    pulled = []
+    for line in result.stdout.strip().splitlines()[1:]:  # skip header
+        parts = line.split()
+        if parts:
+            pulled.append(parts[0].split(":")[0])
+    return pulled
+
+
+def get_pulled_models() -> list[str]:
+    """Return list of already-pulled model names.
+
+    Asks the running Ollama server first and only spawns `ollama list` when
+    it does not answer. The result is reused for PULLED_CACHE_MAX_AGE_SECONDS
+    across runs, and dropped whenever ollama-scout pulls a model.
+    """
+    if not shutil.which("ollama"):
         return []
+    cached = _load_pulled_cache()
+    if cached is not None:
+        return cached
+    pulled = _pulled_models_from_server()
+    if pulled is None:
+        pulled = _pulled_models_from_cli()
+    if pulled is None:
+        return []
+    pulled = list(dict.fromkeys(pulled))
+    _save_pulled_cache(pulled)
+    return pulled
 
 
 def pull_model(model_name: str) -> None:
     """Run `ollama pull <model>` as a live streaming subprocess."""
     if not shutil.which("ollama"):
         raise FileNotFoundError("ollama binary not found. Is Ollama installed?")
-    subprocess.run(["ollama", "pull", model_name], check=True)
+    try:
+        subprocess.run(["ollama", "pull", model_name], check=True)
+    finally:
+        _invalidate_pulled_cache()
+
+
+def pull_model_stream(model_name: str) -> Iterator[PullProgress]:
+    """Pull a model through the local Ollama server, yielding its progress events.
+
+    Raises ConnectionError if the server is not reachable (callers can fall
+    back to pull_model) and RuntimeError if the server reports a failure.
+    """
+    import requests
+
+    payload = {"model": model_name, "stream": True}
+    try:
+        with requests.post(
+            OLLAMA_PULL_URL, json=payload, stream=True, timeout=PULL_TIMEOUT,
+        ) as response:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                event = json.loads(line)
+                if event.get("status") == "success":
+                    _invalidate_pulled_cache()
+                if "error" in event:
+                    raise RuntimeError(event["error"])
+                yield PullProgress(
+                    status=event.get("status", ""),
+                    completed=event.get("completed", 0),
+                    total=event.get("total"),
+                )
+    except requests.ConnectionError as e:
+        raise ConnectionError(f"Ollama server not reachable: {e}") from e
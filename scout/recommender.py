@@ -1,7 +1,9 @@
 """
 recommender.py - Match hardware profile to compatible Ollama models/variants.
 """
+from bisect import bisect_left
 from dataclasses import dataclass
+from operator import itemgetter
 
 from .hardware import HardwareProfile
 from .ollama_api import ModelVariant, OllamaModel
@@ -17,10 +19,38 @@ class Recommendation:
     note: str = ""
 
 
-def _score_variant(
-    variant: ModelVariant,
-    hw: HardwareProfile,
-) -> tuple[int, str, str, str]:
+@dataclass(frozen=True)
+class _HardwareLimits:
+    """Hardware figures used by scoring, resolved once per batch of variants."""
+    vram: float
+    ram: float
+    unified: bool
+    multi_gpu: bool
+    combined_vram: float
+    gpu_count: int
+    cpu_threads: int
+    usable_unified: float  # unified memory left after a 4GB macOS + apps reserve
+    usable_ram: float      # system RAM left after a 2GB OS reserve
+
+
+def _hardware_limits(hw: HardwareProfile) -> _HardwareLimits:
+    ram = hw.ram_gb
+    return _HardwareLimits(
+        vram=hw.best_vram_gb,
+        ram=ram,
+        # A GPU that only has shared system memory draws on the same pool as
+        # the CPU, so its memory must not be added on top of RAM
+        unified=hw.is_unified_memory or hw.shared_memory_only,
+        multi_gpu=hw.multi_gpu,
+        combined_vram=hw.combined_vram_gb,
+        gpu_count=len(hw.dedicated_gpus),
+        cpu_threads=hw.cpu_threads,
+        usable_unified=max(ram - 4.0, 0),
+        usable_ram=max(ram - 2.0, 0),
+    )
+
+
+def _score_size(size: float, limits: _HardwareLimits) -> tuple[int, str, str, str]:
     """
     Returns (score, fit_label, run_mode, note).
     Logic:
@@ -30,16 +60,15 @@ def _score_variant(
     - If no GPU but RAM >= model size → CPU only (slow but possible)
     - Otherwise → not recommended
     """
-    size = variant.size_gb
-    vram = hw.best_vram_gb
-    ram = hw.ram_gb
+    vram = limits.vram
+    ram = limits.ram
 
     if size == 0:
         return 0, "Unknown", "?", "Size unknown"
 
     # Apple Silicon unified memory: VRAM and RAM are the same pool
-    if hw.is_unified_memory:
-        usable = max(ram - 4.0, 0)  # reserve 4GB for macOS + apps
+    if limits.unified:
+        usable = limits.usable_unified
         if usable >= size:
             score = 100 - int(size)
             return score, "Excellent", "GPU", f"Fits in unified memory ({ram}GB total)"
@@ -53,17 +82,16 @@ def _score_variant(
         )
 
     # Discrete GPU path
-    usable_ram = max(ram - 2.0, 0)
+    usable_ram = limits.usable_ram
 
     if vram >= size:
         score = 100 - int(size)
         return score, "Excellent", "GPU", f"Fits fully in VRAM ({vram}GB)"
 
     # Multi-GPU: model doesn't fit in single GPU but fits across all GPUs
-    if hw.multi_gpu and hw.combined_vram_gb >= size:
-        n = len(hw.gpus)
+    if limits.multi_gpu and limits.combined_vram >= size:
         score = 100 - int(size)
-        return score, "Excellent", "Multi-GPU", f"Distributed across {n} GPUs"
+        return score, "Excellent", "Multi-GPU", f"Distributed across {limits.gpu_count} GPUs"
 
     if vram > 0 and (vram + usable_ram) >= size:
         offload_gb = size - vram
@@ -72,7 +100,7 @@ def _score_variant(
 
     if usable_ram >= size:
         score = 40 - int(size * 2)
-        tps = max((hw.cpu_threads / size) * 4, 0.1)
+        tps = max((limits.cpu_threads / size) * 4, 0.1)
         time_sec = round(200 / tps)
         if time_sec <= 10:
             note = "CPU-only (fast enough)"
@@ -90,6 +118,69 @@ def _score_variant(
     )
 
 
+def _score_variant(
+    variant: ModelVariant,
+    hw: HardwareProfile,
+) -> tuple[int, str, str, str]:
+    """Returns (score, fit_label, run_mode, note) for a single variant."""
+    return _score_size(variant.size_gb, _hardware_limits(hw))
+
+
+def score_variants(
+    variants: list[ModelVariant],
+    hw: HardwareProfile,
+) -> list[tuple[int, str, str, str]]:
+    """Score a batch of variants, resolving the hardware limits only once.
+
+    Returns one (score, fit_label, run_mode, note) tuple per variant, in order.
+    """
+    limits = _hardware_limits(hw)
+    return [_score_size(v.size_gb, limits) for v in variants]
+
+
+def best_variant(
+    variants: list[ModelVariant],
+    hw: HardwareProfile,
+) -> tuple[int, ModelVariant | None, str | None, str | None]:
+    """The highest-scoring variant as (score, variant, fit_label, run_mode).
+
+    Ties go to the earlier variant. Variants that cannot run (score -1) are
+    never picked; (-1, None, None, None) if no variant can run.
+    """
+    usable = (
+        (score, variant, fit_label, run_mode)
+        for variant, (score, fit_label, run_mode, _) in zip(variants, score_variants(variants, hw))
+        if score >= 0
+    )
+    return max(usable, key=itemgetter(0), default=(-1, None, None, None))
+
+
+def index_models(models: list[OllamaModel]) -> tuple[dict[str, OllamaModel], list[str]]:
+    """Index models by casefolded name; returns (index, sorted index keys)."""
+    index = {m.name.casefold(): m for m in models}
+    return index, sorted(index)
+
+
+def find_model(
+    index: dict[str, OllamaModel],
+    sorted_names: list[str],
+    name: str,
+) -> OllamaModel | None:
+    """Look up a model by exact name, falling back to the first prefix match.
+
+    The prefix fallback bisects ``sorted_names``, so ties go to the
+    alphabetically first name.
+    """
+    target = name.casefold()
+    model = index.get(target)
+    if model is not None:
+        return model
+    i = bisect_left(sorted_names, target)
+    if i < len(sorted_names) and sorted_names[i].startswith(target):
+        return index[sorted_names[i]]
+    return None
+
+
 def get_recommendations(
     models: list[OllamaModel],
     hw: HardwareProfile,
@@ -97,7 +188,8 @@ def get_recommendations(
     pulled_models: list[str] = None,
     top_n: int = 15,
 ) -> list[Recommendation]:
-    pulled_models = pulled_models or []
+    pulled_set = set(pulled_models or [])
+    limits = _hardware_limits(hw)
     recs: list[Recommendation] = []
 
     for model in models:
@@ -106,12 +198,12 @@ def get_recommendations(
             continue
 
         # Mark if already pulled
-        model.pulled = model.name in pulled_models
+        model.pulled = model.name in pulled_set
 
         # Find best compatible variant
         best: tuple[int, ModelVariant, str, str, str] | None = None
         for variant in model.tags:
-            score, fit_label, run_mode, note = _score_variant(variant, hw)
+            score, fit_label, run_mode, note = _score_size(variant.size_gb, limits)
             if score < 0:
                 continue
             if best is None or score > best[0]:
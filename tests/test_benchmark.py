@@ -1,9 +1,17 @@
 """Tests for scout.benchmark module."""
-import subprocess
-from unittest.mock import patch
+import json
+import threading
+from unittest.mock import MagicMock, patch
+
+import requests
 
 from scout.benchmark import (
     BenchmarkEstimate,
+    _benchmark_via_api,
+    _list_pulled_base_names,
+    _ollama_bin,
+    _rate,
+    _run_benchmark,
     benchmark_model,
     benchmark_pulled_models,
 )
@@ -22,140 +30,316 @@ def _make_hw(vram_gb=10.0, ram_gb=32.0, threads=16):
     )
 
 
+def _clear_caches():
+    _ollama_bin.cache_clear()
+
+
+def _fake_popen(stdout_lines, stderr="", returncode=0):
+    proc = MagicMock()
+    proc.stdout = iter(stdout_lines)
+    proc.stderr.read.return_value = stderr
+    proc.wait.return_value = returncode
+    return proc
+
+
 class TestBenchmarkModel:
+    """The `ollama run` path, taken when the Ollama server is not reachable."""
+
+    def setup_method(self):
+        _clear_caches()
+        self._api = patch(
+            "scout.benchmark._benchmark_via_api", side_effect=ConnectionError("refused"),
+        )
+        self._pulled = patch("scout.benchmark.get_pulled_models", return_value=["llama3.2"])
+        self._api.start()
+        self.mock_pulled = self._pulled.start()
+
+    def teardown_method(self):
+        self._api.stop()
+        self._pulled.stop()
+
     @patch("scout.benchmark.shutil.which", return_value=None)
     def test_returns_none_when_ollama_not_installed(self, mock_which):
         result = benchmark_model("llama3.2:latest")
         assert result is None
 
-    @patch("scout.benchmark.subprocess.run")
+    @patch("scout.benchmark.subprocess.Popen")
     @patch("scout.benchmark.shutil.which", return_value="/usr/bin/ollama")
-    def test_returns_none_when_model_not_pulled(self, mock_which, mock_run):
-        # ollama list returns output without our model
-        mock_run.return_value = subprocess.CompletedProcess(
-            args=["ollama", "list"],
-            returncode=0,
-            stdout=(
-                "NAME           ID     SIZE   MODIFIED\n"
-                "mistral:latest abc123 4.1GB  2 days ago\n"
-            ),
-        )
+    def test_returns_none_when_model_not_pulled(self, mock_which, mock_popen):
+        self.mock_pulled.return_value = ["mistral"]
         result = benchmark_model("llama3.2:latest")
         assert result is None
+        mock_popen.assert_not_called()
 
-    @patch("scout.benchmark.time.monotonic", side_effect=[0.0, 5.0])
-    @patch("scout.benchmark.subprocess.run")
+    @patch("scout.benchmark.time.monotonic", side_effect=[0.0, 2.0, 5.0])
+    @patch("scout.benchmark.subprocess.Popen")
     @patch("scout.benchmark.shutil.which", return_value="/usr/bin/ollama")
-    def test_returns_float_on_success(self, mock_which, mock_run, mock_time):
-        # First call: ollama list (model is pulled)
-        list_result = subprocess.CompletedProcess(
-            args=["ollama", "list"],
-            returncode=0,
-            stdout=(
-                "NAME             ID     SIZE   MODIFIED\n"
-                "llama3.2:latest  abc123 2.0GB  1 day ago\n"
-            ),
-        )
-        # Second call: ollama run (produces output)
-        run_result = subprocess.CompletedProcess(
-            args=["ollama", "run", "llama3.2:latest", "Hello, how are you?"],
-            returncode=0,
-            stdout="Hello! I'm doing well, thank you for asking. How can I help you today?",
-        )
-        mock_run.side_effect = [list_result, run_result]
+    def test_returns_float_on_success(self, mock_which, mock_popen, mock_time):
+        mock_popen.return_value = _fake_popen([
+            "Hello! I'm doing well, thank you for asking.\n",
+            "How can I help you today?\n",
+        ])
 
         result = benchmark_model("llama3.2:latest")
         assert isinstance(result, float)
         assert result > 0
 
-    @patch("scout.benchmark.subprocess.run")
+    @patch("scout.benchmark.time.monotonic", side_effect=[0.0, 25.0, 30.0])
+    @patch("scout.benchmark.subprocess.Popen")
     @patch("scout.benchmark.shutil.which", return_value="/usr/bin/ollama")
-    def test_returns_none_on_timeout(self, mock_which, mock_run):
-        # ollama list succeeds
-        list_result = subprocess.CompletedProcess(
-            args=["ollama", "list"],
-            returncode=0,
-            stdout=(
-                "NAME             ID     SIZE   MODIFIED\n"
-                "llama3.2:latest  abc123 2.0GB  1 day ago\n"
+    def test_prefers_verbose_eval_rate(self, mock_which, mock_popen, mock_time):
+        mock_popen.return_value = _fake_popen(
+            ["I'm fine, thanks.\n"],
+            stderr=(
+                "total duration:       30.1s\n"
+                "load duration:        25.0s\n"
+                "prompt eval rate:     120.00 tokens/s\n"
+                "eval count:           64 token(s)\n"
+                "eval rate:            48.26 tokens/s\n"
             ),
         )
-        timeout_err = subprocess.TimeoutExpired(cmd="ollama", timeout=60)
-        mock_run.side_effect = [list_result, timeout_err]
+        result = benchmark_model("llama3.2:latest", pulled_base=frozenset({"llama3.2"}))
+        # Load time is excluded: the wall-clock estimate would be well under 1 tok/s
+        assert result == 48.3
+        assert "--verbose" in mock_popen.call_args.args[0]
+
+    @patch("scout.benchmark.time.monotonic", side_effect=[0.0, 20.0, 22.0])
+    @patch("scout.benchmark.subprocess.Popen")
+    @patch("scout.benchmark.shutil.which", return_value="/usr/bin/ollama")
+    def test_separates_first_token_from_decode(self, mock_which, mock_popen, mock_time):
+        mock_popen.return_value = _fake_popen([
+            "Sure.\n",
+            "one two three four five six seven eight\n",
+        ])
+        tps, ttft = _run_benchmark("llama3.2", pulled_base=frozenset({"llama3.2"}))
+        assert ttft == 20.0
+        # 8 words after the first line over the 2s since it arrived: int(8 * 0.75) / 2
+        assert tps == 3.0
+
+    @patch("scout.benchmark.subprocess.Popen")
+    @patch("scout.benchmark.shutil.which", return_value="/usr/bin/ollama")
+    def test_reads_stderr_while_stdout_streams(self, mock_which, mock_popen):
+        """ollama blocks on a full stderr pipe until someone reads it."""
+        stderr_read = threading.Event()
+
+        def stdout_lines():
+            assert stderr_read.wait(5), "stderr was not drained while stdout was open"
+            yield "Hello there, friend.\n"
+
+        proc = _fake_popen([])
+        proc.stdout = stdout_lines()
+        proc.stderr.read.side_effect = lambda: stderr_read.set() or "eval rate: 12.5 tokens/s\n"
+        mock_popen.return_value = proc
+        assert benchmark_model("llama3.2:latest") == 12.5
+
+    @patch("scout.benchmark.subprocess.Popen")
+    @patch("scout.benchmark.shutil.which", return_value="/usr/bin/ollama")
+    def test_returns_none_on_timeout(self, mock_which, mock_popen):
+        # The watchdog kills the run; ollama exits with a signal status
+        mock_popen.return_value = _fake_popen([], returncode=-9)
 
         result = benchmark_model("llama3.2:latest")
         assert result is None
 
-    @patch("scout.benchmark.subprocess.run")
     @patch("scout.benchmark.shutil.which", return_value="/usr/bin/ollama")
-    def test_returns_none_when_ollama_list_fails(self, mock_which, mock_run):
-        mock_run.return_value = subprocess.CompletedProcess(
-            args=["ollama", "list"], returncode=1, stdout="",
-        )
+    def test_returns_none_when_ollama_list_fails(self, mock_which):
+        self.mock_pulled.return_value = []
         result = benchmark_model("llama3.2:latest")
         assert result is None
 
-    @patch("scout.benchmark.time.monotonic", side_effect=[0.0, 10.0])
-    @patch("scout.benchmark.subprocess.run")
+    @patch("scout.benchmark.subprocess.Popen")
     @patch("scout.benchmark.shutil.which", return_value="/usr/bin/ollama")
-    def test_returns_none_when_run_fails(self, mock_which, mock_run, mock_time):
-        list_result = subprocess.CompletedProcess(
-            args=["ollama", "list"],
-            returncode=0,
-            stdout=(
-                "NAME             ID     SIZE   MODIFIED\n"
-                "llama3.2:latest  abc123 2.0GB  1 day ago\n"
-            ),
-        )
-        run_result = subprocess.CompletedProcess(
-            args=["ollama", "run", "llama3.2:latest", "Hello, how are you?"],
-            returncode=1,
-            stdout="",
-        )
-        mock_run.side_effect = [list_result, run_result]
+    def test_returns_none_when_run_fails(self, mock_which, mock_popen):
+        mock_popen.return_value = _fake_popen([], returncode=1)
         result = benchmark_model("llama3.2:latest")
         assert result is None
 
+    @patch("scout.benchmark.subprocess.Popen")
+    @patch("scout.benchmark.shutil.which", return_value="/usr/bin/ollama")
+    def test_lists_pulled_models_once_per_pass(self, mock_which, mock_popen):
+        mock_popen.side_effect = lambda *a, **k: _fake_popen(["Hello there, friend.\n"])
+
+        estimates = benchmark_pulled_models(["llama3.2:latest", "llama3.2:1b"], _make_hw())
+        assert len(estimates) == 2
+        self.mock_pulled.assert_called_once()
+
+    @patch("scout.benchmark.subprocess.Popen")
+    @patch("scout.benchmark.shutil.which", return_value="/opt/ollama/bin/ollama")
+    def test_looks_up_binary_once_and_runs_it_by_path(self, mock_which, mock_popen):
+        mock_popen.side_effect = lambda *a, **k: _fake_popen(["Hi.\n"])
+
+        benchmark_model("llama3.2:latest")
+        benchmark_model("llama3.2:1b")
+        assert mock_which.call_count == 1
+        assert mock_popen.call_args.args[0][0] == "/opt/ollama/bin/ollama"
+
+    @patch("scout.benchmark.shutil.which", return_value="/usr/bin/ollama")
+    def test_uses_given_pulled_set_without_listing(self, mock_which):
+        assert benchmark_model("llama3.2:latest", pulled_base=frozenset({"mistral"})) is None
+        self.mock_pulled.assert_not_called()
+
+
+def _stream_response(chunks):
+    response = MagicMock()
+    response.__enter__.return_value = response
+    response.iter_lines.return_value = [json.dumps(c).encode() for c in chunks]
+    return response
+
+
+class TestBenchmarkViaApi:
+    def setup_method(self):
+        _clear_caches()
+
+    @patch("requests.post")
+    def test_uses_server_reported_eval_rate(self, mock_post):
+        mock_post.return_value = _stream_response([
+            {"response": "Hi", "done": False},
+            {"response": "", "done": True, "eval_count": 64, "eval_duration": 2_000_000_000},
+        ])
+        tps, ttft = _benchmark_via_api("llama3.2", "Hello")
+        assert tps == 32.0
+        assert ttft is not None
+        payload = mock_post.call_args.kwargs["json"]
+        assert payload["stream"] is True
+        assert payload["options"]["num_predict"] == 64
+        assert payload["options"]["temperature"] == 0.0
+        assert payload["options"]["seed"] == 42
+
+    @patch("requests.post", side_effect=requests.ConnectionError("refused"))
+    def test_raises_connection_error_when_server_down(self, mock_post):
+        try:
+            _benchmark_via_api("llama3.2", "Hello")
+            assert False, "Should have raised ConnectionError"
+        except ConnectionError:
+            pass
+
+    @patch("requests.post")
+    def test_returns_none_on_http_error(self, mock_post):
+        response = _stream_response([])
+        response.raise_for_status.side_effect = requests.HTTPError("404")
+        mock_post.return_value = response
+        assert _benchmark_via_api("missing", "Hello") is None
+
+    @patch("scout.benchmark.subprocess.run")
+    @patch("scout.benchmark._benchmark_via_api", return_value=(42.5, 0.3))
+    @patch("scout.benchmark.shutil.which", return_value="/usr/bin/ollama")
+    def test_benchmark_model_prefers_api(self, mock_which, mock_api, mock_run):
+        result = benchmark_model("llama3.2:latest", pulled_base=frozenset({"llama3.2"}))
+        assert result == 42.5
+        mock_run.assert_not_called()
+
+
+class TestListPulledBaseNames:
+    def setup_method(self):
+        _clear_caches()
+
+    @patch("scout.benchmark.shutil.which", return_value="/usr/bin/ollama")
+    def test_uses_shared_pulled_model_lookup(self, mock_which):
+        with patch("scout.benchmark.get_pulled_models", return_value=["llama3.2", "mistral"]):
+            assert _list_pulled_base_names() == frozenset({"llama3.2", "mistral"})
+
+    @patch("scout.benchmark.shutil.which", return_value="/usr/bin/ollama")
+    def test_not_cached_across_pulls(self, mock_which):
+        with patch("scout.benchmark.get_pulled_models", side_effect=[[], ["qwen3"]]):
+            assert _list_pulled_base_names() == frozenset()
+            assert _list_pulled_base_names() == frozenset({"qwen3"})
+
+    @patch("scout.benchmark.get_pulled_models")
+    @patch("scout.benchmark.shutil.which", return_value=None)
+    def test_none_without_ollama(self, mock_which, mock_pulled):
+        assert _list_pulled_base_names() is None
+        mock_pulled.assert_not_called()
+
 
 class TestBenchmarkPulledModels:
-    @patch("scout.benchmark.benchmark_model", return_value=45.0)
+    def setup_method(self):
+        _clear_caches()
+        self._bin = patch("scout.benchmark._ollama_bin", return_value="/usr/bin/ollama")
+        self._bin.start()
+
+    def teardown_method(self):
+        self._bin.stop()
+
+    @patch("scout.benchmark._list_pulled_base_names")
+    @patch("scout.benchmark._run_benchmark")
+    def test_returns_early_without_ollama(self, mock_run, mock_list):
+        with patch("scout.benchmark._ollama_bin", return_value=None):
+            assert benchmark_pulled_models(["llama3.2"], _make_hw()) == []
+        mock_run.assert_not_called()
+        mock_list.assert_not_called()
+
+    @patch("scout.benchmark._list_pulled_base_names")
+    @patch("scout.benchmark._run_benchmark", return_value=(50.0, 1.0))
+    def test_given_pulled_set_skips_listing(self, mock_run, mock_list):
+        pulled = frozenset({"llama3.2"})
+        benchmark_pulled_models(["llama3.2"], _make_hw(), pulled_base=pulled)
+        mock_list.assert_not_called()
+        assert mock_run.call_args.kwargs["pulled_base"] is pulled
+
+    @patch("scout.benchmark._run_benchmark", return_value=(45.0, 1.5))
     def test_returns_estimates(self, mock_bench):
         hw = _make_hw(vram_gb=10.0)
         estimates = benchmark_pulled_models(["llama3.2:latest"], hw)
         assert len(estimates) == 1
         assert estimates[0].tokens_per_sec == 45.0
+        assert estimates[0].ttft_s == 1.5
         assert estimates[0].run_mode == "GPU"
 
-    @patch("scout.benchmark.benchmark_model", return_value=None)
+    @patch("scout.benchmark._run_benchmark", return_value=None)
     def test_skips_failed_benchmarks(self, mock_bench):
         hw = _make_hw(vram_gb=0)
         estimates = benchmark_pulled_models(["llama3.2:latest"], hw)
         assert len(estimates) == 0
 
-    @patch("scout.benchmark.benchmark_model", return_value=70.0)
+    @patch("scout.benchmark._run_benchmark", return_value=(70.0, 1.5))
     def test_fast_rating(self, mock_bench):
         hw = _make_hw(vram_gb=10.0)
         estimates = benchmark_pulled_models(["model:7b"], hw)
         assert estimates[0].rating == "Fast"
 
-    @patch("scout.benchmark.benchmark_model", return_value=30.0)
+    @patch("scout.benchmark._run_benchmark", return_value=(30.0, 1.5))
     def test_moderate_rating(self, mock_bench):
         hw = _make_hw(vram_gb=10.0)
         estimates = benchmark_pulled_models(["model:7b"], hw)
         assert estimates[0].rating == "Moderate"
 
-    @patch("scout.benchmark.benchmark_model", return_value=10.0)
+    @patch("scout.benchmark._run_benchmark", return_value=(10.0, 1.5))
     def test_slow_rating(self, mock_bench):
         hw = _make_hw(vram_gb=10.0)
         estimates = benchmark_pulled_models(["model:7b"], hw)
         assert estimates[0].rating == "Slow"
 
-    @patch("scout.benchmark.benchmark_model", return_value=25.0)
+    @patch("scout.benchmark._run_benchmark", return_value=(25.0, 1.5))
     def test_cpu_mode_when_no_vram(self, mock_bench):
         hw = _make_hw(vram_gb=0)
         estimates = benchmark_pulled_models(["model:7b"], hw)
         assert estimates[0].run_mode == "CPU"
 
+    def test_rating_band_edges(self):
+        assert _rate(24.9) == "Slow"
+        assert _rate(25.0) == "Moderate"
+        assert _rate(59.9) == "Moderate"
+        assert _rate(60.0) == "Fast"
+
+    def test_runs_one_at_a_time_in_input_order(self):
+        speeds = {"a": (10.0, 1.0), "b": None, "c": (70.0, 0.5)}
+        running = []
+        calls = []
+
+        def run(name, pulled_base=None):
+            assert not running, "benchmarks overlapped"
+            running.append(name)
+            calls.append(name)
+            running.remove(name)
+            return speeds[name]
+
+        hw = _make_hw(vram_gb=0, threads=16)
+        with patch("scout.benchmark._run_benchmark", side_effect=run):
+            estimates = benchmark_pulled_models(["a", "b", "c"], hw)
+        assert calls == ["a", "b", "c"]
+        assert [e.model_name for e in estimates] == ["a", "c"]
+        assert [e.rating for e in estimates] == ["Slow", "Fast"]
+
 
 class TestBenchmarkEstimateDataclass:
     def test_can_create_benchmark_estimate(self):
@@ -7,7 +7,9 @@ from unittest.mock import patch
 from scout.config import (
     DEFAULT_CONFIG,
     _get_config_path,
+    _load_base_config,
     _migrate_legacy_config,
+    _read_json,
     load_config,
     print_config,
     save_config,
@@ -15,27 +17,27 @@ from scout.config import (
 
 
 class TestGetConfigPath:
-    @patch("scout.config.platform.system", return_value="Linux")
-    def test_linux_uses_xdg(self, mock_sys):
+    @patch("scout.config.sys.platform", "linux")
+    def test_linux_uses_xdg(self):
         with patch.dict(os.environ, {"XDG_CONFIG_HOME": "/tmp/xdg"}, clear=False):
             path = _get_config_path()
             assert path == "/tmp/xdg/ollama-scout/config.json"
 
-    @patch("scout.config.platform.system", return_value="Linux")
-    def test_linux_defaults_to_dot_config(self, mock_sys):
+    @patch("scout.config.sys.platform", "linux")
+    def test_linux_defaults_to_dot_config(self):
         env = dict(os.environ)
         env.pop("XDG_CONFIG_HOME", None)
         with patch.dict(os.environ, env, clear=True):
             path = _get_config_path()
             assert ".config/ollama-scout/config.json" in path
 
-    @patch("scout.config.platform.system", return_value="Darwin")
-    def test_macos_uses_application_support(self, mock_sys):
+    @patch("scout.config.sys.platform", "darwin")
+    def test_macos_uses_application_support(self):
         path = _get_config_path()
         assert "Library/Application Support/ollama-scout/config.json" in path
 
-    @patch("scout.config.platform.system", return_value="Windows")
-    def test_windows_uses_appdata(self, mock_sys):
+    @patch("scout.config.sys.platform", "win32")
+    def test_windows_uses_appdata(self):
         with patch.dict(os.environ, {"APPDATA": "C:\\Users\\test\\AppData"}, clear=False):
             path = _get_config_path()
             assert "ollama-scout" in path
@@ -62,6 +64,24 @@ class TestLegacyMigration:
             with open(new_path) as f:
                 assert json.load(f)["default_top_n"] == 25
 
+    def test_falls_back_to_copy_across_filesystems(self):
+        import errno
+        with tempfile.TemporaryDirectory() as tmpdir:
+            legacy = os.path.join(tmpdir, "legacy.json")
+            new_path = os.path.join(tmpdir, "new", "config.json")
+            with open(legacy, "w") as f:
+                json.dump({"default_top_n": 25}, f)
+
+            with patch("scout.config.LEGACY_CONFIG_PATH", legacy), \
+                 patch("scout.config.CONFIG_PATH", new_path), \
+                 patch("scout.config.os.replace", side_effect=OSError(errno.EXDEV, "cross-device")):
+                result = _migrate_legacy_config()
+
+            assert result is True
+            assert not os.path.exists(legacy)
+            with open(new_path) as f:
+                assert json.load(f)["default_top_n"] == 25
+
     def test_no_migration_when_no_legacy(self):
         with tempfile.TemporaryDirectory() as tmpdir:
             legacy = os.path.join(tmpdir, "nonexistent.json")
@@ -192,6 +212,19 @@ class TestPrintConfig:
                 print_config()
 
 
+    def test_print_config_reads_profiles_once(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "ollama-scout", "config.json")
+            with patch("scout.config.CONFIG_PATH", path), \
+                 patch("scout.config.LEGACY_CONFIG_PATH", "/nonexistent"), \
+                 patch("scout.config._load_profiles", return_value={
+                     "active": "coding", "profiles": {"default": {}, "coding": {}},
+                 }) as mock_profiles, \
+                 patch("rich.console.Console.print"):
+                print_config()
+            mock_profiles.assert_called_once()
+
+
 class TestSaveConfig:
     def test_writes_valid_json(self):
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -214,3 +247,67 @@ class TestSaveConfig:
                 save_config(original)
                 loaded = load_config()
                 assert loaded == original
+
+
+class TestReadJsonCache:
+    def test_reuses_parse_until_file_changes(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "config.json")
+            with open(path, "w") as f:
+                json.dump({"default_top_n": 5}, f)
+
+            with patch("scout.config.json.load", wraps=json.load) as mock_load:
+                first = _read_json(path)
+                first["default_top_n"] = 99  # callers get a private copy
+                assert _read_json(path) == {"default_top_n": 5}
+                assert mock_load.call_count == 1
+
+                with open(path, "w") as f:
+                    json.dump({"default_top_n": 20, "auto_export": True}, f)
+                assert _read_json(path)["default_top_n"] == 20
+                assert mock_load.call_count == 2
+
+    def test_save_config_invalidates_cache(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "config.json")
+            with patch("scout.config.CONFIG_PATH", path):
+                save_config({**DEFAULT_CONFIG, "default_top_n": 7})
+                assert _load_base_config()["default_top_n"] == 7
+                save_config({**DEFAULT_CONFIG, "default_top_n": 8})
+                assert _load_base_config()["default_top_n"] == 8
+
+
+class TestAtomicWrite:
+    def test_failed_write_keeps_previous_file(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "config.json")
+            with patch("scout.config.CONFIG_PATH", path):
+                save_config({**DEFAULT_CONFIG, "default_top_n": 7})
+                with patch("scout.config.os.replace", side_effect=OSError("disk full")):
+                    save_config({**DEFAULT_CONFIG, "default_top_n": 8})
+            with open(path) as f:
+                assert json.load(f)["default_top_n"] == 7
+            assert not [n for n in os.listdir(tmpdir) if n.endswith(".tmp")]
+
+    def test_skips_makedirs_when_directory_exists(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "ollama-scout", "config.json")
+            with patch("scout.config.CONFIG_PATH", path):
+                save_config(dict(DEFAULT_CONFIG))  # first save creates the directory
+                with patch("scout.config.os.makedirs") as mock_makedirs:
+                    save_config({**DEFAULT_CONFIG, "default_top_n": 8})
+            mock_makedirs.assert_not_called()
+            with open(path) as f:
+                assert json.load(f)["default_top_n"] == 8
+
+    def test_writes_payload_in_one_call(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "config.json")
+            with patch("scout.config.CONFIG_PATH", path), \
+                 patch("scout.config.json.dump") as mock_dump:
+                save_config({**DEFAULT_CONFIG, "default_top_n": 7})
+            mock_dump.assert_not_called()
+            with open(path) as f:
+                text = f.read()
+            assert text.endswith("}\n")
+            assert json.loads(text)["default_top_n"] == 7
@@ -1,4 +1,6 @@
 """Tests for scout.display module."""
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from io import StringIO
 from unittest.mock import patch
 
@@ -6,16 +8,20 @@ from rich.console import Console
 
 from scout.benchmark import BenchmarkEstimate
 from scout.display import (
+    batched_status,
     print_banner,
     print_benchmark,
     print_footer,
     print_hardware_summary,
     print_legend,
     print_model_comparison,
+    print_profile_list,
     print_recommendations_flat,
     print_recommendations_grouped,
     prompt_export,
     prompt_pull,
+    spinner,
+    wait_with_spinner,
 )
 from scout.hardware import GPUInfo, HardwareProfile
 from scout.ollama_api import ModelVariant, OllamaModel
@@ -98,6 +104,12 @@ class TestDisplayFunctions:
         output = _capture(print_recommendations_flat, [rec])
         assert "test-model" in output
 
+    def test_print_recommendations_grouped_shows_cells_verbatim(self):
+        rec = _make_rec()
+        rec.note = "Needs [bold]more[/bold] RAM"
+        output = _capture(print_recommendations_grouped, {"chat": [rec]}, [])
+        assert "[bold]more[/bold]" in output
+
     def test_print_benchmark_shows_estimates(self):
         est = BenchmarkEstimate(
             model_name="test:7b", run_mode="GPU",
@@ -107,11 +119,33 @@ class TestDisplayFunctions:
         assert "80.0" in output
         assert "Fast" in output
 
+    def test_print_benchmark_shows_time_to_first_token(self):
+        est = BenchmarkEstimate(
+            model_name="test:7b", run_mode="GPU",
+            tokens_per_sec=80.0, rating="Fast", ttft_s=2.345,
+        )
+        output = _capture(print_benchmark, [est])
+        assert "First token" in output
+        assert "2.3s" in output
+
     def test_print_legend_does_not_raise(self):
         output = _capture(print_legend)
         assert "Excellent" in output
         assert "GPU" in output
 
+    def test_print_profile_list_marks_active_and_overrides(self):
+        output = _capture(
+            print_profile_list,
+            ["default", "coding"],
+            "coding",
+            {"default": {}, "coding": {"default_use_case": "coding"}},
+        )
+        assert "default" in output
+        assert "(no overrides)" in output
+        assert "default_use_case='coding'" in output
+        coding_line = next(line for line in output.splitlines() if "coding" in line and "✓" in line)
+        assert "default_use_case" in coding_line
+
     def test_print_footer_does_not_raise(self):
         output = _capture(print_footer)
         assert "--help" in output
@@ -175,3 +209,54 @@ class TestEOFErrorHandling:
              patch.object(Console, "print"):
             result = prompt_pull([rec])
             assert result is None
+
+
+class TestSpinner:
+    def test_returns_progress_on_terminal(self):
+        from rich.progress import Progress
+        with patch("scout.display.console", Console(file=StringIO(), force_terminal=True)):
+            assert isinstance(spinner("Working..."), Progress)
+
+    def test_is_noop_when_not_a_terminal(self):
+        from rich.progress import Progress
+        with patch("scout.display.console", Console(file=StringIO(), force_terminal=False)):
+            p = spinner("Working...")
+        assert not isinstance(p, Progress)
+        with p:
+            p.add_task("")
+            p.start()
+            p.stop()
+
+
+class TestWaitWithSpinner:
+    def test_finished_work_shows_no_spinner(self):
+        future = Future()
+        future.set_result(1)
+        with patch("scout.display.spinner") as mock_spinner:
+            wait_with_spinner("Working...", [future])
+        mock_spinner.assert_not_called()
+
+    def test_slow_work_shows_spinner_until_done(self):
+        release = threading.Event()
+        with patch("scout.display.spinner") as mock_spinner, \
+             ThreadPoolExecutor(max_workers=1) as pool:
+            mock_spinner.return_value.__enter__.return_value.start.side_effect = (
+                lambda: release.set()
+            )
+            future = pool.submit(release.wait, 5)
+            wait_with_spinner("Working...", [future], delay=0.01)
+            assert future.result() is True
+        mock_spinner.assert_called_once_with("Working...")
+
+
+class TestBatchedStatus:
+    def test_output_is_written_once_on_exit(self):
+        from scout.display import print_info, print_success
+        buf = StringIO()
+        with patch("scout.display.console", Console(file=buf, force_terminal=True, width=120)):
+            with batched_status():
+                print_info("first")
+                print_success("second")
+                assert buf.getvalue() == ""
+        output = buf.getvalue()
+        assert output.index("first") < output.index("second")
@@ -31,6 +31,8 @@ class TestCheckOllama:
             ok, detail = _check_ollama()
             assert ok is True
             assert "0.5.0" in detail
+            assert mock_run.call_args.args[0] == ["/usr/bin/ollama", "--version"]
+            assert mock_run.call_args.kwargs["stdin"] == subprocess.DEVNULL
 
     def test_fails_when_not_in_path(self):
         from scout.doctor import _check_ollama
@@ -56,6 +58,10 @@ class TestCheckOllama:
 
 
 class TestCheckGpu:
+    def setup_method(self):
+        from scout.doctor import _hardware
+        _hardware.cache_clear()
+
     def test_returns_ok_with_gpu(self):
         from scout.doctor import _check_gpu
         from scout.hardware import GPUInfo, HardwareProfile
@@ -85,39 +91,85 @@ class TestCheckGpu:
 
 
 class TestCheckRam:
+    def setup_method(self):
+        from scout.doctor import _hardware
+        _hardware.cache_clear()
+
+    @staticmethod
+    def _hw(ram_gb):
+        from scout.hardware import HardwareProfile
+        return HardwareProfile(
+            os="Linux", cpu_name="Test", cpu_cores=4, cpu_threads=8,
+            ram_gb=ram_gb, gpus=[],
+        )
+
     def test_returns_ok_with_enough_ram(self):
         from scout.doctor import _check_ram
-        mock_mem = MagicMock()
-        mock_mem.total = 16 * (1024 ** 3)  # 16 GB
-        with patch("psutil.virtual_memory", return_value=mock_mem):
+        with patch("scout.hardware.detect_hardware", return_value=self._hw(16.0)):
             ok, detail = _check_ram()
             assert ok is True
             assert "16" in detail
 
     def test_fails_with_low_ram(self):
         from scout.doctor import _check_ram
-        mock_mem = MagicMock()
-        mock_mem.total = 2 * (1024 ** 3)  # 2 GB
-        with patch("psutil.virtual_memory", return_value=mock_mem):
+        with patch("scout.hardware.detect_hardware", return_value=self._hw(2.0)):
             ok, detail = _check_ram()
             assert ok is False
 
+    def test_fails_when_ram_undetected(self):
+        from scout.doctor import _check_ram
+        with patch("scout.hardware.detect_hardware", return_value=self._hw(0.0)):
+            ok, detail = _check_ram()
+            assert ok is False
+
+    def test_shares_detection_with_gpu_check(self):
+        from scout.doctor import _check_gpu, _check_ram
+        with patch("scout.hardware.detect_hardware", return_value=self._hw(16.0)) as mock_hw:
+            _check_gpu()
+            _check_ram()
+        mock_hw.assert_called_once()
+
 
 class TestCheckInternet:
+    def setup_method(self):
+        self._cfg = patch("scout.config.load_config", return_value={"offline_mode": False})
+        self._cfg.start()
+
+    def teardown_method(self):
+        self._cfg.stop()
+
     def test_passes_when_connected(self):
         from scout.doctor import _check_internet
-        with patch("socket.socket") as mock_sock:
-            mock_sock.return_value.connect.return_value = None
+        with patch("socket.create_connection") as mock_conn:
             ok, detail = _check_internet()
             assert ok is True
+            assert mock_conn.call_args.kwargs["timeout"] == 1.0
+            mock_conn.return_value.__exit__.assert_called_once()  # socket closed
 
     def test_fails_when_disconnected(self):
         from scout.doctor import _check_internet
-        with patch("socket.socket") as mock_sock:
-            mock_sock.return_value.connect.side_effect = OSError("Network unreachable")
+        with patch("socket.create_connection", side_effect=OSError("Network unreachable")):
             ok, detail = _check_internet()
             assert ok is False
 
+    def test_skipped_in_offline_mode(self):
+        from scout.doctor import _check_internet
+        with patch("scout.config.load_config", return_value={"offline_mode": True}), \
+             patch("socket.create_connection") as mock_conn:
+            ok, detail = _check_internet()
+        assert ok is True
+        assert "offline_mode" in detail
+        mock_conn.assert_not_called()
+
+    def test_does_not_change_default_socket_timeout(self):
+        import socket
+
+        from scout.doctor import _check_internet
+        before = socket.getdefaulttimeout()
+        with patch("socket.create_connection"):
+            _check_internet()
+        assert socket.getdefaulttimeout() == before
+
 
 class TestCheckModelCache:
     def test_passes_when_cache_fresh(self):
@@ -1,8 +1,9 @@
 """Tests for scout.exporter module."""
 import os
 import tempfile
+from pathlib import Path
 
-from scout.exporter import export_markdown
+from scout.exporter import default_filename, export_markdown
 from scout.hardware import GPUInfo, HardwareProfile
 from scout.ollama_api import ModelVariant, OllamaModel
 from scout.recommender import Recommendation
@@ -76,3 +77,16 @@ class TestExportMarkdown:
             assert result_path.endswith(".md")
         finally:
             os.unlink(result_path)
+
+    def test_writes_to_path_object_in_export_dir(self):
+        hw, grouped = _make_test_data()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            target = Path(tmpdir) / default_filename()
+            result_path = export_markdown(hw, grouped, output_path=target)
+            assert result_path == str(target)
+            assert target.exists()
+
+    def test_default_filename_format(self):
+        name = default_filename()
+        assert name.startswith("ollama_scout_")
+        assert name.endswith(".md")
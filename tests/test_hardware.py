@@ -1,23 +1,39 @@
 """Tests for scout.hardware module."""
-import json  # noqa: F401
+import json
+import os
+import tempfile
 from unittest.mock import MagicMock, mock_open, patch
 
 from scout.hardware import (
+    _CPUINFO_HEAD_BYTES,
     GPUInfo,
     HardwareProfile,
+    _cpuinfo_field,
     _detect_cpu_linux,
     _detect_cpu_macos,
     _detect_cpu_windows,
     _detect_cpu_windows_ps,
     _detect_gpus_amd_linux,
+    _detect_gpus_amd_sysfs,
     _detect_gpus_macos,
     _detect_gpus_nvidia,
+    _detect_gpus_nvml,
     _detect_gpus_windows_ps,
     _detect_gpus_windows_wmi,
     _detect_ram_gb,
     _detect_ram_windows_ps,
     _is_apple_silicon,
+    _pci_vendors,
+    _read_darwin_sysctl,
+    _run_probe,
+    _usable_cpu_count,
+    _which,
+    _windows_cim_snapshot,
+    _windows_cpu_name_registry,
+    _windows_ram_ctypes,
+    cached_detect_hardware,
     detect_hardware,
+    refresh_hardware,
 )
 
 # ---------------------------------------------------------------------------
@@ -90,40 +106,48 @@ class TestHardwareProfileProperties:
 # _is_apple_silicon
 # ---------------------------------------------------------------------------
 
+def _sysctl(**values):
+    """`sysctl` output (key: value lines) for the given keys; use _ for dots."""
+    lines = "".join(f"{k.replace('_', '.')}: {v}\n" for k, v in values.items())
+    return MagicMock(stdout=lines, returncode=0)
+
+
 class TestIsAppleSilicon:
+    def setup_method(self):
+        _read_darwin_sysctl.cache_clear()
+
     def test_returns_false_on_linux(self):
         # We're on Linux; platform.system() != "Darwin" → immediate False
         result = _is_apple_silicon()
         assert result is False
 
-    @patch("scout.hardware.platform.processor", return_value="arm")
-    @patch("scout.hardware.platform.system", return_value="Darwin")
-    def test_returns_true_for_arm_processor(self, mock_sys, mock_proc):
-        assert _is_apple_silicon() is True
-
-    @patch("scout.hardware.platform.processor", return_value="AppleSilicon")
+    @patch("scout.hardware.subprocess.run")
+    @patch("scout.hardware.platform.machine", return_value="arm64")
     @patch("scout.hardware.platform.system", return_value="Darwin")
-    def test_returns_true_for_apple_in_processor(self, mock_sys, mock_proc):
+    def test_returns_true_for_arm64_machine_without_subprocess(
+        self, mock_sys, mock_machine, mock_run
+    ):
         assert _is_apple_silicon() is True
+        mock_run.assert_not_called()
 
     @patch("scout.hardware.subprocess.run")
-    @patch("scout.hardware.platform.processor", return_value="i386")
+    @patch("scout.hardware.platform.machine", return_value="x86_64")
     @patch("scout.hardware.platform.system", return_value="Darwin")
-    def test_uses_sysctl_fallback_returns_true(self, mock_sys, mock_proc, mock_run):
-        mock_run.return_value = MagicMock(stdout="1\n", returncode=0)
+    def test_uses_sysctl_fallback_returns_true(self, mock_sys, mock_machine, mock_run):
+        mock_run.return_value = _sysctl(hw_optional_arm64=1)
         assert _is_apple_silicon() is True
 
     @patch("scout.hardware.subprocess.run")
-    @patch("scout.hardware.platform.processor", return_value="i386")
+    @patch("scout.hardware.platform.machine", return_value="x86_64")
     @patch("scout.hardware.platform.system", return_value="Darwin")
-    def test_uses_sysctl_fallback_returns_false(self, mock_sys, mock_proc, mock_run):
-        mock_run.return_value = MagicMock(stdout="0\n", returncode=0)
+    def test_uses_sysctl_fallback_returns_false(self, mock_sys, mock_machine, mock_run):
+        mock_run.return_value = _sysctl(hw_optional_arm64=0)
         assert _is_apple_silicon() is False
 
     @patch("scout.hardware.subprocess.run", side_effect=Exception("no sysctl"))
-    @patch("scout.hardware.platform.processor", return_value="i386")
+    @patch("scout.hardware.platform.machine", return_value="x86_64")
     @patch("scout.hardware.platform.system", return_value="Darwin")
-    def test_returns_false_on_sysctl_error(self, mock_sys, mock_proc, mock_run):
+    def test_returns_false_on_sysctl_error(self, mock_sys, mock_machine, mock_run):
         assert _is_apple_silicon() is False
 
 
@@ -131,13 +155,31 @@ class TestIsAppleSilicon:
 # _detect_gpus_nvidia
 # ---------------------------------------------------------------------------
 
+def _fake_pynvml(gpus):
+    """A stand-in pynvml module reporting the given (name, total_bytes) GPUs."""
+    nvml = MagicMock()
+    nvml.nvmlDeviceGetCount.return_value = len(gpus)
+    nvml.nvmlDeviceGetHandleByIndex.side_effect = lambda i: i
+    nvml.nvmlDeviceGetName.side_effect = lambda i: gpus[i][0]
+    nvml.nvmlDeviceGetMemoryInfo.side_effect = lambda i: MagicMock(total=gpus[i][1])
+    return nvml
+
+
+@patch.dict("sys.modules", {"pynvml": None})
 class TestDetectGpusNvidia:
-    @patch("scout.hardware.shutil.which", return_value=None)
+    def setup_method(self):
+        self._pci = patch("scout.hardware._pci_vendors", return_value=None)
+        self._pci.start()
+
+    def teardown_method(self):
+        self._pci.stop()
+
+    @patch("scout.hardware._which", return_value=None)
     def test_returns_empty_when_nvidia_smi_not_found(self, mock_which):
         assert _detect_gpus_nvidia() == []
 
     @patch("scout.hardware.subprocess.run")
-    @patch("scout.hardware.shutil.which", return_value="/usr/bin/nvidia-smi")
+    @patch("scout.hardware._which", return_value="/usr/bin/nvidia-smi")
     def test_returns_gpu_info_on_success(self, mock_which, mock_run):
         mock_run.return_value = MagicMock(
             stdout="NVIDIA RTX 3080, 10240\nNVIDIA RTX 3080 Ti, 12288\n",
@@ -150,22 +192,149 @@ class TestDetectGpusNvidia:
         assert gpus[1].vram_mb == 12288
 
     @patch("scout.hardware.subprocess.run", side_effect=Exception("nvidia-smi failed"))
-    @patch("scout.hardware.shutil.which", return_value="/usr/bin/nvidia-smi")
+    @patch("scout.hardware._which", return_value="/usr/bin/nvidia-smi")
     def test_returns_empty_on_error(self, mock_which, mock_run):
         assert _detect_gpus_nvidia() == []
 
 
+class TestDetectGpusNvml:
+    def setup_method(self):
+        self._pci = patch("scout.hardware._pci_vendors", return_value=None)
+        self._pci.start()
+
+    def teardown_method(self):
+        self._pci.stop()
+
+    @patch("scout.hardware.subprocess.run")
+    def test_uses_nvml_without_spawning_nvidia_smi(self, mock_run):
+        nvml = _fake_pynvml([("NVIDIA RTX 4090", 24 * 1024 ** 3), (b"NVIDIA T4", 16 * 1024 ** 3)])
+        with patch.dict("sys.modules", {"pynvml": nvml}):
+            gpus = _detect_gpus_nvidia()
+        assert [(g.name, g.vram_mb) for g in gpus] == [
+            ("NVIDIA RTX 4090", 24576), ("NVIDIA T4", 16384),
+        ]
+        nvml.nvmlShutdown.assert_called_once()
+        mock_run.assert_not_called()
+
+    @patch("scout.hardware.subprocess.run")
+    @patch("scout.hardware._which", return_value="/usr/bin/nvidia-smi")
+    def test_falls_back_to_nvidia_smi_when_nvml_init_fails(self, mock_which, mock_run):
+        nvml = _fake_pynvml([])
+        nvml.nvmlInit.side_effect = RuntimeError("NVML Shared Library Not Found")
+        mock_run.return_value = MagicMock(stdout="NVIDIA RTX 3080, 10240\n", returncode=0)
+        with patch.dict("sys.modules", {"pynvml": nvml}):
+            gpus = _detect_gpus_nvidia()
+        assert gpus[0].name == "NVIDIA RTX 3080"
+        mock_run.assert_called_once()
+
+    @patch.dict("sys.modules", {"pynvml": None})
+    @patch("scout.hardware.subprocess.run")
+    @patch("scout.hardware._which", return_value="/usr/bin/nvidia-smi")
+    def test_skips_unreadable_rows_and_keeps_commas_in_names(self, mock_which, mock_run):
+        mock_run.return_value = MagicMock(
+            stdout="NVIDIA A100, PCIe, 40960\nNVIDIA T4, [N/A]\n\n", returncode=0,
+        )
+        gpus = _detect_gpus_nvidia()
+        assert [(g.name, g.vram_mb) for g in gpus] == [("NVIDIA A100, PCIe", 40960)]
+
+    @patch.dict("sys.modules", {"pynvml": None})
+    def test_returns_none_without_pynvml(self):
+        assert _detect_gpus_nvml() is None
+
+
+class TestWhich:
+    def teardown_method(self):
+        _which.cache_clear()
+
+    @patch("scout.hardware.shutil.which", return_value="/usr/bin/nvidia-smi")
+    def test_path_lookup_is_memoized(self, mock_which):
+        _which.cache_clear()
+        assert _which("nvidia-smi") == "/usr/bin/nvidia-smi"
+        assert _which("nvidia-smi") == "/usr/bin/nvidia-smi"
+        mock_which.assert_called_once_with("nvidia-smi")
+
+
+class TestRunProbe:
+    @patch("scout.hardware.subprocess.run")
+    @patch("scout.hardware._which", return_value="/usr/bin/nvidia-smi")
+    def test_spawns_resolved_path_without_closing_fds(self, mock_which, mock_run):
+        _run_probe(("nvidia-smi", "-L"), timeout=10)
+        argv = mock_run.call_args.args[0]
+        assert argv == ("/usr/bin/nvidia-smi", "-L")
+        assert mock_run.call_args.kwargs["close_fds"] is (os.name != "posix")
+
+    def test_runs_real_command(self):
+        import sys
+        result = _run_probe((sys.executable, "-c", "print('ok')"), timeout=10)
+        assert result.stdout.strip() == "ok"
+
+
+class TestPciVendorGate:
+    def setup_method(self):
+        _pci_vendors.cache_clear()
+
+    def teardown_method(self):
+        _pci_vendors.cache_clear()
+
+    @patch("scout.hardware.subprocess.run")
+    @patch("scout.hardware._which", return_value="/usr/bin/nvidia-smi")
+    @patch("scout.hardware._pci_vendors", return_value=frozenset({"0x8086", "0x1002"}))
+    def test_skips_nvidia_smi_without_nvidia_device(self, mock_pci, mock_which, mock_run):
+        assert _detect_gpus_nvidia() == []
+        mock_run.assert_not_called()
+
+    @patch("scout.hardware.subprocess.run")
+    @patch("scout.hardware._which", return_value="/usr/bin/rocm-smi")
+    @patch("scout.hardware._pci_vendors", return_value=frozenset({"0x8086", "0x10de"}))
+    def test_skips_rocm_smi_without_amd_device(self, mock_pci, mock_which, mock_run):
+        assert _detect_gpus_amd_linux() == []
+        mock_run.assert_not_called()
+
+    @patch("scout.hardware.os.path.exists", return_value=False)
+    @patch("scout.hardware.platform.system", return_value="Linux")
+    def test_reads_vendor_ids_from_sysfs(self, mock_sys, mock_exists):
+        with patch("scout.hardware.os.listdir", return_value=["0000:01:00.0", "0000:02:00.0"]), \
+             patch("builtins.open", mock_open(read_data="0x10DE\n")):
+            assert _pci_vendors() == frozenset({"0x10de"})
+
+    @patch("scout.hardware.os.path.exists", return_value=True)  # /dev/dxg
+    @patch("scout.hardware.platform.system", return_value="Linux")
+    def test_unknown_on_wsl(self, mock_sys, mock_exists):
+        assert _pci_vendors() is None
+
+    @patch("scout.hardware.platform.system", return_value="Windows")
+    def test_unknown_off_linux(self, mock_sys):
+        assert _pci_vendors() is None
+
+
 # ---------------------------------------------------------------------------
 # _detect_gpus_amd_linux
 # ---------------------------------------------------------------------------
 
 class TestDetectGpusAmdLinux:
-    @patch("scout.hardware.shutil.which", return_value=None)
+    def setup_method(self):
+        self._pci = patch("scout.hardware._pci_vendors", return_value=None)
+        self._pci.start()
+        self._sysfs = patch("scout.hardware._detect_gpus_amd_sysfs", return_value=[])
+        self.mock_sysfs = self._sysfs.start()
+
+    def teardown_method(self):
+        self._sysfs.stop()
+        self._pci.stop()
+
+    @patch("scout.hardware.subprocess.run")
+    def test_sysfs_result_skips_rocm_smi(self, mock_run):
+        self.mock_sysfs.return_value = [GPUInfo(name="AMD GPU", vram_mb=16368)]
+        gpus = _detect_gpus_amd_linux()
+        assert gpus[0].vram_mb == 16368
+        mock_run.assert_not_called()
+
+    @patch("scout.hardware._which", return_value=None)
     def test_returns_empty_when_no_rocm_smi(self, mock_which):
         assert _detect_gpus_amd_linux() == []
 
     @patch("scout.hardware.subprocess.run")
-    @patch("scout.hardware.shutil.which", return_value="/usr/bin/rocm-smi")
+    @patch("scout.hardware._which", return_value="/usr/bin/rocm-smi")
     def test_parses_rocm_output(self, mock_which, mock_run):
         mock_run.return_value = MagicMock(
             stdout=(
@@ -180,47 +349,100 @@ class TestDetectGpusAmdLinux:
         assert gpus[0].vram_mb == 8192  # 8388608 // 1024
 
     @patch("scout.hardware.subprocess.run", side_effect=Exception("rocm-smi failed"))
-    @patch("scout.hardware.shutil.which", return_value="/usr/bin/rocm-smi")
+    @patch("scout.hardware._which", return_value="/usr/bin/rocm-smi")
     def test_returns_empty_on_error(self, mock_which, mock_run):
         assert _detect_gpus_amd_linux() == []
 
 
+def _drm_card(root, card, vendor="0x1002", vram=0, gtt=0, product=None):
+    device = os.path.join(root, card, "device")
+    os.makedirs(device)
+    files = {"vendor": vendor, "mem_info_vram_total": vram, "mem_info_gtt_total": gtt}
+    if product is not None:
+        files["product_name"] = product
+    for name, value in files.items():
+        with open(os.path.join(device, name), "w") as f:
+            f.write(f"{value}\n")
+
+
+class TestDetectGpusAmdSysfs:
+    def test_reads_vram_and_skips_other_vendors(self):
+        with tempfile.TemporaryDirectory() as root:
+            _drm_card(root, "card0", vram=24 * 1024 ** 3, product="AMD Radeon RX 7900 XTX")
+            _drm_card(root, "card1", vendor="0x10de", vram=8 * 1024 ** 3)
+            _drm_card(root, "card2", vram=16 * 1024 ** 3, product="")
+            with patch("scout.hardware._DRM_ROOT", root):
+                gpus = _detect_gpus_amd_sysfs()
+        assert [(g.name, g.vram_mb) for g in gpus] == [
+            ("AMD Radeon RX 7900 XTX", 24576), ("AMD GPU", 16384),
+        ]
+        assert not any(g.shared_memory for g in gpus)
+
+    def test_apu_reports_gtt(self):
+        with tempfile.TemporaryDirectory() as root:
+            _drm_card(root, "card0", vram=512 * 1024 ** 2, gtt=64 * 1024 ** 3)
+            with patch("scout.hardware._DRM_ROOT", root):
+                gpus = _detect_gpus_amd_sysfs()
+        assert [(g.name, g.vram_mb) for g in gpus] == [("AMD GPU (shared memory)", 65536)]
+        assert gpus[0].shared_memory is True
+
+    def test_no_drm_cards(self):
+        with tempfile.TemporaryDirectory() as root:
+            with patch("scout.hardware._DRM_ROOT", root):
+                assert _detect_gpus_amd_sysfs() == []
+
+
 # ---------------------------------------------------------------------------
 # _detect_gpus_macos
 # ---------------------------------------------------------------------------
 
+def _displays(*entries):
+    """`system_profiler -json SPDisplaysDataType` output."""
+    return MagicMock(stdout=json.dumps({"SPDisplaysDataType": list(entries)}), returncode=0)
+
+
 class TestDetectGpusMacos:
     @patch("scout.hardware.subprocess.run")
     def test_parses_system_profiler_gb_output(self, mock_run):
-        mock_run.return_value = MagicMock(
-            stdout=(
-                "      Chipset Model: AMD Radeon Pro 5500M\n"
-                "      VRAM (Total): 8 GB\n"
-            ),
-            returncode=0,
+        mock_run.return_value = _displays(
+            {"sppci_model": "AMD Radeon Pro 5500M", "spdisplays_vram": "8 GB"},
         )
         gpus = _detect_gpus_macos()
         assert len(gpus) == 1
         assert gpus[0].name == "AMD Radeon Pro 5500M"
         assert gpus[0].vram_mb == 8 * 1024
+        assert "-json" in mock_run.call_args.args[0]
 
     @patch("scout.hardware.subprocess.run")
     def test_parses_system_profiler_mb_output(self, mock_run):
-        mock_run.return_value = MagicMock(
-            stdout=(
-                "      Chipset Model: Intel Iris Pro\n"
-                "      VRAM (Total): 1536 MB\n"
-            ),
-            returncode=0,
+        mock_run.return_value = _displays(
+            {"sppci_model": "Intel Iris Pro", "spdisplays_vram_shared": "1536 MB"},
         )
         gpus = _detect_gpus_macos()
         assert len(gpus) == 1
         assert gpus[0].vram_mb == 1536
 
+    @patch("scout.hardware.subprocess.run")
+    def test_keeps_every_adapter_and_skips_ones_without_vram(self, mock_run):
+        mock_run.return_value = _displays(
+            {"sppci_model": "Intel UHD Graphics 630", "spdisplays_vram_shared": "1536 MB"},
+            {"sppci_model": "AMD Radeon Pro 560X", "spdisplays_vram": "4 GB"},
+            {"_name": "Display Link Adapter"},
+        )
+        gpus = _detect_gpus_macos()
+        assert [(g.name, g.vram_mb) for g in gpus] == [
+            ("Intel UHD Graphics 630", 1536), ("AMD Radeon Pro 560X", 4096),
+        ]
+
     @patch("scout.hardware.subprocess.run", side_effect=Exception("no system_profiler"))
     def test_returns_empty_on_error(self, mock_run):
         assert _detect_gpus_macos() == []
 
+    @patch("scout.hardware.subprocess.run")
+    def test_returns_empty_on_invalid_json(self, mock_run):
+        mock_run.return_value = MagicMock(stdout="Graphics/Displays:\n", returncode=0)
+        assert _detect_gpus_macos() == []
+
 
 # ---------------------------------------------------------------------------
 # _detect_gpus_windows_wmi
@@ -241,6 +463,19 @@ class TestDetectGpusWindowsWmi:
         assert gpus[0].name == "NVIDIA GeForce RTX 3080"
         assert gpus[0].vram_mb == 8192  # 8589934592 // (1024*1024)
 
+    @patch("scout.hardware.subprocess.run")
+    def test_skips_adapters_without_reported_ram(self, mock_run):
+        mock_run.return_value = MagicMock(
+            stdout=(
+                "\nNode,AdapterRAM,Name\n"
+                "DESKTOP,,Microsoft Basic Display Adapter\n"
+                "DESKTOP,4293918720,AMD Radeon RX 6600, XT\n"
+            ),
+            returncode=0,
+        )
+        gpus = _detect_gpus_windows_wmi()
+        assert [(g.name, g.vram_mb) for g in gpus] == [("AMD Radeon RX 6600, XT", 4095)]
+
     @patch("scout.hardware.subprocess.run", side_effect=Exception("wmic failed"))
     def test_returns_empty_on_error(self, mock_run):
         assert _detect_gpus_windows_wmi() == []
@@ -260,38 +495,94 @@ class TestDetectCpuLinux:
         assert cores >= 1
         assert threads >= 1
 
+    @patch.dict("sys.modules", {"psutil": None})
     @patch("builtins.open", side_effect=OSError("no /proc/cpuinfo"))
     def test_returns_defaults_when_proc_unavailable(self, mock_open_fn):
-        import multiprocessing
         name, cores, threads = _detect_cpu_linux()
         assert name == "Unknown CPU"
         assert cores == 1
-        assert threads == multiprocessing.cpu_count()
+        assert threads == len(os.sched_getaffinity(0))
 
+    @patch.dict("sys.modules", {"psutil": None})
+    @patch("scout.hardware.os.sched_getaffinity", return_value=set(range(20)), create=True)
     @patch("builtins.open", mock_open(read_data=(
-        "model name\t: Intel Core i7-12700K\ncpu cores\t: 12\n"
+        b"model name\t: Intel Core i7-12700K\ncpu cores\t: 12\n"
     )))
-    def test_parses_proc_cpuinfo(self):
+    def test_parses_proc_cpuinfo(self, mock_affinity):
         name, cores, threads = _detect_cpu_linux()
         assert name == "Intel Core i7-12700K"
         assert cores == 12
 
+    @patch("scout.hardware.os.sched_getaffinity", return_value=set(range(32)), create=True)
+    @patch("psutil.cpu_count", side_effect=lambda logical=True: 32 if logical else 16)
+    def test_uses_psutil_counts_and_one_bounded_read(self, mock_count, mock_affinity):
+        block = (
+            b"processor\t: {n}\nvendor_id\t: AuthenticAMD\nmodel\t\t: 1\n"
+            b"model name\t: AMD EPYC 7543\ncpu cores\t: 99\n\n"
+        )
+        cpuinfo = b"".join(block.replace(b"{n}", str(n).encode()) for n in range(32))
+        with patch("builtins.open", mock_open(read_data=cpuinfo)) as mock_file:
+            name, cores, threads = _detect_cpu_linux()
+        assert (name, cores, threads) == ("AMD EPYC 7543", 16, 32)
+        mock_file().read.assert_called_once_with(_CPUINFO_HEAD_BYTES)
+
+    @patch("scout.hardware.os.sched_getaffinity", return_value={0, 1, 2, 3}, create=True)
+    @patch("psutil.cpu_count", side_effect=lambda logical=True: 64 if logical else 32)
+    def test_threads_follow_cpu_affinity(self, mock_count, mock_affinity):
+        with patch("builtins.open", mock_open(read_data=b"model name\t: Xeon\n")):
+            name, cores, threads = _detect_cpu_linux()
+        assert (cores, threads) == (4, 4)  # a 4-CPU cpuset, not the 64-thread host
+
+    @patch("scout.hardware.os.cpu_count", return_value=12)
+    @patch("scout.hardware.os.sched_getaffinity", side_effect=AttributeError, create=True)
+    def test_usable_cpu_count_without_affinity(self, mock_affinity, mock_count):
+        assert _usable_cpu_count() == 12
+
+    def test_cpuinfo_field(self):
+        data = b"processor\t: 0\nmodel\t\t: 85\nmodel name\t: Xeon\ncpu cores\t: 4\n"
+        assert _cpuinfo_field(data, b"model name") == "Xeon"
+        assert _cpuinfo_field(data, b"processor") == "0"
+        assert _cpuinfo_field(data, b"cpu cores") == "4"
+        assert _cpuinfo_field(data, b"Hardware") is None
+
 
 # ---------------------------------------------------------------------------
 # _detect_cpu_macos
 # ---------------------------------------------------------------------------
 
 class TestDetectCpuMacos:
+    def setup_method(self):
+        _read_darwin_sysctl.cache_clear()
+
     @patch("scout.hardware.subprocess.run")
     def test_parses_sysctl_output(self, mock_run):
-        mock_run.side_effect = [
-            MagicMock(stdout="Apple M2 Pro\n", returncode=0),
-            MagicMock(stdout="10\n", returncode=0),
-        ]
+        mock_run.return_value = MagicMock(
+            stdout="machdep.cpu.brand_string: Apple M2 Pro\nhw.physicalcpu: 10\n",
+            returncode=0,
+        )
         name, cores, threads = _detect_cpu_macos()
         assert name == "Apple M2 Pro"
         assert cores == 10
 
+    @patch("scout.hardware.platform.machine", return_value="x86_64")
+    @patch("scout.hardware.platform.system", return_value="Darwin")
+    @patch("scout.hardware.subprocess.run")
+    def test_one_sysctl_run_serves_cpu_ram_and_arm_check(self, mock_run, mock_sys, mock_machine):
+        mock_run.return_value = MagicMock(
+            stdout=(
+                "machdep.cpu.brand_string: Intel(R) Core(TM) i9-9880H\n"
+                "hw.physicalcpu: 8\n"
+                "hw.logicalcpu: 16\n"
+                "hw.memsize: 34359738368\n"
+            ),  # hw.optional.arm64 is missing on older Intel Macs
+            returncode=0,
+        )
+        with patch.dict("sys.modules", {"psutil": None}):
+            assert _detect_cpu_macos()[:2] == ("Intel(R) Core(TM) i9-9880H", 8)
+            assert _detect_ram_gb() == 32.0
+            assert _is_apple_silicon() is False
+        mock_run.assert_called_once()
+
     @patch("scout.hardware.subprocess.run", side_effect=Exception("no sysctl"))
     def test_returns_defaults_on_error(self, mock_run):
         name, cores, threads = _detect_cpu_macos()
@@ -303,9 +594,17 @@ class TestDetectCpuMacos:
 # ---------------------------------------------------------------------------
 
 class TestDetectCpuWindows:
+    @patch("scout.hardware._windows_cpu_name_registry", return_value="AMD Ryzen 9 7950X")
+    @patch("psutil.cpu_count", side_effect=lambda logical=True: 32 if logical else 16)
+    @patch("scout.hardware.subprocess.run")
+    def test_uses_registry_and_psutil_without_subprocess(self, mock_run, mock_count, mock_reg):
+        assert _detect_cpu_windows() == ("AMD Ryzen 9 7950X", 16, 32)
+        mock_run.assert_not_called()
+
+    @patch("scout.hardware._windows_cpu_name_registry", return_value=None)
     @patch("scout.hardware.subprocess.run")
-    @patch("scout.hardware.shutil.which", return_value="C:\\Windows\\wmic.exe")
-    def test_uses_wmic_when_available(self, mock_which, mock_run):
+    @patch("scout.hardware._which", return_value="C:\\Windows\\wmic.exe")
+    def test_uses_wmic_when_available(self, mock_which, mock_run, mock_reg):
         mock_run.return_value = MagicMock(
             stdout=(
                 "Node,Name,NumberOfCores,NumberOfLogicalProcessors\n"
@@ -318,19 +617,31 @@ class TestDetectCpuWindows:
         assert cores == 24
         assert threads == 32
 
+    @patch("scout.hardware._windows_cpu_name_registry", return_value=None)
     @patch("scout.hardware._detect_cpu_windows_ps", return_value=("AMD Ryzen 9", 12, 24))
-    @patch("scout.hardware.shutil.which", return_value=None)
-    def test_falls_back_to_ps_when_no_wmic(self, mock_which, mock_ps):
+    @patch("scout.hardware._which", return_value=None)
+    def test_falls_back_to_ps_when_no_wmic(self, mock_which, mock_ps, mock_reg):
         name, cores, threads = _detect_cpu_windows()
         assert name == "AMD Ryzen 9"
         mock_ps.assert_called_once()
 
+    @patch("scout.hardware._windows_cpu_name_registry", return_value=None)
     @patch("scout.hardware._detect_cpu_windows_ps", return_value=("Unknown CPU", 1, 1))
-    @patch("scout.hardware.shutil.which", return_value=None)
-    def test_returns_defaults_when_both_fail(self, mock_which, mock_ps):
+    @patch("scout.hardware._which", return_value=None)
+    def test_returns_defaults_when_both_fail(self, mock_which, mock_ps, mock_reg):
         name, cores, threads = _detect_cpu_windows()
         assert name == "Unknown CPU"
 
+    def test_registry_lookup(self):
+        winreg = MagicMock()
+        winreg.QueryValueEx.return_value = ("Intel(R) Core(TM) i7-8700K CPU @ 3.70GHz  ", 1)
+        with patch.dict("sys.modules", {"winreg": winreg}):
+            assert _windows_cpu_name_registry() == "Intel(R) Core(TM) i7-8700K CPU @ 3.70GHz"
+
+    def test_registry_unavailable(self):
+        with patch.dict("sys.modules", {"winreg": None}):
+            assert _windows_cpu_name_registry() is None
+
 
 # ---------------------------------------------------------------------------
 # _detect_ram_gb fallback paths
@@ -340,24 +651,54 @@ class TestDetectRamGbFallback:
     @patch.dict("sys.modules", {"psutil": None})
     @patch("scout.hardware.platform.system", return_value="Linux")
     def test_linux_fallback_reads_proc_meminfo(self, mock_sys):
-        fake_meminfo = "MemTotal:        33554432 kB\nMemFree: 1000 kB\n"
-        with patch("builtins.open", mock_open(read_data=fake_meminfo)):
+        fake_meminfo = b"MemTotal:        33554432 kB\nMemFree: 1000 kB\n"
+        with patch("builtins.open", mock_open(read_data=fake_meminfo)) as mock_file:
             ram = _detect_ram_gb()
         assert ram == 32.0  # 33554432 KB = 32 GB
+        mock_file.return_value.read.assert_called_once()
+
+    @patch.dict("sys.modules", {"psutil": None})
+    @patch("scout.hardware.platform.system", return_value="Linux")
+    def test_linux_fallback_without_memtotal_returns_zero(self, mock_sys):
+        with patch("builtins.open", mock_open(read_data=b"MemFree: 1000 kB\n")):
+            assert _detect_ram_gb() == 0.0
 
     @patch.dict("sys.modules", {"psutil": None})
     @patch("scout.hardware.subprocess.run")
     @patch("scout.hardware.platform.system", return_value="Darwin")
     def test_darwin_fallback_uses_sysctl(self, mock_sys, mock_run):
-        mock_run.return_value = MagicMock(stdout="34359738368\n", returncode=0)
+        _read_darwin_sysctl.cache_clear()
+        mock_run.return_value = _sysctl(hw_memsize=34359738368)
         ram = _detect_ram_gb()
         assert ram == 32.0  # 34359738368 bytes = 32 GB
 
     @patch.dict("sys.modules", {"psutil": None})
+    @patch("scout.hardware._windows_ram_ctypes", return_value=31.9)
+    @patch("scout.hardware.subprocess.run")
+    @patch("scout.hardware.platform.system", return_value="Windows")
+    def test_windows_fallback_uses_native_api(self, mock_sys, mock_run, mock_native):
+        assert _detect_ram_gb() == 31.9
+        mock_run.assert_not_called()
+
+    @patch("ctypes.windll", create=True)
+    def test_windows_ram_ctypes(self, mock_windll):
+        def fill(ref):
+            ref._obj.ullTotalPhys = 34359738368
+            return 1
+        mock_windll.kernel32.GlobalMemoryStatusEx.side_effect = fill
+        assert _windows_ram_ctypes() == 32.0
+
+    @patch("ctypes.windll", create=True)
+    def test_windows_ram_ctypes_failure_returns_zero(self, mock_windll):
+        mock_windll.kernel32.GlobalMemoryStatusEx.return_value = 0
+        assert _windows_ram_ctypes() == 0.0
+
+    @patch.dict("sys.modules", {"psutil": None})
+    @patch("scout.hardware._windows_ram_ctypes", return_value=0.0)
     @patch("scout.hardware.subprocess.run")
-    @patch("scout.hardware.shutil.which", return_value="C:\\Windows\\wmic.exe")
+    @patch("scout.hardware._which", return_value="C:\\Windows\\wmic.exe")
     @patch("scout.hardware.platform.system", return_value="Windows")
-    def test_windows_fallback_uses_wmic(self, mock_sys, mock_which, mock_run):
+    def test_windows_fallback_uses_wmic(self, mock_sys, mock_which, mock_run, mock_native):
         mock_run.return_value = MagicMock(
             stdout="Node,TotalPhysicalMemory\nDESKTOP,34359738368\n",
             returncode=0,
@@ -366,10 +707,13 @@ class TestDetectRamGbFallback:
         assert ram == 32.0
 
     @patch.dict("sys.modules", {"psutil": None})
+    @patch("scout.hardware._windows_ram_ctypes", return_value=0.0)
     @patch("scout.hardware._detect_ram_windows_ps", return_value=32.0)
-    @patch("scout.hardware.shutil.which", return_value=None)
+    @patch("scout.hardware._which", return_value=None)
     @patch("scout.hardware.platform.system", return_value="Windows")
-    def test_windows_fallback_uses_ps_when_no_wmic(self, mock_sys, mock_which, mock_ps):
+    def test_windows_fallback_uses_ps_when_no_wmic(
+        self, mock_sys, mock_which, mock_ps, mock_native
+    ):
         ram = _detect_ram_gb()
         assert ram == 32.0
         mock_ps.assert_called_once()
@@ -387,6 +731,55 @@ class TestDetectRamGbFallback:
 # ---------------------------------------------------------------------------
 
 class TestDetectHardware:
+    def setup_method(self):
+        detect_hardware.cache_clear()
+
+    def teardown_method(self):
+        detect_hardware.cache_clear()
+
+    @patch("scout.hardware._detect_gpus_amd_linux", return_value=[])
+    @patch("scout.hardware._detect_gpus_nvidia", return_value=[])
+    @patch("scout.hardware._is_apple_silicon", return_value=False)
+    @patch("scout.hardware._detect_ram_gb", return_value=16.0)
+    @patch("scout.hardware._detect_cpu_linux", return_value=("Test CPU", 4, 8))
+    @patch("scout.hardware.platform.system", return_value="Linux")
+    def test_memoized_until_refresh(self, mock_sys, mock_cpu, *_):
+        first = detect_hardware()
+        assert detect_hardware() is first
+        assert mock_cpu.call_count == 1
+        refreshed = refresh_hardware()
+        assert refreshed is not first
+        assert detect_hardware() is refreshed
+        assert mock_cpu.call_count == 2
+
+    @patch("scout.hardware._detect_gpus_amd_linux", return_value=[])
+    @patch("scout.hardware._is_apple_silicon", return_value=False)
+    @patch("scout.hardware.platform.system", return_value="Linux")
+    def test_probes_run_concurrently(self, mock_sys, mock_apple, mock_amd):
+        import threading
+
+        # Each probe waits for the other; run one after the other, they would time out.
+        barrier = threading.Barrier(3, timeout=5)
+
+        def cpu():
+            barrier.wait()
+            return ("Test CPU", 4, 8)
+
+        def ram():
+            barrier.wait()
+            return 16.0
+
+        def nvidia():
+            barrier.wait()
+            return []
+
+        with patch("scout.hardware._detect_cpu_linux", side_effect=cpu), \
+             patch("scout.hardware._detect_ram_gb", side_effect=ram), \
+             patch("scout.hardware._detect_gpus_nvidia", side_effect=nvidia):
+            hw = detect_hardware()
+        assert hw.cpu_name == "Test CPU"
+        assert hw.ram_gb == 16.0
+
     @patch("scout.hardware._detect_ram_gb", return_value=32.0)
     @patch(
         "scout.hardware._detect_gpus_nvidia",
@@ -441,7 +834,7 @@ class TestDetectHardware:
     @patch("scout.hardware._detect_gpus_nvidia", return_value=[])
     @patch("scout.hardware._is_apple_silicon", return_value=False)
     @patch("scout.hardware._detect_cpu_windows", return_value=("Intel i9-13900K", 24, 32))
-    @patch("scout.hardware.shutil.which", return_value="C:\\wmic.exe")
+    @patch("scout.hardware._which", return_value="C:\\wmic.exe")
     @patch("scout.hardware.platform")
     def test_windows_with_wmic_gpu_detection(
         self, mock_platform, mock_which, mock_cpu, mock_apple, mock_nvidia, mock_wmi, mock_ram
@@ -458,7 +851,7 @@ class TestDetectHardware:
     @patch("scout.hardware._detect_gpus_nvidia", return_value=[])
     @patch("scout.hardware._is_apple_silicon", return_value=False)
     @patch("scout.hardware._detect_cpu_windows", return_value=("Intel i9", 16, 24))
-    @patch("scout.hardware.shutil.which", return_value=None)
+    @patch("scout.hardware._which", return_value=None)
     @patch("scout.hardware.platform")
     def test_windows_fallback_to_ps_when_no_wmic(
         self, mock_platform, mock_which, mock_cpu, mock_apple, mock_nvidia, mock_ps, mock_ram
@@ -502,13 +895,23 @@ class TestDetectHardware:
 # Windows PowerShell fallbacks (already existed, keeping them)
 # ---------------------------------------------------------------------------
 
+def _snapshot(**parts):
+    """PowerShell output for the combined CIM query."""
+    return MagicMock(stdout=json.dumps(parts), returncode=0)
+
+
 class TestWindowsPowerShellFallback:
+    def setup_method(self):
+        _windows_cim_snapshot.cache_clear()
+
+    def teardown_method(self):
+        _windows_cim_snapshot.cache_clear()
+
     @patch("scout.hardware.subprocess.run")
     def test_detect_gpus_windows_ps(self, mock_run):
-        ps_output = json.dumps([
-            {"Name": "NVIDIA RTX 4090", "AdapterRAM": 25769803776},
-        ])
-        mock_run.return_value = MagicMock(stdout=ps_output, returncode=0)
+        mock_run.return_value = _snapshot(
+            gpu=[{"Name": "NVIDIA RTX 4090", "AdapterRAM": 25769803776}],
+        )
         gpus = _detect_gpus_windows_ps()
         assert len(gpus) == 1
         assert gpus[0].name == "NVIDIA RTX 4090"
@@ -516,21 +919,19 @@ class TestWindowsPowerShellFallback:
 
     @patch("scout.hardware.subprocess.run")
     def test_detect_gpus_windows_ps_single_gpu(self, mock_run):
-        """PowerShell returns a dict (not list) for a single GPU."""
-        ps_output = json.dumps({"Name": "Intel UHD 630", "AdapterRAM": 1073741824})
-        mock_run.return_value = MagicMock(stdout=ps_output, returncode=0)
+        """PowerShell may return a dict (not list) for a single GPU."""
+        mock_run.return_value = _snapshot(gpu={"Name": "Intel UHD 630", "AdapterRAM": 1073741824})
         gpus = _detect_gpus_windows_ps()
         assert len(gpus) == 1
         assert gpus[0].name == "Intel UHD 630"
 
     @patch("scout.hardware.subprocess.run")
     def test_detect_cpu_windows_ps(self, mock_run):
-        ps_output = json.dumps({
+        mock_run.return_value = _snapshot(cpu=[{
             "Name": "Intel Core i9-13900K",
             "NumberOfCores": 24,
             "NumberOfLogicalProcessors": 32,
-        })
-        mock_run.return_value = MagicMock(stdout=ps_output, returncode=0)
+        }])
         name, cores, threads = _detect_cpu_windows_ps()
         assert name == "Intel Core i9-13900K"
         assert cores == 24
@@ -538,11 +939,23 @@ class TestWindowsPowerShellFallback:
 
     @patch("scout.hardware.subprocess.run")
     def test_detect_ram_windows_ps(self, mock_run):
-        ps_output = json.dumps({"TotalPhysicalMemory": 34359738368})  # 32 GB
-        mock_run.return_value = MagicMock(stdout=ps_output, returncode=0)
+        mock_run.return_value = _snapshot(ram=[{"TotalPhysicalMemory": 34359738368}])  # 32 GB
         ram = _detect_ram_windows_ps()
         assert ram == 32.0
 
+    @patch("scout.hardware.subprocess.run")
+    def test_one_powershell_run_serves_all_probes(self, mock_run):
+        mock_run.return_value = _snapshot(
+            cpu=[{"Name": "AMD Ryzen 7", "NumberOfCores": 8, "NumberOfLogicalProcessors": 16}],
+            gpu=[{"Name": "Radeon RX 7800", "AdapterRAM": 4293918720}],
+            ram=[{"TotalPhysicalMemory": 17179869184}],
+        )
+        assert _detect_cpu_windows_ps()[0] == "AMD Ryzen 7"
+        assert _detect_gpus_windows_ps()[0].name == "Radeon RX 7800"
+        assert _detect_ram_windows_ps() == 16.0
+        mock_run.assert_called_once()
+        assert "-NoProfile" in mock_run.call_args.args[0]
+
     @patch("scout.hardware.subprocess.run", side_effect=Exception("powershell not found"))
     def test_detect_gpus_windows_ps_handles_error(self, mock_run):
         gpus = _detect_gpus_windows_ps()
@@ -566,3 +979,82 @@ class TestDetectRamGb:
         ram = _detect_ram_gb()
         assert isinstance(ram, float)
         assert ram > 0
+
+
+# ---------------------------------------------------------------------------
+# cached_detect_hardware
+# ---------------------------------------------------------------------------
+
+def _cache_hw():
+    return HardwareProfile(
+        os="Linux", cpu_name="Cached CPU", cpu_cores=8, cpu_threads=16,
+        ram_gb=32.0, gpus=[GPUInfo(name="RTX 4090", vram_mb=24576)],
+    )
+
+
+class TestHardwareCache:
+    def test_miss_runs_detection_and_writes_cache(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "hardware_cache.json")
+            with patch("scout.hardware._get_hw_cache_path", return_value=path), \
+                 patch("scout.hardware.detect_hardware", return_value=_cache_hw()) as mock_det:
+                hw = cached_detect_hardware()
+            assert mock_det.call_count == 1
+            assert hw.cpu_name == "Cached CPU"
+            assert os.path.exists(path)
+
+    def test_hit_skips_detection(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "hardware_cache.json")
+            with patch("scout.hardware._get_hw_cache_path", return_value=path):
+                with patch("scout.hardware.detect_hardware", return_value=_cache_hw()):
+                    cached_detect_hardware()
+                with patch("scout.hardware.detect_hardware") as mock_det:
+                    hw = cached_detect_hardware()
+            mock_det.assert_not_called()
+            assert hw.gpus[0].name == "RTX 4090"
+            assert hw.gpus[0].vram_gb == 24.0
+
+    def test_force_bypasses_cache(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "hardware_cache.json")
+            with patch("scout.hardware._get_hw_cache_path", return_value=path):
+                with patch("scout.hardware.detect_hardware", return_value=_cache_hw()):
+                    cached_detect_hardware()
+                with patch("scout.hardware.detect_hardware", return_value=_cache_hw()) as mock_det:
+                    cached_detect_hardware(force=True)
+            assert mock_det.call_count == 1
+            mock_det.cache_clear.assert_called_once()  # in-process memo dropped too
+
+    def test_fingerprint_mismatch_invalidates(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "hardware_cache.json")
+            with patch("scout.hardware._get_hw_cache_path", return_value=path):
+                with patch("scout.hardware.detect_hardware", return_value=_cache_hw()):
+                    cached_detect_hardware()
+                with patch("scout.hardware._hw_fingerprint",
+                           return_value={"node": "other", "machine": "x86_64"}), \
+                     patch("scout.hardware.detect_hardware", return_value=_cache_hw()) as mock_det:
+                    cached_detect_hardware()
+            assert mock_det.call_count == 1
+
+    def test_expired_cache_is_ignored(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "hardware_cache.json")
+            with patch("scout.hardware._get_hw_cache_path", return_value=path):
+                with patch("scout.hardware.detect_hardware", return_value=_cache_hw()):
+                    cached_detect_hardware()
+                with patch("scout.hardware.detect_hardware", return_value=_cache_hw()) as mock_det:
+                    cached_detect_hardware(max_age_hours=0)
+            assert mock_det.call_count == 1
+
+    def test_corrupt_cache_falls_back_to_detection(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "hardware_cache.json")
+            with open(path, "w") as f:
+                f.write("{not json")
+            with patch("scout.hardware._get_hw_cache_path", return_value=path), \
+                 patch("scout.hardware.detect_hardware", return_value=_cache_hw()) as mock_det:
+                hw = cached_detect_hardware()
+            assert mock_det.call_count == 1
+            assert hw.ram_gb == 32.0
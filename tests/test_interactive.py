@@ -1,11 +1,15 @@
 """Tests for scout.interactive module."""
-from unittest.mock import patch
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
 
+import pytest
 from rich.console import Console
 
 from scout.hardware import GPUInfo, HardwareProfile
-from scout.interactive import TOP_N_MENU, InteractiveSession
-from scout.ollama_api import ModelVariant, OllamaModel
+from scout.interactive import TOP_N_MENU, InteractiveSession, _pull_with_progress
+from scout.ollama_api import ModelVariant, OllamaModel, get_fallback_models
 from scout.recommender import Recommendation
 
 
@@ -120,12 +124,42 @@ class TestCtrlCHandling:
             except SystemExit as e:
                 assert e.code == 0
 
+    @patch("scout.interactive.check_ollama_installed", return_value=(True, "ollama version 0.5.0"))
+    @patch("scout.interactive.get_pulled_models", return_value=[])
+    @patch("scout.interactive.cached_detect_hardware", return_value=_make_hw())
+    def test_interrupt_during_fetch_exits_without_waiting(self, mock_hw, mock_pulled, mock_ollama):
+        """Ctrl+C at a prompt must not leave exit waiting on the library fetch."""
+        release = threading.Event()
+        fetch_threads = []
+
+        def slow_fetch(**kwargs):
+            fetch_threads.append(threading.current_thread())
+            release.wait(5)
+            return []
+
+        # Enter at the welcome, accept the fetch, then Ctrl+C at the use-case prompt
+        inputs = ["", "y", KeyboardInterrupt]
+        with patch("scout.interactive.fetch_ollama_models", side_effect=slow_fetch), \
+             patch.object(Console, "input", side_effect=inputs), \
+             patch.object(Console, "print"), \
+             patch.object(Console, "rule"):
+            start = time.monotonic()
+            with pytest.raises(SystemExit):
+                InteractiveSession().run()
+            elapsed = time.monotonic() - start
+        try:
+            assert elapsed < 1
+            assert fetch_threads and fetch_threads[0].daemon  # never joined at exit
+        finally:
+            release.set()
+
+
 
 class TestOfflineFallback:
     @patch("scout.interactive.check_ollama_installed", return_value=(True, "ollama version 0.5.0"))
     @patch("scout.interactive.get_pulled_models", return_value=[])
     @patch("scout.interactive.get_fallback_models")
-    @patch("scout.interactive.detect_hardware")
+    @patch("scout.interactive.cached_detect_hardware")
     def test_uses_fallback_when_user_says_no(
         self, mock_hw, mock_fallback, mock_pulled, mock_ollama,
     ):
@@ -164,6 +198,7 @@ class TestOfflineFallback:
             session.run()
 
         mock_fallback.assert_called_once()
+        mock_pulled.assert_called_once()
 
 
 # ---------------------------------------------------------------------------
@@ -174,7 +209,7 @@ class TestStepWelcome:
     @patch("scout.interactive.check_ollama_installed", return_value=(True, "ollama version 0.5.0"))
     @patch("scout.interactive.get_pulled_models", return_value=[])
     @patch("scout.interactive.get_fallback_models")
-    @patch("scout.interactive.detect_hardware")
+    @patch("scout.interactive.cached_detect_hardware")
     def test_welcome_with_ollama_installed(self, mock_hw, mock_fallback, mock_pulled, mock_ollama):
         mock_hw.return_value = _make_hw()
         mock_fallback.return_value = [
@@ -195,7 +230,7 @@ class TestStepWelcome:
     @patch("scout.interactive.check_ollama_installed", return_value=(False, ""))
     @patch("scout.interactive.get_pulled_models", return_value=[])
     @patch("scout.interactive.get_fallback_models")
-    @patch("scout.interactive.detect_hardware")
+    @patch("scout.interactive.cached_detect_hardware")
     def test_welcome_without_ollama_skips_pull(
         self, mock_hw, mock_fallback, mock_pulled, mock_ollama,
     ):
@@ -219,7 +254,7 @@ class TestHardwareScanContextMessages:
     def test_gpu_found_message(self):
         hw = _make_hw(vram_gb=10.0)
         # Just test that detect_hardware returns gpu context
-        with patch("scout.interactive.detect_hardware", return_value=hw), \
+        with patch("scout.interactive.cached_detect_hardware", return_value=hw), \
              patch.object(Console, "print"), \
              patch.object(Console, "rule"):
             result = InteractiveSession().__class__._step_hardware_scan(
@@ -230,7 +265,7 @@ class TestHardwareScanContextMessages:
     def test_no_gpu_message_branches(self):
         """Directly test _step_hardware_scan with no-GPU hardware."""
         hw_no_gpu = _make_hw(vram_gb=0)
-        with patch("scout.interactive.detect_hardware", return_value=hw_no_gpu), \
+        with patch("scout.interactive.cached_detect_hardware", return_value=hw_no_gpu), \
              patch.object(Console, "print"), \
              patch.object(Console, "rule"):
             result = InteractiveSession()._step_hardware_scan()
@@ -244,12 +279,82 @@ class TestHardwareScanContextMessages:
             gpus=[GPUInfo(name="Apple M2 (Unified Memory)", vram_mb=16384)],
             is_unified_memory=True,
         )
-        with patch("scout.interactive.detect_hardware", return_value=hw_apple), \
+        with patch("scout.interactive.cached_detect_hardware", return_value=hw_apple), \
              patch.object(Console, "print"), \
              patch.object(Console, "rule"):
             result = InteractiveSession()._step_hardware_scan()
         assert result.is_unified_memory is True
 
+    def test_uses_hardware_cache_settings(self):
+        hw = _make_hw()
+        with patch("scout.interactive.cached_detect_hardware", return_value=hw) as mock_detect, \
+             patch.object(Console, "print"), \
+             patch.object(Console, "rule"):
+            InteractiveSession(refresh_hw=True, hw_cache_ttl_hours=6)._step_hardware_scan()
+        mock_detect.assert_called_once_with(force=True, max_age_hours=6)
+
+
+class TestStepFetchModels:
+    @patch("scout.interactive.fetch_ollama_models", return_value=[])
+    def test_uses_models_cache_ttl(self, mock_fetch):
+        with patch.object(Console, "input", side_effect=["y"]), \
+             patch.object(Console, "print"), \
+             ThreadPoolExecutor(max_workers=1) as pool:
+            future = InteractiveSession(models_cache_ttl_hours=6)._step_fetch_models(pool)
+            assert future.result() == []
+        mock_fetch.assert_called_once_with(limit=100, max_age_hours=6)
+
+    @patch("scout.interactive.load_cached_models", return_value=None)
+    @patch("scout.interactive.fetch_ollama_models")
+    def test_offline_skips_prompt_and_fetch(self, mock_fetch, mock_cached):
+        pool = MagicMock()
+        with patch.object(Console, "input") as mock_input, \
+             patch.object(Console, "print"):
+            future = InteractiveSession(offline=True)._step_fetch_models(pool)
+        mock_input.assert_not_called()
+        pool.submit.assert_not_called()
+        assert future.result()
+
+    @patch("scout.interactive.fetch_ollama_models")
+    def test_offline_prefers_cached_model_list(self, mock_fetch):
+        cached = [_make_rec().model]
+        pool = MagicMock()
+        with patch("scout.interactive.load_cached_models", return_value=cached) as mock_load, \
+             patch.object(Console, "input") as mock_input, \
+             patch.object(Console, "print"):
+            future = InteractiveSession(offline=True)._step_fetch_models(pool)
+        assert future.result() is cached
+        mock_load.assert_called_once_with(limit=100)
+        mock_input.assert_not_called()
+        mock_fetch.assert_not_called()
+
+    def test_collect_falls_back_when_fetch_failed(self):
+        from concurrent.futures import Future
+        future = Future()
+        future.set_exception(ConnectionError("offline"))
+        with patch.object(Console, "print"):
+            models = InteractiveSession._collect_models(future)
+        assert models == get_fallback_models()
+
+    def test_fetch_overlaps_later_prompts(self):
+        """The fetch is still running while the use-case prompt is answered."""
+        import threading
+        release = threading.Event()
+
+        def slow_fetch(**kwargs):
+            assert release.wait(5)
+            return get_fallback_models()
+
+        with patch("scout.interactive.fetch_ollama_models", side_effect=slow_fetch), \
+             patch.object(Console, "input", side_effect=["y"]), \
+             patch.object(Console, "print"), \
+             ThreadPoolExecutor(max_workers=1) as pool:
+            session = InteractiveSession()
+            future = session._step_fetch_models(pool)
+            assert not future.done()  # returned before the download finished
+            release.set()
+            assert session._collect_models(future) == get_fallback_models()
+
 
 class TestStepCompare:
     def test_compare_skipped_on_no(self):
@@ -274,6 +379,23 @@ class TestStepCompare:
             InteractiveSession._step_compare([model1, model2], hw, [])
         mock_compare.assert_called_once()
 
+    @patch("scout.interactive.print_model_comparison")
+    def test_compare_matches_names_case_insensitively(self, mock_compare):
+        variant = ModelVariant(tag="7b", size_gb=4.0, quantization="Q4_K_M", param_size="7B")
+        model1 = OllamaModel(
+            name="llama3.2", description="Test", tags=[variant], use_cases=["chat"],
+        )
+        model2 = OllamaModel(
+            name="mistral", description="Test", tags=[variant], use_cases=["chat"],
+        )
+        inputs = ["y", "LLAMA3.2", "Mis"]
+        with patch.object(Console, "input", side_effect=inputs), \
+             patch.object(Console, "print"):
+            InteractiveSession._step_compare([model1, model2], _make_hw(), [])
+        d1, d2 = mock_compare.call_args[0]
+        assert d1["name"] == "llama3.2"
+        assert d2["name"] == "mistral"
+
     def test_compare_handles_missing_model(self):
         hw = _make_hw()
         inputs = ["y", "nonexistent", "alsonotfound"]
@@ -307,7 +429,7 @@ class TestStepBenchmark:
         assert mock_print.called
 
     @patch("scout.interactive.print_benchmark")
-    @patch("scout.interactive.benchmark_pulled_models")
+    @patch("scout.benchmark.benchmark_pulled_models")
     def test_benchmark_runs_with_pulled_models(self, mock_bench, mock_print):
         from scout.benchmark import BenchmarkEstimate
         mock_bench.return_value = [
@@ -321,7 +443,7 @@ class TestStepBenchmark:
             InteractiveSession._step_benchmark(recs, hw, ["llama3.2"])
         mock_print.assert_called_once()
 
-    @patch("scout.interactive.benchmark_pulled_models", return_value=[])
+    @patch("scout.benchmark.benchmark_pulled_models", return_value=[])
     def test_benchmark_handles_empty_results(self, mock_bench):
         hw = _make_hw()
         recs = [_make_rec()]
@@ -361,7 +483,7 @@ class TestStepExport:
 
 
 class TestStepPull:
-    @patch("scout.interactive.pull_model")
+    @patch("scout.interactive._pull_with_progress")
     def test_pull_success_returns_model_name(self, mock_pull):
         rec = _make_rec()
         with patch.object(Console, "input", side_effect=["1"]), \
@@ -384,7 +506,17 @@ class TestStepPull:
             result = InteractiveSession._step_pull([rec])
         assert result is None
 
-    @patch("scout.interactive.pull_model", side_effect=FileNotFoundError("not found"))
+    def test_menu_printed_in_one_call(self):
+        rec = _make_rec()
+        with patch.object(Console, "input", side_effect=["0"]), \
+             patch.object(Console, "print") as mock_print:
+            InteractiveSession._step_pull([rec])
+        mock_print.assert_called_once()
+        menu = mock_print.call_args[0][0]
+        assert "1.[/dim] [white]test-model:7b" in menu
+        assert menu.rstrip().endswith("Skip")
+
+    @patch("scout.interactive._pull_with_progress", side_effect=FileNotFoundError("not found"))
     def test_pull_handles_file_not_found(self, mock_pull):
         rec = _make_rec()
         with patch.object(Console, "input", side_effect=["1"]), \
@@ -392,10 +524,30 @@ class TestStepPull:
             result = InteractiveSession._step_pull([rec])
         assert result is None
 
-    @patch("scout.interactive.pull_model", side_effect=Exception("pull failed"))
+    @patch("scout.interactive._pull_with_progress", side_effect=Exception("pull failed"))
     def test_pull_handles_generic_error(self, mock_pull):
         rec = _make_rec()
         with patch.object(Console, "input", side_effect=["1"]), \
              patch.object(Console, "print"):
             result = InteractiveSession._step_pull([rec])
         assert result is None
+
+
+class TestPullWithProgress:
+    @patch("scout.interactive.pull_model")
+    @patch("scout.interactive.pull_model_stream")
+    def test_streams_from_server(self, mock_stream, mock_cli):
+        from scout.ollama_api import PullProgress
+        mock_stream.return_value = iter([
+            PullProgress("pulling 6a07", completed=50, total=100),
+            PullProgress("success"),
+        ])
+        _pull_with_progress("llama3.2:3b")
+        mock_stream.assert_called_once_with("llama3.2:3b")
+        mock_cli.assert_not_called()
+
+    @patch("scout.interactive.pull_model")
+    @patch("scout.interactive.pull_model_stream", side_effect=ConnectionError("refused"))
+    def test_falls_back_to_cli_when_server_down(self, mock_stream, mock_cli):
+        _pull_with_progress("llama3.2:3b")
+        mock_cli.assert_called_once_with("llama3.2:3b")
@@ -1,21 +1,35 @@
 """Tests for scout.ollama_api module."""
+import json
+import os
 import subprocess
+import tempfile
+from datetime import datetime, timedelta, timezone
 from unittest.mock import MagicMock, patch
 
+import pytest
+import requests
+
 from scout.ollama_api import (
+    OLLAMA_API_URL,
     ModelVariant,
     OllamaModel,
     _generate_description,
     _group_models,
     _infer_use_cases,
+    _load_cache,
     _parse_param_size,
     _parse_param_size_from_name_and_tag,
     _parse_quantization,
+    _save_cache,
+    _session,
     check_ollama_installed,
     fetch_ollama_models,
     get_fallback_models,
     get_pulled_models,
     is_cache_stale,
+    load_cached_models,
+    pull_model,
+    pull_model_stream,
 )
 
 
@@ -42,6 +56,17 @@ class TestInferUseCases:
         assert "reasoning" in cases
         assert "chat" in cases
 
+    def test_matches_substring_scan(self):
+        from scout.ollama_api import USE_CASE_MAP
+        names = [p for patterns in USE_CASE_MAP.values() for p in patterns]
+        names += ["Qwen2.5-Coder", "my-llama3.1-finetune", "nomic-embed-text", "c++coder"]
+        for name in names:
+            expected = [
+                uc for uc, patterns in USE_CASE_MAP.items()
+                if any(p in name.lower() for p in patterns)
+            ] or ["chat"]
+            assert _infer_use_cases(name) == expected, name
+
 
 class TestParseParamSize:
     def test_parses_7b(self):
@@ -75,6 +100,12 @@ class TestParseQuantization:
     def test_detects_q4_k_m(self):
         assert _parse_quantization("7b-q4_k_m") == "Q4_K_M"
 
+    def test_detects_uppercase_tag(self):
+        assert _parse_quantization("7B-Q5_K_M") == "Q5_K_M"
+
+    def test_detects_fp16(self):
+        assert _parse_quantization("7b-instruct-fp16") == "FP16"
+
     def test_instruct_defaults_to_q4_k_m(self):
         assert _parse_quantization("7b-instruct") == "Q4_K_M"
 
@@ -87,6 +118,10 @@ class TestGenerateDescription:
         desc = _generate_description("llama3.2", ["chat"])
         assert "Llama 3.2" in desc
 
+    def test_prefix_prefers_longest_family(self):
+        assert "Llama 3.2" in _generate_description("llama3.2-vision", [])
+        assert "largest" in _generate_description("mistral-large2", [])
+
     def test_unknown_model_uses_use_case(self):
         desc = _generate_description("my-custom-model", ["coding"])
         assert "code" in desc.lower()
@@ -160,11 +195,25 @@ class TestGetFallbackModels:
         for m in models:
             assert len(m.use_cases) >= 1
 
+    def test_calls_do_not_share_model_objects(self):
+        first = get_fallback_models()
+        first[0].pulled = True
+        first[0].tags.clear()
+        second = get_fallback_models()
+        assert second[0].pulled is False
+        assert second[0].tags
+
 
 class TestFetchOllamaModels:
+    def test_session_retries_transient_server_errors_once(self):
+        retry = _session().get_adapter(OLLAMA_API_URL).max_retries
+        assert retry.total == 1
+        assert 503 in retry.status_forcelist
+        assert retry.raise_on_status is False
+
     @patch("scout.ollama_api._save_cache")
     @patch("scout.ollama_api._load_cache", return_value=None)
-    @patch("scout.ollama_api.requests.get")
+    @patch("requests.Session.get")
     def test_parses_api_response(self, mock_get, mock_cache, mock_save):
         mock_response = MagicMock()
         mock_response.json.return_value = {
@@ -195,9 +244,23 @@ class TestFetchOllamaModels:
         assert models[1].tags[0].param_size == "7B"
         mock_save.assert_called_once()
 
+    @patch("scout.ollama_api._infer_use_cases", wraps=_infer_use_cases)
+    @patch("scout.ollama_api._load_cache")
+    def test_limit_keeps_all_variants_of_kept_models(self, mock_cache, mock_infer):
+        mock_cache.return_value = [
+            {"name": "llama3.2:3b"},
+            {"name": "mistral:7b"},
+            {"name": "qwen3:8b"},
+            {"name": "llama3.2:1b"},
+        ]
+        models = fetch_ollama_models(limit=2)
+        assert [m.name for m in models] == ["llama3.2", "mistral"]
+        assert [v.tag for v in models[0].tags] == ["3b", "1b"]
+        assert "qwen3" not in [c.args[0] for c in mock_infer.call_args_list]
+
     @patch("scout.ollama_api._save_cache")
     @patch("scout.ollama_api._load_cache", return_value=None)
-    @patch("scout.ollama_api.requests.get")
+    @patch("requests.Session.get")
     def test_fills_gaps_when_details_empty(self, mock_get, mock_cache, mock_save):
         mock_response = MagicMock()
         mock_response.json.return_value = {
@@ -216,7 +279,7 @@ class TestFetchOllamaModels:
 
     @patch("scout.ollama_api._save_cache")
     @patch("scout.ollama_api._load_cache", return_value=None)
-    @patch("scout.ollama_api.requests.get")
+    @patch("requests.Session.get")
     def test_raises_on_empty_response(self, mock_get, mock_cache, mock_save):
         mock_response = MagicMock()
         mock_response.json.return_value = {"models": []}
@@ -230,7 +293,7 @@ class TestFetchOllamaModels:
             pass
 
     @patch("scout.ollama_api._save_cache")
-    @patch("scout.ollama_api.requests.get")
+    @patch("requests.Session.get")
     def test_uses_fresh_cache_without_api_call(self, mock_get, mock_save):
         cached = [
             {"name": "llama3.2:3b", "size": 2147483648, "details": {}},
@@ -241,10 +304,72 @@ class TestFetchOllamaModels:
         assert len(models) == 1
         assert models[0].name == "llama3.2"
 
+    @patch("scout.ollama_api._save_cache")
+    @patch("requests.Session.get", side_effect=requests.ConnectionError("offline"))
+    def test_network_error_uses_expired_cache(self, mock_get, mock_save):
+        cached = [{"name": "llama3.2:3b", "size": 2147483648, "details": {}}]
+
+        def load(max_age_hours=24):
+            return cached if max_age_hours == float("inf") else None
+
+        with patch("scout.ollama_api._load_cache", side_effect=load):
+            models = fetch_ollama_models()
+        assert [m.name for m in models] == ["llama3.2"]
+
+    @patch("scout.ollama_api._save_cache")
+    @patch("requests.Session.get", side_effect=requests.ConnectionError("offline"))
+    def test_forced_refresh_does_not_fall_back_to_stale_cache(self, mock_get, mock_save):
+        cached = [{"name": "llama3.2:3b", "size": 2147483648, "details": {}}]
+
+        def load(max_age_hours=24):
+            return cached if max_age_hours == float("inf") else None
+
+        with patch("scout.ollama_api._load_cache", side_effect=load):
+            with pytest.raises(ConnectionError, match="Failed to fetch"):
+                fetch_ollama_models(force_refresh=True)
+        mock_save.assert_not_called()
+
+    @patch("requests.Session.get")
+    def test_load_cached_models_ignores_age_and_network(self, mock_get):
+        cached = [{"name": "llama3.2:3b", "size": 2147483648, "details": {}}]
+        with patch("scout.ollama_api._load_cache", return_value=cached) as mock_load:
+            models = load_cached_models()
+        assert [m.name for m in models] == ["llama3.2"]
+        mock_load.assert_called_once_with(max_age_hours=float("inf"))
+        mock_get.assert_not_called()
+
+    @patch("scout.ollama_api._load_cache", return_value=None)
+    def test_load_cached_models_without_cache(self, mock_load):
+        assert load_cached_models() is None
+
+    @patch("scout.ollama_api._load_cache", return_value=None)
+    @patch("requests.Session.get", side_effect=requests.ConnectionError("offline"))
+    def test_network_error_without_cache_raises(self, mock_get, mock_cache):
+        with pytest.raises(ConnectionError, match="--offline"):
+            fetch_ollama_models()
+
     @patch("scout.ollama_api._load_cache", return_value=None)
     def test_stale_cache_reports_stale(self, mock_cache):
         assert is_cache_stale() is True
 
+    def test_max_age_hours_controls_freshness(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "models_cache.json")
+            fetched_at = datetime.now(timezone.utc) - timedelta(hours=2)
+            with open(path, "w") as f:
+                json.dump({"fetched_at": fetched_at.isoformat(), "models": [{"name": "x"}]}, f)
+            with patch("scout.ollama_api._get_cache_path", return_value=path):
+                assert is_cache_stale(max_age_hours=24) is False
+                assert is_cache_stale(max_age_hours=1) is True
+
+    def test_save_cache_roundtrip_leaves_no_temp_file(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "ollama-scout", "models_cache.json")
+            with patch("scout.ollama_api._get_cache_path", return_value=path):
+                _save_cache([{"name": "llama3.2:3b"}])
+                assert _load_cache() == [{"name": "llama3.2:3b"}]
+            assert os.listdir(os.path.dirname(path)) == ["models_cache.json"]
+
 
 class TestCheckOllamaInstalled:
     @patch("scout.ollama_api.shutil.which", return_value=None)
@@ -280,6 +405,22 @@ class TestCheckOllamaInstalled:
 
 
 class TestGetPulledModels:
+    def setup_method(self):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.cache_path = os.path.join(self._tmpdir.name, "pulled_cache.json")
+        self._path = patch("scout.ollama_api._get_pulled_cache_path", return_value=self.cache_path)
+        self._path.start()
+        # No Ollama server unless a test says otherwise
+        self._server = patch(
+            "requests.get", side_effect=requests.ConnectionError("refused")
+        )
+        self.mock_get = self._server.start()
+
+    def teardown_method(self):
+        self._server.stop()
+        self._path.stop()
+        self._tmpdir.cleanup()
+
     @patch("scout.ollama_api.shutil.which", return_value=None)
     def test_returns_empty_when_ollama_not_installed(self, mock_which):
         assert get_pulled_models() == []
@@ -296,3 +437,108 @@ class TestGetPulledModels:
         pulled = get_pulled_models()
         assert "llama3.2" in pulled
         assert "mistral" in pulled
+
+    @patch("scout.ollama_api.subprocess.run")
+    @patch("scout.ollama_api.shutil.which", return_value="/usr/bin/ollama")
+    def test_prefers_running_server(self, mock_which, mock_run):
+        self.mock_get.side_effect = None
+        self.mock_get.return_value.json.return_value = {
+            "models": [{"name": "llama3.2:3b"}, {"name": "mistral:7b"}],
+        }
+        assert get_pulled_models() == ["llama3.2", "mistral"]
+        assert self.mock_get.call_args.kwargs["timeout"] == 2
+        mock_run.assert_not_called()
+
+    @patch("scout.ollama_api.shutil.which", return_value="/usr/bin/ollama")
+    def test_dedupes_tags_keeping_listing_order(self, mock_which):
+        self.mock_get.side_effect = None
+        self.mock_get.return_value.json.return_value = {
+            "models": [{"name": "qwen3:8b"}, {"name": "llama3.2:3b"}, {"name": "qwen3:4b"}],
+        }
+        assert get_pulled_models() == ["qwen3", "llama3.2"]
+
+    @patch("scout.ollama_api.subprocess.run")
+    @patch("scout.ollama_api.shutil.which", return_value="/usr/bin/ollama")
+    def test_malformed_server_reply_falls_back_to_ollama_list(self, mock_which, mock_run):
+        self.mock_get.side_effect = None
+        self.mock_get.return_value.json.side_effect = ValueError("not json")
+        mock_run.return_value = MagicMock(stdout="NAME\nqwen3:8b  x  5 GB  now\n", returncode=0)
+        assert get_pulled_models() == ["qwen3"]
+
+    @patch("scout.ollama_api.subprocess.run")
+    @patch("scout.ollama_api.shutil.which", return_value="/usr/bin/ollama")
+    def test_reuses_recent_result_without_subprocess(self, mock_which, mock_run):
+        mock_run.return_value = MagicMock(stdout="NAME\nqwen3:8b  x  5 GB  now\n", returncode=0)
+        assert get_pulled_models() == ["qwen3"]
+        assert get_pulled_models() == ["qwen3"]
+        mock_run.assert_called_once()
+
+    @patch("scout.ollama_api.subprocess.run")
+    @patch("scout.ollama_api.shutil.which", return_value="/usr/bin/ollama")
+    def test_expired_cache_reruns_ollama_list(self, mock_which, mock_run):
+        with open(self.cache_path, "w") as f:
+            json.dump(["old-model"], f)
+        old = datetime.now(timezone.utc).timestamp() - 120
+        os.utime(self.cache_path, (old, old))
+        mock_run.return_value = MagicMock(stdout="NAME\nqwen3:8b  x  5 GB  now\n", returncode=0)
+        assert get_pulled_models() == ["qwen3"]
+
+    @patch("scout.ollama_api.subprocess.run")
+    @patch("scout.ollama_api.shutil.which", return_value="/usr/bin/ollama")
+    def test_failed_listing_is_not_cached(self, mock_which, mock_run):
+        mock_run.return_value = MagicMock(stdout="", returncode=1)
+        assert get_pulled_models() == []
+        assert not os.path.exists(self.cache_path)
+
+    @patch("scout.ollama_api.subprocess.run")
+    @patch("scout.ollama_api.shutil.which", return_value="/usr/bin/ollama")
+    def test_pull_invalidates_cache(self, mock_which, mock_run):
+        mock_run.return_value = MagicMock(stdout="NAME\n", returncode=0)
+        get_pulled_models()
+        assert os.path.exists(self.cache_path)
+        pull_model("qwen3:8b")
+        assert not os.path.exists(self.cache_path)
+
+
+def _stream_response(events):
+    response = MagicMock()
+    response.__enter__.return_value = response
+    response.iter_lines.return_value = [json.dumps(e).encode() for e in events]
+    return response
+
+
+class TestPullModelStream:
+    def setup_method(self):
+        self._invalidate = patch("scout.ollama_api._invalidate_pulled_cache")
+        self.mock_invalidate = self._invalidate.start()
+
+    def teardown_method(self):
+        self._invalidate.stop()
+
+    @patch("requests.post")
+    def test_yields_progress_events(self, mock_post):
+        mock_post.return_value = _stream_response([
+            {"status": "pulling manifest"},
+            {"status": "pulling 6a0746a1ec1a", "digest": "sha256:6a07", "total": 100,
+             "completed": 40},
+            {"status": "success"},
+        ])
+        events = list(pull_model_stream("llama3.2:3b"))
+        assert [(e.status, e.completed, e.total) for e in events] == [
+            ("pulling manifest", 0, None),
+            ("pulling 6a0746a1ec1a", 40, 100),
+            ("success", 0, None),
+        ]
+        self.mock_invalidate.assert_called_once()
+        assert mock_post.call_args.kwargs["json"] == {"model": "llama3.2:3b", "stream": True}
+
+    @patch("requests.post")
+    def test_error_event_raises(self, mock_post):
+        mock_post.return_value = _stream_response([{"error": "pull model manifest: not found"}])
+        with pytest.raises(RuntimeError, match="not found"):
+            list(pull_model_stream("nope:1b"))
+
+    @patch("requests.post", side_effect=requests.ConnectionError("refused"))
+    def test_unreachable_server_raises_connection_error(self, mock_post):
+        with pytest.raises(ConnectionError):
+            list(pull_model_stream("llama3.2:3b"))
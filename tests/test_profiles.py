@@ -5,12 +5,15 @@ from unittest.mock import patch
 
 from scout.config import (
     DEFAULT_CONFIG,
+    _load_profiles,
     create_profile,
     delete_profile,
     get_active_profile,
+    get_all_profiles,
     get_profile_overrides,
     list_profiles,
     load_config,
+    set_config_value,
     set_profile_value,
     switch_profile,
 )
@@ -172,6 +175,28 @@ class TestSetProfileValue:
             with p1, p2, p3:
                 assert set_profile_value("ghost", "default_top_n", 5) is False
 
+    def test_unchanged_value_is_not_rewritten(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            p1, p2, p3 = _patch_paths(tmpdir)
+            with p1, p2, p3:
+                create_profile("tweaked", {"default_top_n": 20})
+                with patch("scout.config._save_profiles") as mock_save:
+                    assert set_profile_value("tweaked", "default_top_n", 20) is True
+                    assert switch_profile("default") is True
+                mock_save.assert_not_called()
+
+
+class TestGetAllProfiles:
+    def test_returns_active_and_overrides(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            p1, p2, p3 = _patch_paths(tmpdir)
+            with p1, p2, p3:
+                create_profile("fast", {"default_top_n": 5})
+                switch_profile("fast")
+                active, overrides = get_all_profiles()
+                assert active == "fast"
+                assert overrides == {"default": {}, "fast": {"default_top_n": 5}}
+
 
 class TestLoadConfigWithProfile:
     def test_profile_overrides_base_config(self):
@@ -218,3 +243,34 @@ class TestLoadConfigWithProfile:
             with p1, p2, p3:
                 cfg = load_config(profile="nonexistent")
                 assert cfg == DEFAULT_CONFIG
+
+    def test_reads_profiles_file_once(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            p1, p2, p3 = _patch_paths(tmpdir)
+            with p1, p2, p3:
+                create_profile("fast", {"default_top_n": 5})
+                switch_profile("fast")
+                with patch("scout.config._load_profiles", wraps=_load_profiles) as spy:
+                    cfg = load_config()
+                assert spy.call_count == 1
+                assert cfg["default_top_n"] == 5
+
+
+class TestSetConfigValue:
+    def test_does_not_bake_in_profile_overrides(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            p1, p2, p3 = _patch_paths(tmpdir)
+            with p1, p2, p3:
+                create_profile("fast", {"default_top_n": 5})
+                switch_profile("fast")
+                assert set_config_value("auto_export", True) is True
+                switch_profile("default")
+                cfg = load_config()
+                assert cfg["auto_export"] is True
+                assert cfg["default_top_n"] == DEFAULT_CONFIG["default_top_n"]
+
+    def test_rejects_unknown_key(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            p1, p2, p3 = _patch_paths(tmpdir)
+            with p1, p2, p3:
+                assert set_config_value("bogus", 1) is False
@@ -1,7 +1,15 @@
 """Tests for scout.recommender module."""
 from scout.hardware import GPUInfo, HardwareProfile
 from scout.ollama_api import ModelVariant, OllamaModel
-from scout.recommender import _score_variant, get_recommendations, group_by_use_case
+from scout.recommender import (
+    _score_variant,
+    best_variant,
+    find_model,
+    get_recommendations,
+    group_by_use_case,
+    index_models,
+    score_variants,
+)
 
 
 def _make_hw(vram_gb=10.0, ram_gb=32.0, unified=False):
@@ -87,6 +95,20 @@ class TestScoreVariant:
         assert "consider a smaller model" in note
 
 
+class TestScoreVariants:
+    def test_matches_single_variant_scoring(self):
+        hw = _make_hw(vram_gb=8.0, ram_gb=32.0)
+        variants = [
+            ModelVariant(tag="3b", size_gb=2.0, quantization="Q4_K_M", param_size="3B"),
+            ModelVariant(tag="14b", size_gb=12.0, quantization="Q4_K_M", param_size="14B"),
+            ModelVariant(tag="70b", size_gb=40.0, quantization="Q4_K_M", param_size="70B"),
+        ]
+        assert score_variants(variants, hw) == [_score_variant(v, hw) for v in variants]
+
+    def test_empty_batch(self):
+        assert score_variants([], _make_hw()) == []
+
+
 class TestMultiGPU:
     def test_multi_gpu_fits_across_two_gpus(self):
         hw = HardwareProfile(
@@ -126,6 +148,37 @@ class TestMultiGPU:
         assert mode == "GPU"
 
 
+class TestSharedMemoryGPU:
+    def _apu_hw(self, dedicated_vram_mb=0):
+        gpus = [GPUInfo(name="AMD GPU (shared memory)", vram_mb=16 * 1024, shared_memory=True)]
+        if dedicated_vram_mb:
+            gpus.append(GPUInfo(name="Discrete GPU", vram_mb=dedicated_vram_mb))
+        return HardwareProfile(
+            os="Linux", cpu_name="Test", cpu_cores=8,
+            cpu_threads=16, ram_gb=32.0, gpus=gpus,
+        )
+
+    def test_apu_memory_not_added_to_ram(self):
+        # 32GB RAM + 16GB GTT would "fit" this if the GTT were counted as VRAM
+        variant = ModelVariant(tag="70b", size_gb=44.0, quantization="Q4_0", param_size="70B")
+        score, fit, mode, _ = _score_variant(variant, self._apu_hw())
+        assert (score, fit, mode) == (-1, "Too Large", "N/A")
+
+    def test_apu_scored_from_shared_pool(self):
+        variant = ModelVariant(tag="8b", size_gb=5.0, quantization="Q4_0", param_size="8B")
+        _, fit, mode, note = _score_variant(variant, self._apu_hw())
+        assert (fit, mode) == ("Excellent", "GPU")
+        assert "unified memory" in note
+
+    def test_discrete_gpu_ignores_apu_memory(self):
+        hw = self._apu_hw(dedicated_vram_mb=8 * 1024)
+        assert hw.best_vram_gb == 8.0
+        assert not hw.multi_gpu
+        variant = ModelVariant(tag="13b", size_gb=12.0, quantization="Q4_0", param_size="13B")
+        _, fit, mode, _ = _score_variant(variant, hw)
+        assert (fit, mode) == ("Good", "CPU+GPU")
+
+
 class TestGetRecommendations:
     def test_excludes_too_large_models(self):
         hw = _make_hw(vram_gb=10.0, ram_gb=32.0)
@@ -192,3 +245,43 @@ class TestGroupByUseCase:
         grouped = group_by_use_case(recs)
         # All 7 models should appear — no cap of 5
         assert len(grouped["chat"]) == 7
+
+
+class TestBestVariant:
+    def test_picks_highest_score(self):
+        hw = _make_hw(vram_gb=10.0, ram_gb=32.0)
+        variants = [
+            ModelVariant(tag="70b", size_gb=40.0, quantization="Q4_K_M", param_size="70B"),
+            ModelVariant(tag="8b", size_gb=5.0, quantization="Q4_K_M", param_size="8B"),
+        ]
+        score, variant, fit, mode = best_variant(variants, hw)
+        assert variant.tag == "8b"
+        assert (fit, mode) == ("Excellent", "GPU")
+        assert score == max(sc for sc, *_ in score_variants(variants, hw))
+
+    def test_no_variants(self):
+        assert best_variant([], _make_hw()) == (-1, None, None, None)
+
+    def test_all_variants_too_large(self):
+        hw = _make_hw(vram_gb=4.0, ram_gb=8.0)
+        variants = [
+            ModelVariant(tag="70b", size_gb=40.0, quantization="Q4_0", param_size="70B"),
+            ModelVariant(tag="405b", size_gb=230.0, quantization="Q4_0", param_size="405B"),
+        ]
+        assert best_variant(variants, hw) == (-1, None, None, None)
+
+
+class TestFindModel:
+    def setup_method(self):
+        models = [_make_model(n, "7B", 4.0) for n in ("llama3.2", "Llama3", "mistral")]
+        self.index, self.names = index_models(models)
+
+    def test_exact_match_is_case_insensitive(self):
+        assert find_model(self.index, self.names, "LLAMA3").name == "Llama3"
+
+    def test_prefix_match_takes_alphabetically_first(self):
+        assert find_model(self.index, self.names, "lla").name == "Llama3"
+        assert find_model(self.index, self.names, "mis").name == "mistral"
+
+    def test_no_match(self):
+        assert find_model(self.index, self.names, "qwen") is None